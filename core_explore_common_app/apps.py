@@ -13,6 +13,13 @@ class CoreExploreCommonAppConfig(AppConfig):
 
     def ready(self):
         """Run once at startup"""
+        from core_explore_common_app.utils.query import (
+            count_cache,
+            plan_cache,
+        )
+
+        plan_cache.init_signals()
+        count_cache.init_signals()
         if "migrate" not in sys.argv:
             from core_explore_common_app import discover
 
@@ -18,3 +18,21 @@ class ExploreRequestError(Exception):
 
     def __init__(self, message):
         self.message = message
+
+
+class DataSourceUnavailableError(ExploreRequestError):
+    """
+    Exception raised when a data source is known to be unavailable
+    """
+
+
+class DeadlineExceededError(ExploreRequestError):
+    """
+    Exception raised when a data source does not answer before the deadline
+    """
+
+
+class DataSourceBusyError(ExploreRequestError):
+    """
+    Exception raised when too many queries are already sent to a data source
+    """
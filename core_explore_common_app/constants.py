@@ -5,3 +5,4 @@ from django.conf import settings
 
 LOCAL_QUERY_NAME = settings.CUSTOM_NAME
 LOCAL_QUERY_URL = "core_explore_common_local_query"
+COUNT_ONLY_OPTION = "count_only"
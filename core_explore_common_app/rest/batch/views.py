@@ -0,0 +1,140 @@
+""" REST views for the batch query API
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from core_explore_common_app import settings
+from core_explore_common_app.rest.query import views as query_views
+from core_explore_common_app.rest.result.serializers import ResultSerializer
+from core_explore_common_app.utils.protocols.compression import (
+    compress_response,
+)
+from core_main_app.commons.exceptions import ApiError
+
+
+def _execute_batch_item(item, request):
+    """Execute a query of a batch and returns its result page
+
+    Args:
+        item: query id, query and page
+        request:
+
+    Returns:
+
+    """
+    try:
+        page = int(item.get("page", 1))
+        # the templates are given with the ids of the sending instance
+        query_data = query_views.resolve_template_hashes(
+            item["query"], request
+        )
+        if query_data is None:
+            # none of the templates of the query are on this instance
+            return {
+                "id": item["id"],
+                "status": status.HTTP_200_OK,
+                "count": 0,
+                "next": None,
+                "previous": None,
+                "results": [],
+            }
+        if query_views.is_count_only_query(query_data):
+            return {
+                "id": item["id"],
+                "status": status.HTTP_200_OK,
+                "count": query_views.execute_local_query(
+                    query_data, page, request, count_only=True
+                ),
+                "next": None,
+                "previous": None,
+                "results": [],
+            }
+
+        results = query_views.execute_local_query(
+            query_data, page, request, cursor=item.get("cursor")
+        )
+        data_list = query_views.format_federated_results(results, request)
+        return {
+            "id": item["id"],
+            "status": status.HTTP_200_OK,
+            "count": results.paginator.count,
+            "next": results.next_page_number() if results.has_next() else None,
+            "previous": results.previous_page_number()
+            if results.has_previous()
+            else None,
+            "next_cursor": getattr(results, "next_cursor", None),
+            "results": ResultSerializer(data_list, many=True).data,
+        }
+    except (ApiError, KeyError, TypeError, ValueError) as exception:
+        return {
+            "id": item.get("id"),
+            "status": status.HTTP_400_BAD_REQUEST,
+            "message": str(exception),
+        }
+    except Exception as exception:
+        return {
+            "id": item.get("id"),
+            "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "message": str(exception),
+        }
+
+
+@compress_response
+@api_view(["POST"])
+def execute_batch_query(request):
+    """Execute several queries on local data in a single request
+
+    Parameters:
+
+        {
+            "queries": [
+                {"id": "1", "query": {...}, "page": 1},
+                {"id": "2", "query": {...}, "page": 2, "cursor": "..."},
+                ...
+            ]
+        }
+
+    Each query has the format of the queries sent to the query endpoint,
+    with its order_by_field, and can give the next_cursor of its previous
+    page. The templates of the queries are matched by hash with the
+    templates of this instance. Each query has its own status in the
+    response, a failing query does not fail the batch.
+
+    Args:
+
+        request: HTTP request
+
+    Returns:
+
+        - code: 200
+          content: {"responses": [{"id", "status", "count", "next",
+            "previous", "next_cursor", "results"}, ...]}
+        - code: 400
+          content: Validation error
+        - code: 500
+          content: Internal server error
+    """
+    try:
+        queries = request.data.get("queries", None)
+        if not isinstance(queries, list) or not all(
+            isinstance(item, dict) and "id" in item for item in queries
+        ):
+            content = {"message": "A list of queries with ids is expected."}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
+        if len(queries) > settings.EXPLORE_BATCH_MAX_QUERIES:
+            content = {
+                "message": "A batch has at most "
+                f"{settings.EXPLORE_BATCH_MAX_QUERIES} queries."
+            }
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
+
+        content = {
+            "responses": [
+                _execute_batch_item(item, request) for item in queries
+            ]
+        }
+        return Response(content, status=status.HTTP_200_OK)
+    except Exception as exception:
+        content = {"message": str(exception)}
+        return Response(content, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,44 @@
+""" REST views for the capabilities API
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from core_explore_common_app import settings
+from core_explore_common_app.utils.protocols import compression
+from core_main_app.components.template import api as template_api
+
+
+@api_view(["GET"])
+def get_capabilities(request):
+    """Describe the query options supported by this instance
+
+    Args:
+
+        request: HTTP request
+
+    Returns:
+
+        - code: 200
+          content: Capabilities
+        - code: 500
+          content: Internal server error
+    """
+    try:
+        content = {
+            "sort_fields": [
+                sorting_field["field"]
+                for sorting_field in settings.DATA_DISPLAYED_SORTING_FIELDS
+            ],
+            "page_size": settings.RESULTS_PER_PAGE,
+            "compression": compression.get_supported_encodings(),
+            "count_only": True,
+            "batch": settings.EXPLORE_BATCH_MAX_QUERIES,
+            "template_hashes": sorted(
+                {template.hash for template in template_api.get_all(request)}
+            ),
+        }
+        return Response(content, status=status.HTTP_200_OK)
+    except Exception as exception:
+        content = {"message": str(exception)}
+        return Response(content, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
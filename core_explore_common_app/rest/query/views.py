@@ -6,20 +6,29 @@ import logging
 import pytz
 from django import urls as django_urls
 from django.conf import settings as conf_settings
+from django.core.paginator import Paginator
+from django.db.models import QuerySet
 
 from core_explore_common_app.components.result.models import Result
+from core_explore_common_app.constants import COUNT_ONLY_OPTION
 from core_explore_common_app.utils.linked_records import pid as pid_utils
+from core_explore_common_app.utils.query import (
+    count_cache,
+    keyset,
+    plan_cache,
+)
 from core_explore_common_app.utils.result import result as result_utils
-from core_main_app.access_control.exceptions import AccessControlError
 from core_main_app.commons.constants import DATA_JSON_FIELD
 from core_main_app.commons.exceptions import ApiError
 from core_main_app.components.data import api as data_api
+from core_main_app.components.template import api as template_api
 from core_main_app.rest.data.abstract_views import (
     AbstractExecuteLocalQueryView,
 )
-from core_main_app.settings import DATA_SORTING_FIELDS, RESULTS_PER_PAGE
-from core_main_app.utils.pagination.django_paginator.results_paginator import (
-    ResultsPaginator,
+from core_main_app.settings import (
+    DATA_SORTING_FIELDS,
+    RESULTS_PER_PAGE,
+    SERVER_URI,
 )
 from core_main_app.utils.pagination.mongoengine_paginator.paginator import (
     MongoenginePaginator,
@@ -29,6 +38,15 @@ from core_main_app.utils.query.mongo.query_builder import QueryBuilder
 
 logger = logging.getLogger(__name__)
 
+# fields of the data loaded when results are listed in summary mode, the
+# content and the other large columns are left out
+SUMMARY_FIELDS = (
+    "id",
+    "title",
+    "template",
+    "last_modification_date",
+)
+
 
 def build_local_query(query_data):
     """Build a query for local data.
@@ -45,6 +63,18 @@ def build_local_query(query_data):
     if query is None:
         raise ApiError("Query should be passed in parameter.")
 
+    # reuse the raw query if it was already built, e.g. for another page
+    plan_key = plan_cache.get_key(query_data)
+    raw_query = plan_cache.get_raw_query(plan_key)
+    if plan_cache.is_enabled():
+        logger.debug(
+            "Raw query cache %s: %s",
+            "hit" if raw_query is not None else "miss",
+            plan_cache.get_stats(),
+        )
+    if raw_query is not None:
+        return raw_query
+
     templates = query_data.get("templates", [])
     if type(templates) is str:
         templates = json.loads(templates)
@@ -71,22 +101,87 @@ def build_local_query(query_data):
         query_builder.add_title_criteria(title)
 
     # get raw query
-    return query_builder.get_raw_query()
+    raw_query = query_builder.get_raw_query()
+    plan_cache.set_raw_query(plan_key, raw_query)
+    return raw_query
 
 
-def execute_local_query(query_data, page, request):
+def resolve_template_hashes(query_data, request):
+    """Replace the templates of a query sent by another instance, given with
+    the ids of that instance, by the local templates having the same hash
+
+    Args:
+        query_data:
+        request:
+
+    Returns:
+        the query on the local templates, None if no local template has the
+        hash of one of the templates of the query
+
+    """
+    templates = query_data.get("templates", [])
+    if type(templates) is str:
+        templates = json.loads(templates)
+    if not templates:
+        return query_data
+
+    local_templates = template_api.get_all_accessible_by_hash_list(
+        [template["hash"] for template in templates], request=request
+    )
+    if len(local_templates) == 0:
+        return None
+    query_data = dict(query_data)
+    query_data["templates"] = [
+        {"id": template.id} for template in local_templates
+    ]
+    return query_data
+
+
+def is_count_only_query(query_data):
+    """Check if only the number of results of a query is requested
+
+    Args:
+        query_data:
+
+    Returns:
+
+    """
+    count_only = query_data.get(COUNT_ONLY_OPTION, False)
+    if isinstance(count_only, str):
+        return count_only.lower() in ("true", "1")
+    return bool(count_only)
+
+
+def execute_local_query(
+    query_data, page, request, count_only=False, cursor=None, summary=False
+):
     """Execute query on local database
 
     Args:
         query_data:
         page:
         request:
+        count_only: only count the results, returns an int
+        cursor: cursor of the page (see next_cursor of the returned page),
+            page is used if the cursor is not valid for the query order
+        summary: do not load the content of the data
 
     Returns:
 
     """
     # build raw query
     raw_query = build_local_query(query_data)
+    # the count rarely changes between two pages, reuse it
+    count_key = count_cache.get_key(raw_query, request.user)
+    count = count_cache.get_count(count_key)
+    if count_only:
+        if count is None:
+            # results are not ordered when they are only counted
+            count = data_api.execute_json_query(
+                raw_query, request.user, []
+            ).count()
+            count_cache.set_count(count_key, count)
+        return count
     # retrieve order_by_field field
     order_by_field = query_data.get("order_by_field", None)
     order_by_field = (
@@ -96,22 +191,48 @@ def execute_local_query(query_data, page, request):
     data_list = data_api.execute_json_query(
         raw_query, request.user, order_by_field
     )
+    # results are ordered by id as well, so pages can follow a cursor
+    use_keyset = keyset.is_supported(data_list, order_by_field)
+    if summary and isinstance(data_list, QuerySet):
+        data_list = data_list.only(
+            *SUMMARY_FIELDS,
+            # the cursors are built from the values of the sorting fields
+            *(
+                [field.strip().lstrip("+-") for field in order_by_field]
+                if use_keyset
+                else []
+            ),
+        )
+    if use_keyset:
+        data_list = keyset.order(data_list, order_by_field)
     # build result page
     if conf_settings.MONGODB_INDEXING:
         paginator = MongoenginePaginator(data_list, RESULTS_PER_PAGE)
-        page = paginator.get_page(page)
     else:
-        paginator = ResultsPaginator()
-        page = paginator.get_results(data_list, page, RESULTS_PER_PAGE)
-    return page
+        paginator = Paginator(data_list, RESULTS_PER_PAGE)
+    if count is not None:
+        paginator.count = count
+    else:
+        count_cache.set_count(count_key, paginator.count)
+    if not use_keyset:
+        return paginator.get_page(page)
 
+    result_page = None
+    if cursor:
+        result_page = keyset.get_page(paginator, order_by_field, cursor)
+    if result_page is None:
+        result_page = paginator.get_page(page)
+    return keyset.set_next_cursor(result_page, order_by_field)
 
-def format_local_results(results, request):
+
+def format_local_results(results, request, summary=False):
     """Format local results for explore app
 
     Args:
         results:
         request:
+        summary: leave the content out, the results get the url loading it
+            instead
 
     Returns:
 
@@ -130,6 +251,18 @@ def format_local_results(results, request):
     url_permission_data = django_urls.reverse(
         "core_main_app_rest_data_permissions"
     )
+    url_result_content = django_urls.reverse(
+        "core_explore_common_result_content"
+    )
+
+    # Get blobs attached to the data of the page, if any
+    blob_ids = (
+        result_utils.get_readable_blob_ids(
+            [data.id for data in results.object_list], request.user
+        )
+        if blob_detail_url_base
+        else dict()
+    )
 
     # Template info
     template_info = dict()
@@ -155,22 +288,83 @@ def format_local_results(results, request):
             # Ensure the PID is set
             detail_url = pid_url if pid_url else detail_url
 
-        # # Get blob attached to data if any
-        try:
-            blob = data.blob(request.user)
-        except AccessControlError:
-            blob = None
-
         # Add Result to list of results
+        result = Result(
+            title=data.title,
+            blob_url=f"{blob_detail_url_base}?id={blob_ids[data.id]}"
+            if data.id in blob_ids
+            else None,
+            content="" if summary else data.content,
+            template_info=template_info[template_id],
+            permission_url=f'{url_permission_data}?ids=%5B"{str(data.id)}"%5D',
+            detail_url=detail_url,
+            access_data_url=f"{url_access_data}?id={data.id}",
+            last_modification_date=data.last_modification_date.replace(
+                tzinfo=pytz.UTC
+            ),
+        )
+        if summary:
+            result.content_url = f"{url_result_content}?id={data.id}"
+        data_list.append(result)
+    return data_list
+
+
+def format_federated_results(results, request):
+    """Format local results for another instance: urls are absolute, and
+    templates are identified by their hash, their local ids being unknown to
+    the other instance
+
+    Args:
+        results:
+        request:
+
+    Returns:
+
+    """
+    data_detail_url_base = SERVER_URI + django_urls.reverse(
+        "core_main_app_data_detail"
+    )
+    try:
+        blob_detail_url_base = SERVER_URI + django_urls.reverse(
+            "core_main_app_blob_detail"
+        )
+    except django_urls.NoReverseMatch:
+        blob_detail_url_base = None
+    url_access_data = SERVER_URI + django_urls.reverse(
+        "core_explore_common_app_get_result_from_data_id"
+    )
+
+    blob_ids = (
+        result_utils.get_readable_blob_ids(
+            [data.id for data in results.object_list], request.user
+        )
+        if blob_detail_url_base
+        else dict()
+    )
+    template_info = dict()
+    data_list = []
+    for data in results.object_list:
+        template_id = data.template_id
+        if template_id not in template_info:
+            template_info[template_id] = result_utils.get_template_info(
+                data.template, include_template_id=False
+            )
+
+        detail_url = f"{data_detail_url_base}?id={str(data.id)}"
+        if pid_utils.is_auto_set_pid_enabled(
+            installed_apps=conf_settings.INSTALLED_APPS, user=request.user
+        ):
+            pid_url = pid_utils.get_pid_url(data, request)
+            detail_url = pid_url if pid_url else detail_url
+
         data_list.append(
             Result(
                 title=data.title,
-                blob_url=f"{blob_detail_url_base}?id={blob.id}"
-                if blob_detail_url_base and blob
+                blob_url=f"{blob_detail_url_base}?id={blob_ids[data.id]}"
+                if data.id in blob_ids
                 else None,
                 content=data.content,
                 template_info=template_info[template_id],
-                permission_url=f'{url_permission_data}?ids=%5B"{str(data.id)}"%5D',
                 detail_url=detail_url,
                 access_data_url=f"{url_access_data}?id={data.id}",
                 last_modification_date=data.last_modification_date.replace(
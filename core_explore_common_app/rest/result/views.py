@@ -8,8 +8,12 @@ from core_main_app.commons import exceptions
 import core_main_app.components.data.api as data_api
 from core_explore_common_app.components.result.models import Result
 from core_explore_common_app.rest.result.serializers import ResultSerializer
+from core_explore_common_app.utils.protocols.compression import (
+    compress_response,
+)
 
 
+@compress_response
 @api_view(["GET"])
 def get_result_from_data_id(request):
     """Retrieve a Result
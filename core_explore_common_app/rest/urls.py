@@ -3,6 +3,10 @@
 
 from django.urls import re_path
 
+from core_explore_common_app.rest.batch import views as batch_views
+from core_explore_common_app.rest.capabilities import (
+    views as capabilities_views,
+)
 from core_explore_common_app.rest.result import views as result_views
 
 urlpatterns = [
@@ -11,4 +15,14 @@ urlpatterns = [
         result_views.get_result_from_data_id,
         name="core_explore_common_app_get_result_from_data_id",
     ),
+    re_path(
+        r"^capabilities/$",
+        capabilities_views.get_capabilities,
+        name="core_explore_common_app_capabilities",
+    ),
+    re_path(
+        r"^batch/$",
+        batch_views.execute_batch_query,
+        name="core_explore_common_app_batch_query",
+    ),
 ]
@@ -63,3 +63,275 @@ CAN_ANONYMOUS_ACCESS_PUBLIC_DOCUMENT = getattr(
 )
 """ :py:class:`bool`: Can anonymous user access public document.
 """
+
+EXPLORE_FAN_OUT_MAX_WORKERS = getattr(
+    settings, "EXPLORE_FAN_OUT_MAX_WORKERS", 8
+)
+""" :py:class:`int`: Maximum number of data sources queried concurrently by the process.
+"""
+
+EXPLORE_HTTP_POOL_MAXSIZE = getattr(settings, "EXPLORE_HTTP_POOL_MAXSIZE", 10)
+""" :py:class:`int`: Maximum number of keep-alive connections kept per remote instance.
+"""
+
+EXPLORE_HTTP_SESSION_IDLE_TIMEOUT = getattr(
+    settings, "EXPLORE_HTTP_SESSION_IDLE_TIMEOUT", 300
+)
+""" :py:class:`int`: Seconds after which the unused session of a remote instance is closed.
+"""
+
+EXPLORE_CIRCUIT_BREAKER_FAILURE_THRESHOLD = getattr(
+    settings, "EXPLORE_CIRCUIT_BREAKER_FAILURE_THRESHOLD", 5
+)
+""" :py:class:`int`: Consecutive failures after which a remote data source is considered unavailable.
+"""
+
+EXPLORE_CIRCUIT_BREAKER_RESET_TIMEOUT = getattr(
+    settings, "EXPLORE_CIRCUIT_BREAKER_RESET_TIMEOUT", 30
+)
+""" :py:class:`int`: Seconds before an unavailable remote data source is probed again.
+"""
+
+EXPLORE_REQUEST_DEADLINE = getattr(settings, "EXPLORE_REQUEST_DEADLINE", 10)
+""" :py:class:`int`: Seconds given to remote data sources to answer a results request (None to disable).
+"""
+
+EXPLORE_RESULT_CACHE_TTL = getattr(settings, "EXPLORE_RESULT_CACHE_TTL", 60)
+""" :py:class:`int`: Seconds a remote result page is kept in cache (0 to disable the cache).
+"""
+
+EXPLORE_RESULT_CACHE_MAX_SIZE = getattr(
+    settings, "EXPLORE_RESULT_CACHE_MAX_SIZE", 256
+)
+""" :py:class:`int`: Maximum number of remote result pages kept in the in-process cache.
+"""
+
+EXPLORE_RESULT_CACHE_BACKEND = getattr(
+    settings, "EXPLORE_RESULT_CACHE_BACKEND", None
+)
+""" :py:class:`str`: Django cache alias used to share remote result pages across workers (None to use an in-process cache).
+"""
+
+EXPLORE_PREFETCH_ENABLED = getattr(settings, "EXPLORE_PREFETCH_ENABLED", True)
+""" :py:class:`bool`: Fetch the next results page of a data source in the background.
+"""
+
+EXPLORE_PREFETCH_TTL = getattr(settings, "EXPLORE_PREFETCH_TTL", 30)
+""" :py:class:`int`: Seconds a prefetched results page is kept.
+"""
+
+EXPLORE_PREFETCH_MAX_WORKERS = getattr(
+    settings, "EXPLORE_PREFETCH_MAX_WORKERS", 2
+)
+""" :py:class:`int`: Number of threads fetching results pages in the background.
+"""
+
+EXPLORE_PREFETCH_QUEUE_SIZE = getattr(
+    settings, "EXPLORE_PREFETCH_QUEUE_SIZE", 16
+)
+""" :py:class:`int`: Maximum number of pending prefetches, further prefetches are dropped.
+"""
+
+EXPLORE_STREAM_RESULTS = getattr(settings, "EXPLORE_STREAM_RESULTS", True)
+""" :py:class:`bool`: Parse and validate remote results one at a time while reading the response.
+"""
+
+EXPLORE_STREAM_CHUNK_SIZE = getattr(
+    settings, "EXPLORE_STREAM_CHUNK_SIZE", 65536
+)
+""" :py:class:`int`: Size in bytes of the chunks read from remote responses.
+"""
+
+EXPLORE_STRICT_RESULT_VALIDATION = getattr(
+    settings, "EXPLORE_STRICT_RESULT_VALIDATION", False
+)
+""" :py:class:`bool`: Validate every remote result with the DRF ResultSerializer instead of the fast validator.
+"""
+
+EXPLORE_TOKEN_REFRESH_MARGIN = getattr(
+    settings, "EXPLORE_TOKEN_REFRESH_MARGIN", 60
+)
+""" :py:class:`int`: Seconds before expiration at which the access token of a remote instance is refreshed.
+"""
+
+EXPLORE_TOKEN_REQUEST_TIMEOUT = getattr(
+    settings, "EXPLORE_TOKEN_REQUEST_TIMEOUT", 10
+)
+""" :py:class:`int`: Timeout in seconds of the token refresh requests.
+"""
+
+EXPLORE_HTTP_COMPRESSION = getattr(settings, "EXPLORE_HTTP_COMPRESSION", True)
+""" :py:class:`bool`: Ask remote instances for compressed responses (gzip, or zstd when available).
+"""
+
+EXPLORE_ADAPTIVE_TIMEOUT_ENABLED = getattr(
+    settings, "EXPLORE_ADAPTIVE_TIMEOUT_ENABLED", True
+)
+""" :py:class:`bool`: Derive the timeout of each remote data source from its observed response times.
+"""
+
+EXPLORE_ADAPTIVE_TIMEOUT_WINDOW = getattr(
+    settings, "EXPLORE_ADAPTIVE_TIMEOUT_WINDOW", 100
+)
+""" :py:class:`int`: Number of latest response times kept per remote data source.
+"""
+
+EXPLORE_ADAPTIVE_TIMEOUT_MIN_SAMPLES = getattr(
+    settings, "EXPLORE_ADAPTIVE_TIMEOUT_MIN_SAMPLES", 10
+)
+""" :py:class:`int`: Number of response times observed before the timeout of a data source adapts.
+"""
+
+EXPLORE_ADAPTIVE_TIMEOUT_PERCENTILE = getattr(
+    settings, "EXPLORE_ADAPTIVE_TIMEOUT_PERCENTILE", 95
+)
+""" :py:class:`int`: Percentile of the response times the timeout of a data source is derived from.
+"""
+
+EXPLORE_ADAPTIVE_TIMEOUT_MARGIN = getattr(
+    settings, "EXPLORE_ADAPTIVE_TIMEOUT_MARGIN", 1
+)
+""" :py:class:`float`: Seconds added to the response time percentile to get the timeout of a data source.
+"""
+
+EXPLORE_ADAPTIVE_TIMEOUT_MIN = getattr(
+    settings, "EXPLORE_ADAPTIVE_TIMEOUT_MIN", 2
+)
+""" :py:class:`float`: Lower bound in seconds of the adaptive timeouts.
+"""
+
+EXPLORE_MERGED_RESULTS_ORDER_BY_FIELD = getattr(
+    settings,
+    "EXPLORE_MERGED_RESULTS_ORDER_BY_FIELD",
+    "-last_modification_date",
+)
+""" :py:class:`str`: Order of the merged results when the data sources of a query are not sorted the same way.
+"""
+
+EXPLORE_MERGED_STREAM_LOW_WATERMARK = getattr(
+    settings, "EXPLORE_MERGED_STREAM_LOW_WATERMARK", 3
+)
+""" :py:class:`int`: Number of buffered results of a data source below which its next page is fetched for the merged results.
+"""
+
+EXPLORE_MERGED_STREAM_TTL = getattr(settings, "EXPLORE_MERGED_STREAM_TTL", 300)
+""" :py:class:`int`: Time in seconds a merged results stream is kept to serve the next pages.
+"""
+
+EXPLORE_MERGED_STREAM_MAX_SIZE = getattr(
+    settings, "EXPLORE_MERGED_STREAM_MAX_SIZE", 64
+)
+""" :py:class:`int`: Maximum number of merged results streams kept in memory.
+"""
+
+EXPLORE_DEDUPLICATE_RESULTS = getattr(
+    settings, "EXPLORE_DEDUPLICATE_RESULTS", False
+)
+""" :py:class:`bool`: Hide the merged results already returned by another data source (same template and content).
+"""
+
+EXPLORE_CAPABILITIES_TTL = getattr(settings, "EXPLORE_CAPABILITIES_TTL", 3600)
+""" :py:class:`int`: Time in seconds the capabilities of a remote instance are cached. Set to 0 to never probe remote instances.
+"""
+
+EXPLORE_CAPABILITIES_TIMEOUT = getattr(
+    settings, "EXPLORE_CAPABILITIES_TIMEOUT", 2
+)
+""" :py:class:`int`: Timeout in seconds of the capabilities probe of a remote instance.
+"""
+
+EXPLORE_CAPABILITIES_PATH = getattr(
+    settings, "EXPLORE_CAPABILITIES_PATH", None
+)
+""" :py:class:`str`: Path of the capabilities endpoint on remote instances, defaults to the path of this instance.
+"""
+
+EXPLORE_RETRY_MAX_ATTEMPTS = getattr(settings, "EXPLORE_RETRY_MAX_ATTEMPTS", 3)
+""" :py:class:`int`: Maximum number of attempts of a query to a remote data source (1 disables retries).
+"""
+
+EXPLORE_RETRY_BASE_DELAY = getattr(settings, "EXPLORE_RETRY_BASE_DELAY", 0.1)
+""" :py:class:`float`: Delay in seconds before the first retry, doubled at each retry (with jitter).
+"""
+
+EXPLORE_RETRY_MAX_DELAY = getattr(settings, "EXPLORE_RETRY_MAX_DELAY", 2)
+""" :py:class:`float`: Maximum delay in seconds before a retry.
+"""
+
+EXPLORE_RETRY_BUDGET_RATIO = getattr(
+    settings, "EXPLORE_RETRY_BUDGET_RATIO", 0.1
+)
+""" :py:class:`float`: Retries earned by each request to a remote data source.
+"""
+
+EXPLORE_RETRY_BUDGET_MAX = getattr(settings, "EXPLORE_RETRY_BUDGET_MAX", 10)
+""" :py:class:`int`: Maximum number of retries a remote data source can save up.
+"""
+
+EXPLORE_RETRY_POLICIES = getattr(settings, "EXPLORE_RETRY_POLICIES", {})
+""" :py:class:`dict`: Retry policies by url_query, overriding max_attempts, base_delay and/or max_delay.
+"""
+
+EXPLORE_BULKHEAD_MAX_CONCURRENT = getattr(
+    settings, "EXPLORE_BULKHEAD_MAX_CONCURRENT", 32
+)
+""" :py:class:`int`: Maximum number of concurrent queries sent to all remote data sources (0 for no limit).
+"""
+
+EXPLORE_BULKHEAD_MAX_CONCURRENT_PER_SOURCE = getattr(
+    settings, "EXPLORE_BULKHEAD_MAX_CONCURRENT_PER_SOURCE", 8
+)
+""" :py:class:`int`: Maximum number of concurrent queries sent to a remote data source (0 for no limit).
+"""
+
+EXPLORE_BULKHEAD_MAX_QUEUE = getattr(
+    settings, "EXPLORE_BULKHEAD_MAX_QUEUE", 16
+)
+""" :py:class:`int`: Maximum number of queries waiting for a slot of a bulkhead, the next ones are rejected.
+"""
+
+EXPLORE_BULKHEAD_QUEUE_TIMEOUT = getattr(
+    settings, "EXPLORE_BULKHEAD_QUEUE_TIMEOUT", 1
+)
+""" :py:class:`float`: Maximum time in seconds a query waits for a slot of a bulkhead before being rejected.
+"""
+
+EXPLORE_BATCH_MAX_QUERIES = getattr(settings, "EXPLORE_BATCH_MAX_QUERIES", 20)
+""" :py:class:`int`: Maximum number of queries of a batch, sent to or received from a remote instance. Set to 0 to disable batches.
+"""
+
+EXPLORE_BATCH_PATH = getattr(settings, "EXPLORE_BATCH_PATH", None)
+""" :py:class:`str`: Path of the batch query endpoint on remote instances, defaults to the path of this instance.
+"""
+
+EXPLORE_PASS_THROUGH_DATA_SOURCES = getattr(
+    settings, "EXPLORE_PASS_THROUGH_DATA_SOURCES", []
+)
+""" :py:class:`list`: url_query of the trusted remote data sources, whose result pages are passed through the JSON results API without being decoded and validated.
+"""
+
+EXPLORE_QUERY_PLAN_CACHE_TTL = getattr(
+    settings, "EXPLORE_QUERY_PLAN_CACHE_TTL", 600
+)
+""" :py:class:`int`: Seconds a raw query built for local data is kept in cache (0 to disable the cache).
+"""
+
+EXPLORE_QUERY_PLAN_CACHE_MAX_SIZE = getattr(
+    settings, "EXPLORE_QUERY_PLAN_CACHE_MAX_SIZE", 256
+)
+""" :py:class:`int`: Maximum number of raw queries built for local data kept in cache.
+"""
+
+EXPLORE_COUNT_CACHE_TTL = getattr(settings, "EXPLORE_COUNT_CACHE_TTL", 30)
+""" :py:class:`int`: Seconds the number of results of a local query is kept in cache (0 to disable the cache).
+"""
+
+EXPLORE_COUNT_CACHE_MAX_SIZE = getattr(
+    settings, "EXPLORE_COUNT_CACHE_MAX_SIZE", 1024
+)
+""" :py:class:`int`: Maximum number of counts of local queries kept in cache.
+"""
+
+EXPLORE_SUMMARY_RESULTS = getattr(settings, "EXPLORE_SUMMARY_RESULTS", False)
+""" :py:class:`bool`: List the local results without their content, the content of a result is loaded when it is expanded.
+"""
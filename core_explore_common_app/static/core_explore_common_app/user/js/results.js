@@ -27,18 +27,81 @@ var getDataSourcesResultsHTML = function() {
 
 
 /**
- * Get data sources results
+ * Get data sources results: the number of results of all data sources is
+ * requested at once, and the results page of a data source is fetched when
+ * its tab is displayed
  */
 var getDataSourcesResults = function(order_by_field) {
     var $results = $("#results");
-    $results.find(".results-container").each(function() {
-        // TODO: check if problem setting variable with async call
+    var counts_url = $results.find("#data_sources_results").attr("counts_url");
+    $results.find(".results-container").removeData("loaded");
+    getDataSourcesCounts(counts_url);
+    getActiveDataSourceResults();
+    $results.find("a[role=tab]")
+        .off("shown.bs.tab", getActiveDataSourceResults)
+        .on("shown.bs.tab", getActiveDataSourceResults);
+};
+
+/**
+ * Get the results page of the displayed data source, if not loaded yet
+ */
+var getActiveDataSourceResults = function() {
+    $("#results").find(".results-container.active").each(function() {
         var $result_container = $(this);
+        if ($result_container.data("loaded")) return;
+        $result_container.data("loaded", true);
         var data_source_url = $result_container.attr("url");
         var result_page = $result_container.find(".results-page");
         get_data_source_results(result_page, data_source_url);
     });
+};
+
+/**
+ * Get the number of results of all data sources, each count is displayed as
+ * soon as it is streamed back
+ * @param counts_url
+ */
+var getDataSourcesCounts = function(counts_url) {
+    readJSONLines(counts_url, function(data) {
+        var $results_infos = $("#results_infos_" + data.data_source_index);
+        // keep the count of a results page already displayed
+        if ($results_infos.html() !== "-") return;
+        if (data.error !== undefined) {
+            $results_infos.attr("title", $("<div>").html(data.error).text());
+        } else {
+            $results_infos.html(data.nb_results);
+        }
+    });
+};
 
+/**
+ * Read a response made of one JSON document per line, each document is
+ * handled as soon as its line is received
+ * @param url
+ * @param onData
+ */
+var readJSONLines = function(url, onData) {
+    return fetch(url, {credentials: "same-origin"}).then(function(response) {
+        if (!response.ok) return;
+        var reader = response.body.getReader();
+        var decoder = new TextDecoder();
+        var buffer = "";
+        var readChunk = function() {
+            return reader.read().then(function(chunk) {
+                if (chunk.done) return;
+                buffer += decoder.decode(chunk.value, {stream: true});
+                var lines = buffer.split("\n");
+                // keep the incomplete line for the next chunk
+                buffer = lines.pop();
+                lines.forEach(function(line) {
+                    if (line.trim() === "") return;
+                    onData(JSON.parse(line));
+                });
+                return readChunk();
+            });
+        };
+        return readChunk();
+    });
 };
 
 /**
@@ -66,26 +129,7 @@ var get_data_source_results = function(result_page, data_source_url) {
         url: data_source_url,
         type: "POST",
         success: function(data) {
-            var nb_results_id = result_page.attr('nb_results_id');
-            $("#" + nb_results_id).html(data.nb_results);
-            result_page.html(data.results);
-            // display the date
-            initDisplayDateToggle();
-            // permission api calls for the edit button
-            getDataPermission();
-            // format and highlight data content
-            $('.highlight-content code').each(function(i, block) {
-                if ($(".data-template-format").val() == "JSON"){
-                    var jsonContent = JSON.parse($(block).text());
-                    var highlightedContent = hljs.highlight('json',JSON.stringify(jsonContent, null, 8)).value
-                    $(block).html(highlightedContent);
-                }
-                else {
-                    hljs.highlightElement(block);
-                }
-            });
-            // Add leave notice on links from loaded data
-            leaveNotice($("#results_" + nb_results_id.match(/(\d+)/)[0] + " a"));
+            displayDataSourceResults(result_page, data);
         },
         error: function(data) {
             result_page.html(data.responseText);
@@ -93,6 +137,65 @@ var get_data_source_results = function(result_page, data_source_url) {
     })
 };
 
+/**
+ * Display the results of a data source
+ * @param result_page
+ * @param data
+ */
+var displayDataSourceResults = function(result_page, data) {
+    var nb_results_id = result_page.attr('nb_results_id');
+    $("#" + nb_results_id).html(data.nb_results);
+    result_page.html(data.results);
+    // display the date
+    initDisplayDateToggle();
+    // permission api calls for the edit button
+    getDataPermission();
+    // format and highlight data content
+    highlightContent($('.highlight-content code'));
+    // Add leave notice on links from loaded data
+    leaveNotice($("#results_" + nb_results_id.match(/(\d+)/)[0] + " a"));
+};
+
+/**
+ * Format and highlight the content of results
+ * @param codeElements
+ */
+var highlightContent = function(codeElements) {
+    codeElements.each(function(i, block) {
+        if ($(".data-template-format").val() == "JSON"){
+            var jsonContent = JSON.parse($(block).text());
+            var highlightedContent = hljs.highlight('json',JSON.stringify(jsonContent, null, 8)).value
+            $(block).html(highlightedContent);
+        }
+        else {
+            hljs.highlightElement(block);
+        }
+    });
+};
+
+/**
+ * Load the content of a result listed without it
+ * @param contentElement
+ */
+var loadResultContent = function(contentElement) {
+    var contentUrl = contentElement.attr("data-content-url");
+    // load the content once
+    contentElement.removeAttr("data-content-url");
+    $.ajax({
+        url: contentUrl,
+        type: "GET",
+        success: function(data) {
+            contentElement.html(data);
+            highlightContent(contentElement.find("code"));
+            leaveNotice(contentElement.find("a"));
+        },
+        error: function() {
+            contentElement.attr("data-content-url", contentUrl);
+            contentElement.html("<span style='font-style:italic; color:red;'>Unable to load the content.</span>");
+        }
+    });
+};
+
 /*
  * Display the edit icon according to the user permissions
  */
@@ -224,9 +327,12 @@ var toggleDate = function(value) {
 showhideResult = function(event) {
     let button = event.target;
     // find the xml container
-    $(button).parents('.result-line-main-container')
-        .find(".content-result")
-        .toggle("blind", 500);
+    let contentElement = $(button).parents('.result-line-main-container')
+        .find(".content-result");
+    if (contentElement.attr("data-content-url")) {
+        loadResultContent(contentElement);
+    }
+    contentElement.toggle("blind", 500);
 
     if ($(button).attr("class") === "expand") {
         $(button).attr("class", "collapse show");
@@ -32,6 +32,36 @@ urlpatterns = [
         user_ajax.get_data_source_results,
         name="core_explore_common_data_source_results",
     ),
+    re_path(
+        r"^data-source-results-json/(?P<query_id>\w+)/(?P<data_source_index>\w+)/(?P<page>\w+)$",
+        user_ajax.get_data_source_results_json,
+        name="core_explore_common_data_source_results_json",
+    ),
+    re_path(
+        r"^data-source-results-json/(?P<query_id>\w+)/(?P<data_source_index>\w+)$",
+        user_ajax.get_data_source_results_json,
+        name="core_explore_common_data_source_results_json",
+    ),
+    re_path(
+        r"^merged-results/(?P<query_id>\w+)/(?P<page>\w+)$",
+        user_ajax.get_merged_results,
+        name="core_explore_common_merged_results",
+    ),
+    re_path(
+        r"^merged-results/(?P<query_id>\w+)$",
+        user_ajax.get_merged_results,
+        name="core_explore_common_merged_results",
+    ),
+    re_path(
+        r"^data-sources-counts/(?P<query_id>\w+)$",
+        user_ajax.get_data_sources_counts,
+        name="core_explore_common_data_sources_counts",
+    ),
+    re_path(
+        r"^result-content$",
+        user_ajax.get_result_content,
+        name="core_explore_common_result_content",
+    ),
     re_path(
         r"^(?P<persistent_query_type>\w+)/(?P<persistent_query_id>\w+)",
         user_ajax.ContentPersistentQueryView.as_view(),
@@ -0,0 +1,81 @@
+""" Size-bounded, thread-safe LRU cache with time-to-live
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """LRU cache whose entries expire after a time-to-live"""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Returns the value of a key if present and not expired
+
+        Args:
+            key:
+            default:
+
+        Returns:
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value, ttl):
+        """Set the value of a key, evicts the least recently used keys
+
+        Args:
+            key:
+            value:
+            ttl: time-to-live in seconds
+
+        Returns:
+
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        """Delete a key
+
+        Args:
+            key:
+
+        Returns:
+
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Delete all keys and reset the statistics
+
+        Returns:
+
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,173 @@
+""" Bulkheads limiting the concurrent queries sent to remote data sources
+
+Each data source has its own limit of concurrent queries, and all outbound
+queries share a global limit, so a slow peer cannot hold every worker
+thread. Queries over a limit wait in a bounded queue, for a bounded time,
+and are rejected once the queue is full or the wait is over.
+"""
+import contextlib
+import logging
+import threading
+import time
+
+from core_explore_common_app import settings
+from core_explore_common_app.commons.exceptions import DataSourceBusyError
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_BULKHEAD_NAME = "all data sources"
+
+_bulkheads = dict()
+_global_bulkhead = None
+_bulkheads_lock = threading.Lock()
+
+
+class Bulkhead:
+    """Limit of the concurrent queries, with a bounded waiting queue"""
+
+    def __init__(self, name, max_concurrent, max_queue):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.active = 0
+        self.waiting = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, timeout=None):
+        """Take a slot, waiting in the queue at most timeout seconds
+
+        Args:
+            timeout:
+
+        Returns:
+            False if the queue is full or no slot was released in time
+        """
+        with self._condition:
+            if self.active < self.max_concurrent:
+                self.active += 1
+                return True
+            if self.waiting >= self.max_queue:
+                return False
+            end_time = None if timeout is None else time.monotonic() + timeout
+            self.waiting += 1
+            try:
+                while self.active >= self.max_concurrent:
+                    remaining = (
+                        None
+                        if end_time is None
+                        else end_time - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._condition.wait(remaining)
+                self.active += 1
+                return True
+            finally:
+                self.waiting -= 1
+
+    def release(self):
+        """Give back a slot
+
+        Returns:
+
+        """
+        with self._condition:
+            self.active -= 1
+            self._condition.notify()
+
+
+def _create_bulkhead(name, max_concurrent):
+    """Returns a new bulkhead, None if unlimited
+
+    Args:
+        name:
+        max_concurrent:
+
+    Returns:
+
+    """
+    if not max_concurrent or max_concurrent <= 0:
+        return None
+    return Bulkhead(name, max_concurrent, settings.EXPLORE_BULKHEAD_MAX_QUEUE)
+
+
+def get_bulkhead(url_query):
+    """Returns the bulkhead of a data source, None if unlimited
+
+    Args:
+        url_query:
+
+    Returns:
+
+    """
+    with _bulkheads_lock:
+        if url_query not in _bulkheads:
+            _bulkheads[url_query] = _create_bulkhead(
+                url_query, settings.EXPLORE_BULKHEAD_MAX_CONCURRENT_PER_SOURCE
+            )
+        return _bulkheads[url_query]
+
+
+def get_global_bulkhead():
+    """Returns the bulkhead shared by all data sources, None if unlimited
+
+    Returns:
+
+    """
+    global _global_bulkhead
+    with _bulkheads_lock:
+        if _global_bulkhead is None:
+            _global_bulkhead = _create_bulkhead(
+                GLOBAL_BULKHEAD_NAME, settings.EXPLORE_BULKHEAD_MAX_CONCURRENT
+            )
+        return _global_bulkhead
+
+
+@contextlib.contextmanager
+def slot(url_query, deadline=None):
+    """Hold a slot of the data source and of the global bulkhead
+
+    Args:
+        url_query:
+        deadline:
+
+    Returns:
+
+    """
+    timeout = settings.EXPLORE_BULKHEAD_QUEUE_TIMEOUT
+    if deadline is not None and deadline.remaining() is not None:
+        timeout = min(timeout, deadline.remaining())
+
+    # the data source slot is always taken first, so they cannot deadlock
+    acquired = []
+    try:
+        for bulkhead in (get_bulkhead(url_query), get_global_bulkhead()):
+            if bulkhead is None:
+                continue
+            start_time = time.monotonic()
+            if not bulkhead.acquire(timeout):
+                logger.warning(
+                    "Too many concurrent queries to %s, query rejected.",
+                    bulkhead.name,
+                )
+                raise DataSourceBusyError(
+                    f"Too many concurrent queries to {url_query}."
+                )
+            acquired.append(bulkhead)
+            timeout = max(timeout - (time.monotonic() - start_time), 0)
+        yield
+    finally:
+        for bulkhead in reversed(acquired):
+            bulkhead.release()
+
+
+def clear():
+    """Forget all bulkheads, e.g. after a change of the limits
+
+    Returns:
+
+    """
+    global _global_bulkhead
+    with _bulkheads_lock:
+        _bulkheads.clear()
+        _global_bulkhead = None
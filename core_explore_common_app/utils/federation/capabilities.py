@@ -0,0 +1,172 @@
+""" Capabilities of the remote instances
+
+The capabilities of a remote instance (sort fields, page size, compression,
+count-only mode and template hashes) are probed once per TTL. Queries are
+adapted to them before being sent, so unsupported options never cause a
+failed round-trip. Instances that do not describe their capabilities are
+sent queries as is.
+"""
+import functools
+import json
+import logging
+
+from django import urls as django_urls
+
+from core_explore_common_app import settings
+from core_explore_common_app.constants import COUNT_ONLY_OPTION
+from core_explore_common_app.utils.cache.lru_cache import LRUCache
+from core_explore_common_app.utils.federation import (
+    single_flight,
+    token_store,
+)
+from core_explore_common_app.utils.protocols import oauth2, sessions
+
+logger = logging.getLogger(__name__)
+
+# capabilities of instances that could not be probed are unknown for a while
+FAILED_PROBE_TTL = 60
+
+_capabilities = LRUCache(256)
+
+
+def _get_capabilities_url(data_source):
+    """Returns the url of the capabilities endpoint of a remote instance
+
+    Args:
+        data_source:
+
+    Returns:
+
+    """
+    path = settings.EXPLORE_CAPABILITIES_PATH or django_urls.reverse(
+        "core_explore_common_app_capabilities"
+    )
+    return sessions.get_host_key(data_source["url_query"]) + path
+
+
+def _probe(data_source, timeout):
+    """Request the capabilities of a remote instance
+
+    Args:
+        data_source:
+        timeout:
+
+    Returns:
+        the capabilities and their TTL
+    """
+    try:
+        response = oauth2.send_get_request(
+            _get_capabilities_url(data_source),
+            token_store.get_access_token(data_source),
+            timeout=timeout,
+        )
+        if response.status_code == 200:
+            capabilities = response.json()
+            if isinstance(capabilities, dict):
+                return capabilities, settings.EXPLORE_CAPABILITIES_TTL
+        # the instance does not describe its capabilities
+        return dict(), settings.EXPLORE_CAPABILITIES_TTL
+    except Exception as exception:
+        logger.debug(
+            "Unable to probe the capabilities of %s: %s",
+            data_source["url_query"],
+            str(exception),
+        )
+        return dict(), FAILED_PROBE_TTL
+
+
+def get_cached_capabilities(data_source):
+    """Returns the known capabilities of a remote instance, without probing
+
+    Args:
+        data_source:
+
+    Returns:
+
+    """
+    capabilities = _capabilities.get(
+        sessions.get_host_key(data_source["url_query"])
+    )
+    return capabilities if capabilities is not None else dict()
+
+
+def get_capabilities(data_source, deadline=None):
+    """Returns the capabilities of a remote instance, probed if unknown, and
+    keeps them in the data source
+
+    Args:
+        data_source:
+        deadline:
+
+    Returns:
+
+    """
+    if settings.EXPLORE_CAPABILITIES_TTL <= 0:
+        return dict()
+    instance_key = sessions.get_host_key(data_source["url_query"])
+    capabilities = _capabilities.get(instance_key)
+    if capabilities is None:
+        timeout = settings.EXPLORE_CAPABILITIES_TIMEOUT
+        if deadline is not None and deadline.remaining() is not None:
+            timeout = min(timeout, deadline.remaining())
+        # concurrent queries to the same instance share the probe
+        capabilities, ttl = single_flight.do(
+            "capabilities:" + instance_key,
+            functools.partial(_probe, data_source, timeout),
+        )
+        _capabilities.set(instance_key, capabilities, ttl)
+    data_source["capabilities"] = capabilities
+    return capabilities
+
+
+def adapt_query(json_query, capabilities):
+    """Adapt a query to the capabilities of a remote instance
+
+    Args:
+        json_query: serialized query, as returned by serialize_query
+        capabilities:
+
+    Returns:
+        the adapted query, None if the instance has none of the templates of
+        the query
+    """
+    json_query = dict(json_query)
+
+    if COUNT_ONLY_OPTION in json_query and not capabilities.get(
+        "count_only", True
+    ):
+        # the count comes with the first page
+        del json_query[COUNT_ONLY_OPTION]
+
+    sort_fields = capabilities.get("sort_fields")
+    if sort_fields is not None and json_query.get("order_by_field"):
+        json_query["order_by_field"] = ",".join(
+            field
+            for field in json_query["order_by_field"].split(",")
+            if field.strip().lstrip("+-") in sort_fields
+        )
+
+    template_hashes = capabilities.get("template_hashes")
+    if template_hashes is not None and json_query.get("templates"):
+        templates = json.loads(json_query["templates"])
+        if templates:
+            template_hashes = set(template_hashes)
+            templates = [
+                template
+                for template in templates
+                if template["hash"] in template_hashes
+            ]
+            if not templates:
+                return None
+            json_query["templates"] = json.dumps(templates)
+
+    return json_query
+
+
+def clear():
+    """Forget the capabilities of all instances
+
+    Returns:
+
+    """
+    _capabilities.clear()
@@ -0,0 +1,174 @@
+""" Circuit breakers of the remote data sources
+"""
+import logging
+import threading
+import time
+
+from core_explore_common_app import settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_circuit_breakers = dict()
+_circuit_breakers_lock = threading.Lock()
+
+
+class CircuitBreaker:
+    """Circuit breaker of a remote data source
+
+    Closed: requests are sent, consecutive failures are counted.
+    Open: requests fail fast until the reset timeout has elapsed.
+    Half-open: a single probe request is let through, its outcome closes or
+    re-opens the circuit. The probe gets a token, only its holder can
+    release the probe.
+    """
+
+    def __init__(self, name, failure_threshold, reset_timeout):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failure_count = 0
+        self.opened_at = None
+        self._state = CLOSED
+        self._probe_token = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """Returns the state of the circuit
+
+        Returns:
+
+        """
+        with self._lock:
+            return self._get_state(time.monotonic())
+
+    def _get_state(self, now):
+        """Returns the state of the circuit, open circuits half-open once
+        the reset timeout has elapsed (lock held)
+
+        Args:
+            now:
+
+        Returns:
+
+        """
+        if self._state == OPEN and now - self.opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._probe_token = None
+        return self._state
+
+    def allow_request(self):
+        """Check if a request can be sent to the data source
+
+        Returns:
+            False if the request cannot be sent, the probe token if the
+            request is the probe of a half-open circuit, True otherwise
+        """
+        with self._lock:
+            state = self._get_state(time.monotonic())
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and self._probe_token is None:
+                self._probe_token = object()
+                return self._probe_token
+            return False
+
+    def release_probe(self, token):
+        """Let another probe through when the probe request ended without
+        an outcome, e.g. it was not sent. Does nothing if the token is not
+        the one of the current probe, e.g. once the outcome of the probe is
+        recorded.
+
+        Args:
+            token: value returned by allow_request
+
+        Returns:
+
+        """
+        with self._lock:
+            if token is self._probe_token:
+                self._probe_token = None
+
+    def record_success(self):
+        """Record a successful request, closes the circuit
+
+        Returns:
+
+        """
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info("Data source %s is available again.", self.name)
+            self._state = CLOSED
+            self.failure_count = 0
+            self.opened_at = None
+            self._probe_token = None
+
+    def record_failure(self):
+        """Record a failed request, opens the circuit after too many failures
+
+        Returns:
+
+        """
+        with self._lock:
+            self.failure_count += 1
+            if (
+                self._state == HALF_OPEN
+                or self.failure_count >= self.failure_threshold
+            ):
+                if self._state != OPEN:
+                    logger.warning(
+                        "Data source %s is unavailable, circuit opened.",
+                        self.name,
+                    )
+                self._state = OPEN
+                self.opened_at = time.monotonic()
+                self._probe_token = None
+
+
+def get_circuit_breaker(url_query):
+    """Returns the circuit breaker of a data source
+
+    Args:
+        url_query:
+
+    Returns:
+
+    """
+    with _circuit_breakers_lock:
+        circuit_breaker = _circuit_breakers.get(url_query)
+        if circuit_breaker is None:
+            circuit_breaker = CircuitBreaker(
+                url_query,
+                settings.EXPLORE_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                settings.EXPLORE_CIRCUIT_BREAKER_RESET_TIMEOUT,
+            )
+            _circuit_breakers[url_query] = circuit_breaker
+        return circuit_breaker
+
+
+def is_available(url_query):
+    """Check if a data source is not known to be unavailable
+
+    Args:
+        url_query:
+
+    Returns:
+
+    """
+    with _circuit_breakers_lock:
+        circuit_breaker = _circuit_breakers.get(url_query)
+    return circuit_breaker is None or circuit_breaker.state != OPEN
+
+
+def reset_all():
+    """Forget the state of all data sources
+
+    Returns:
+
+    """
+    with _circuit_breakers_lock:
+        _circuit_breakers.clear()
@@ -0,0 +1,36 @@
+""" Time budget of a federated search request
+"""
+import time
+
+
+class Deadline:
+    """Deadline of a request, shared by all the data sources it queries"""
+
+    def __init__(self, budget):
+        """Start the deadline
+
+        Args:
+            budget: seconds, None for no deadline
+        """
+        self.budget = budget
+        self.expires_at = (
+            time.monotonic() + budget if budget is not None else None
+        )
+
+    def remaining(self):
+        """Returns the remaining time in seconds, None if no deadline
+
+        Returns:
+
+        """
+        if self.expires_at is None:
+            return None
+        return max(self.expires_at - time.monotonic(), 0)
+
+    def expired(self):
+        """Check if the deadline has passed
+
+        Returns:
+
+        """
+        return self.expires_at is not None and self.remaining() == 0
@@ -0,0 +1,108 @@
+""" Fan-out utils: run the data sources of a query concurrently
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+
+from django.db import close_old_connections
+from django.utils import timezone
+
+from core_explore_common_app import settings
+from core_explore_common_app.commons.exceptions import DeadlineExceededError
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Return the process-wide, bounded, fan-out thread pool
+
+    Returns:
+
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.EXPLORE_FAN_OUT_MAX_WORKERS,
+                thread_name_prefix="explore-fan-out",
+            )
+        return _executor
+
+
+def _run_task(task, current_time_zone):
+    """Run a task in a worker thread with the context of the request thread
+
+    Args:
+        task:
+        current_time_zone:
+
+    Returns:
+
+    """
+    # time zone is activated per thread, copy the one of the request
+    timezone.activate(current_time_zone)
+    try:
+        return task()
+    finally:
+        timezone.deactivate()
+        # worker threads are reused, release their database connections
+        close_old_connections()
+
+
+def submit_all(tasks, executor=None):
+    """Submit tasks to the fan-out thread pool
+
+    Args:
+        tasks: dict of key -> callable without arguments
+        executor: defaults to the fan-out thread pool
+
+    Returns:
+        dict of future -> key
+    """
+    executor = executor if executor is not None else get_executor()
+    current_time_zone = timezone.get_current_timezone()
+    return {
+        executor.submit(_run_task, task, current_time_zone): key
+        for key, task in tasks.items()
+    }
+
+
+def iter_completed(futures, deadline=None):
+    """Yield task results in completion order
+
+    Tasks that are not completed when the deadline passes are yielded with a
+    DeadlineExceededError.
+
+    Args:
+        futures: dict of future -> key, as returned by submit_all
+        deadline:
+
+    Returns:
+        generator of (key, result, exception)
+    """
+    pending = set(futures)
+    try:
+        for future in as_completed(
+            futures,
+            timeout=deadline.remaining() if deadline is not None else None,
+        ):
+            pending.discard(future)
+            key = futures[future]
+            try:
+                yield key, future.result(), None
+            except Exception as exception:
+                logger.warning(
+                    "Fan-out task %s failed: %s", str(key), str(exception)
+                )
+                yield key, None, exception
+    except FuturesTimeoutError:
+        for future in pending:
+            # tasks still queued are not started at all
+            future.cancel()
+            yield futures[future], None, DeadlineExceededError(
+                "The data source did not answer in time."
+            )
@@ -0,0 +1,214 @@
+""" Streaming parser of remote result pages
+
+A result page is a JSON object such as {"count": 1, "next": null,
+"previous": null, "results": [...]}. The results array is parsed one element
+at a time from the response body, other keys are collected in the metadata.
+The keys written before the results array can also be rewritten while the
+results are passed through as received.
+"""
+import codecs
+import json
+
+_decoder = json.JSONDecoder()
+WHITESPACE = " \t\n\r"
+
+
+class ResultPageStream:
+    """Iterate over the results of a page while reading the response body"""
+
+    def __init__(self, chunks, results_key="results"):
+        """Init the stream
+
+        Args:
+            chunks: iterable of bytes, e.g. response.iter_content()
+            results_key: key of the array to stream
+        """
+        self.metadata = dict()
+        self.results_key = results_key
+        self._chunks = iter(chunks)
+        self._utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+
+    def __iter__(self):
+        self._skip_whitespace()
+        self._expect("{")
+        while True:
+            self._skip_whitespace()
+            if self._peek() == "}":
+                self._position += 1
+                break
+            if self._peek() == ",":
+                self._position += 1
+                self._skip_whitespace()
+            key = self._decode_value()
+            self._skip_whitespace()
+            self._expect(":")
+            self._skip_whitespace()
+            if key == self.results_key:
+                yield from self._iter_array()
+            else:
+                self.metadata[key] = self._decode_value()
+
+    def read_metadata(self):
+        """Read the keys written before the results array, and stop at the
+        start of the array
+
+        Returns:
+            False if the page has no results array
+        """
+        self._skip_whitespace()
+        self._expect("{")
+        while True:
+            self._skip_whitespace()
+            if self._peek() == "}":
+                self._position += 1
+                return False
+            if self._peek() == ",":
+                self._position += 1
+                self._skip_whitespace()
+            key = self._decode_value()
+            self._skip_whitespace()
+            self._expect(":")
+            self._skip_whitespace()
+            if key == self.results_key:
+                return True
+            self.metadata[key] = self._decode_value()
+
+    def iter_remaining(self):
+        """Yield the bytes of the body that were not consumed yet, as
+        received
+
+        Returns:
+
+        """
+        remaining = self._buffer[self._position :].encode()
+        # bytes of a character cut between two chunks
+        remaining += self._utf8_decoder.getstate()[0]
+        self._buffer = ""
+        self._position = 0
+        if remaining:
+            yield remaining
+        yield from self._chunks
+
+    def _iter_array(self):
+        """Yield the elements of an array one by one
+
+        Returns:
+
+        """
+        self._expect("[")
+        while True:
+            self._skip_whitespace()
+            if self._peek() == "]":
+                self._position += 1
+                return
+            if self._peek() == ",":
+                self._position += 1
+                self._skip_whitespace()
+            yield self._decode_value()
+            # drop what was consumed, only one element is kept in memory
+            self._buffer = self._buffer[self._position :]
+            self._position = 0
+
+    def _read(self, min_size):
+        """Read chunks until at least min_size characters were added
+
+        Args:
+            min_size:
+
+        Returns:
+            False if the body is exhausted
+        """
+        read_size = 0
+        while read_size < min_size:
+            try:
+                chunk = self._utf8_decoder.decode(next(self._chunks))
+            except StopIteration:
+                self._buffer += self._utf8_decoder.decode(b"", final=True)
+                self._exhausted = True
+                return read_size > 0
+            self._buffer += chunk
+            read_size += len(chunk)
+        return True
+
+    def _peek(self):
+        """Returns the next character
+
+        Returns:
+
+        """
+        while self._position >= len(self._buffer):
+            if not self._read(1):
+                raise ValueError("Unexpected end of the result page.")
+        return self._buffer[self._position]
+
+    def _expect(self, character):
+        """Consume an expected character
+
+        Args:
+            character:
+
+        Returns:
+
+        """
+        if self._peek() != character:
+            raise ValueError(
+                f"Invalid result page: expected '{character}' at position "
+                f"{self._position}."
+            )
+        self._position += 1
+
+    def _skip_whitespace(self):
+        """Consume whitespaces
+
+        Returns:
+
+        """
+        while self._peek() in WHITESPACE:
+            self._position += 1
+
+    def _decode_value(self):
+        """Decode the next JSON value, reading more of the body if needed
+
+        Returns:
+
+        """
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._position)
+                # a value can be cut at the end of the buffer (e.g. numbers)
+                if end < len(self._buffer) or self._exhausted:
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._exhausted:
+                    raise
+            # grow the buffer geometrically to keep parsing linear
+            if not self._read(max(len(self._buffer) - self._position, 1)):
+                if self._exhausted and self._position >= len(self._buffer):
+                    raise ValueError("Unexpected end of the result page.")
+
+
+def rewrite_metadata(chunks, rewrite, results_key="results"):
+    """Yield the bytes of a result page, with the keys written before the
+    results array rewritten. The results are passed through as received.
+
+    Args:
+        chunks: iterable of bytes, e.g. response.iter_content()
+        rewrite: function returning the new metadata from the metadata
+        results_key: key of the array to pass through
+
+    Returns:
+
+    """
+    result_page_stream = ResultPageStream(chunks, results_key)
+    has_results = result_page_stream.read_metadata()
+    metadata = rewrite(result_page_stream.metadata)
+    if not has_results:
+        yield json.dumps(metadata).encode()
+        return
+    prefix = json.dumps(metadata)[:-1]
+    yield f'{prefix}{", " if metadata else ""}"{results_key}": '.encode()
+    yield from result_page_stream.iter_remaining()
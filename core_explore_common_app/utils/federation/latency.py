@@ -0,0 +1,113 @@
+""" Observed latency of the remote data sources, and the timeouts derived
+from it
+"""
+import collections
+import math
+import threading
+
+from core_explore_common_app import settings
+
+_trackers = dict()
+_trackers_lock = threading.Lock()
+
+
+class LatencyTracker:
+    """Rolling window of the latest response times of a data source"""
+
+    def __init__(self, window_size):
+        self._samples = collections.deque(maxlen=window_size)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._samples)
+
+    def record(self, duration):
+        """Record a response time, the oldest one leaves the window
+
+        Args:
+            duration: seconds
+
+        Returns:
+
+        """
+        with self._lock:
+            self._samples.append(duration)
+
+    def percentile(self, percent):
+        """Returns a percentile of the response times (nearest rank), None if
+        nothing was recorded
+
+        Args:
+            percent:
+
+        Returns:
+
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        rank = math.ceil(percent / 100 * len(samples))
+        return samples[min(max(rank, 1), len(samples)) - 1]
+
+
+def _get_tracker(url_query):
+    """Returns the latency tracker of a data source, created if missing
+
+    Args:
+        url_query:
+
+    Returns:
+
+    """
+    with _trackers_lock:
+        tracker = _trackers.get(url_query)
+        if tracker is None:
+            tracker = LatencyTracker(settings.EXPLORE_ADAPTIVE_TIMEOUT_WINDOW)
+            _trackers[url_query] = tracker
+        return tracker
+
+
+def record(url_query, duration):
+    """Record the response time of a data source
+
+    Args:
+        url_query:
+        duration: seconds
+
+    Returns:
+
+    """
+    _get_tracker(url_query).record(duration)
+
+
+def get_timeout(url_query):
+    """Returns the timeout of a data source: a high percentile of its response
+    times plus a margin, None until enough responses were observed
+
+    Args:
+        url_query:
+
+    Returns:
+
+    """
+    if not settings.EXPLORE_ADAPTIVE_TIMEOUT_ENABLED:
+        return None
+    tracker = _get_tracker(url_query)
+    if len(tracker) < settings.EXPLORE_ADAPTIVE_TIMEOUT_MIN_SAMPLES:
+        return None
+    timeout = (
+        tracker.percentile(settings.EXPLORE_ADAPTIVE_TIMEOUT_PERCENTILE)
+        + settings.EXPLORE_ADAPTIVE_TIMEOUT_MARGIN
+    )
+    return max(timeout, settings.EXPLORE_ADAPTIVE_TIMEOUT_MIN)
+
+
+def clear():
+    """Forget all observed response times
+
+    Returns:
+
+    """
+    with _trackers_lock:
+        _trackers.clear()
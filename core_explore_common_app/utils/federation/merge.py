@@ -0,0 +1,329 @@
+""" Merged stream of the results of several data sources
+
+Each data source returns pages already sorted by the same order_by_field.
+Pages are read lazily by a cursor per data source, and the cursors are
+k-way merged with a heap, so a merged page only pulls about one page from
+each data source.
+"""
+import collections
+import datetime
+import functools
+import hashlib
+import heapq
+import itertools
+import json
+import threading
+
+from django.utils.dateparse import parse_datetime
+
+from core_explore_common_app import settings
+from core_explore_common_app.utils.cache.lru_cache import LRUCache
+from core_explore_common_app.utils.federation import fan_out
+from core_explore_common_app.utils.result import deduplication
+
+_streams = LRUCache(settings.EXPLORE_MERGED_STREAM_MAX_SIZE)
+_streams_lock = threading.Lock()
+
+
+def _get_value(result, field):
+    """Returns the value of a sorting field of a result (dict or Result)
+
+    Args:
+        result:
+        field:
+
+    Returns:
+
+    """
+    if isinstance(result, dict):
+        get = result.get
+    else:
+
+        def get(name):
+            return getattr(result, name, None)
+
+    if field == "template":
+        # data sources order the data by the id of their template
+        template_id = (get("template_info") or {}).get("id")
+        if isinstance(template_id, str) and template_id.isdigit():
+            return int(template_id)
+        return template_id if template_id != "" else None
+    value = get(field)
+    if isinstance(value, str):
+        try:
+            value = parse_datetime(value) or value
+        except ValueError:
+            pass
+    if isinstance(value, datetime.datetime) and value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value
+
+
+class _SortKey:
+    """Sort key of a result, compares the values of the sorting fields in
+    their direction. Missing values come last."""
+
+    __slots__ = ("values", "descending")
+
+    def __init__(self, values, descending):
+        self.values = values
+        self.descending = descending
+
+    def __lt__(self, other):
+        for value, other_value, descending in zip(
+            self.values, other.values, self.descending
+        ):
+            if value == other_value:
+                continue
+            if value is None:
+                return False
+            if other_value is None:
+                return True
+            try:
+                is_less = (
+                    value > other_value if descending else value < other_value
+                )
+            except TypeError:
+                is_less = (
+                    str(value) > str(other_value)
+                    if descending
+                    else str(value) < str(other_value)
+                )
+            return is_less
+        return False
+
+
+def get_sort_key(order_by_field):
+    """Returns the key function sorting results as the data sources do
+
+    Args:
+        order_by_field: comma separated fields, prefixed by "-" when
+            descending, optionally by "+" when ascending
+
+    Returns:
+
+    """
+    fields = [field.strip() for field in order_by_field.split(",")]
+    fields = [field for field in fields if field]
+    names = [field.lstrip("+-") for field in fields]
+    descending = [field.startswith("-") for field in fields]
+
+    def _sort_key(result):
+        return _SortKey(
+            [_get_value(result, name) for name in names], descending
+        )
+
+    return _sort_key
+
+
+class SourceCursor:
+    """Iterate over the results of a data source, page by page
+
+    The next page is fetched in the background when few results are left in
+    the buffer. A failing data source ends its iteration, its error is kept.
+    """
+
+    def __init__(self, fetch_page, low_watermark):
+        """Init the cursor
+
+        Args:
+            fetch_page: callable returning (results, next page number or
+                None, count) from a page number
+            low_watermark: number of buffered results below which the next
+                page is fetched
+        """
+        self.count = None
+        self.error = None
+        self._fetch_page = fetch_page
+        self._low_watermark = low_watermark
+        self._buffer = collections.deque()
+        self._next_page = 1
+        self._future = None
+
+    def prefetch(self):
+        """Fetch the next page in the background, if any
+
+        Returns:
+
+        """
+        if self._future is not None or self._next_page is None:
+            return
+        page, self._next_page = self._next_page, None
+        self._future = next(
+            iter(
+                fan_out.submit_all(
+                    {page: functools.partial(self._fetch_page, page)}
+                )
+            )
+        )
+
+    def _wait(self):
+        """Wait for the page being fetched and buffer its results
+
+        Returns:
+
+        """
+        future, self._future = self._future, None
+        try:
+            results, next_page, count = future.result()
+        except Exception as exception:
+            self.error = exception
+            return
+        if self.count is None:
+            self.count = count
+        self._buffer.extend(results)
+        # an empty page ends the data source
+        self._next_page = next_page if results else None
+
+    def __iter__(self):
+        while True:
+            if not self._buffer:
+                self.prefetch()
+                if self._future is None:
+                    return
+                self._wait()
+                continue
+            if len(self._buffer) <= self._low_watermark:
+                self.prefetch()
+            yield self._buffer.popleft()
+
+
+class MergedStream:
+    """Results of several data sources merged in a single sorted stream"""
+
+    def __init__(
+        self, fetch_pages, order_by_field, low_watermark=None, deduplicate=None
+    ):
+        """Init the stream, the first page of each data source is fetched
+        concurrently
+
+        Args:
+            fetch_pages: one fetch_page callable per data source (see
+                SourceCursor)
+            order_by_field: order shared by the data sources
+            low_watermark: defaults to EXPLORE_MERGED_STREAM_LOW_WATERMARK
+            deduplicate: drop results already returned by another data
+                source, defaults to EXPLORE_DEDUPLICATE_RESULTS
+        """
+        if low_watermark is None:
+            low_watermark = settings.EXPLORE_MERGED_STREAM_LOW_WATERMARK
+        self.cursors = [
+            SourceCursor(fetch_page, low_watermark)
+            for fetch_page in fetch_pages
+        ]
+        for cursor in self.cursors:
+            cursor.prefetch()
+        self.position = 0
+        self.lock = threading.Lock()
+        self._merged = heapq.merge(
+            *self.cursors, key=get_sort_key(order_by_field)
+        )
+        if deduplicate is None:
+            deduplicate = settings.EXPLORE_DEDUPLICATE_RESULTS
+        self.deduplicator = None
+        if deduplicate:
+            self.deduplicator = deduplication.Deduplicator()
+            self._merged = self.deduplicator.filter(self._merged)
+
+    @property
+    def count(self):
+        """Returns the total number of results of the data sources that
+        answered, without the duplicates found so far
+
+        Returns:
+
+        """
+        count = sum(cursor.count or 0 for cursor in self.cursors)
+        if self.deduplicator is not None:
+            count -= self.deduplicator.duplicate_count
+        return count
+
+    @property
+    def errors(self):
+        """Returns the errors of the data sources, by index
+
+        Returns:
+
+        """
+        return {
+            index: cursor.error
+            for index, cursor in enumerate(self.cursors)
+            if cursor.error is not None
+        }
+
+    def get_page(self, page, page_size):
+        """Returns a page of merged results, pages are read in order
+
+        Args:
+            page:
+            page_size:
+
+        Returns:
+
+        """
+        offset = (page - 1) * page_size
+        if offset < self.position:
+            raise ValueError("The merged stream is already past this page.")
+        # skip the pages that were not requested
+        collections.deque(
+            itertools.islice(self._merged, offset - self.position), maxlen=0
+        )
+        results = list(itertools.islice(self._merged, page_size))
+        self.position = offset + len(results)
+        return results
+
+
+def get_key(user_id, query_id, json_queries):
+    """Returns the key of a merged stream, changes with the queries
+
+    Args:
+        user_id:
+        query_id:
+        json_queries: serialized query of each data source
+
+    Returns:
+
+    """
+    queries_hash = hashlib.sha256(
+        json.dumps(json_queries, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return f"{user_id}:{query_id}:{queries_hash}"
+
+
+def get_page(key, page, page_size, create_stream):
+    """Returns a page of a merged stream, the stream is kept to serve the
+    next pages and recreated when an earlier page is requested
+
+    Args:
+        key: identifies the stream (user, query, data sources and order)
+        page:
+        page_size:
+        create_stream: callable returning a new MergedStream
+
+    Returns:
+        the page and the stream
+    """
+    with _streams_lock:
+        stream = _streams.get(key)
+        if stream is None:
+            stream = create_stream()
+            _streams.set(key, stream, settings.EXPLORE_MERGED_STREAM_TTL)
+    with stream.lock:
+        if (page - 1) * page_size >= stream.position:
+            return stream.get_page(page, page_size), stream
+
+    # an earlier page is requested, start over
+    stream = create_stream()
+    with _streams_lock:
+        _streams.set(key, stream, settings.EXPLORE_MERGED_STREAM_TTL)
+    with stream.lock:
+        return stream.get_page(page, page_size), stream
+
+
+def clear():
+    """Forget all merged streams
+
+    Returns:
+
+    """
+    _streams.clear()
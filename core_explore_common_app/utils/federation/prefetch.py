@@ -0,0 +1,145 @@
+""" Background prefetch of the next results page of a data source
+"""
+import hashlib
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from core_explore_common_app import settings
+from core_explore_common_app.utils.cache.lru_cache import LRUCache
+from core_explore_common_app.utils.federation import fan_out
+
+logger = logging.getLogger(__name__)
+
+# staged pages are only read once, the LRU bound protects the memory
+_staged_pages = LRUCache(settings.EXPLORE_PREFETCH_QUEUE_SIZE * 4)
+
+_executor = None
+_executor_lock = threading.Lock()
+# pending prefetches: scope -> (key, future)
+_pending = dict()
+_lock = threading.Lock()
+
+
+def _get_executor():
+    """Returns the prefetch thread pool
+
+    Returns:
+
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.EXPLORE_PREFETCH_MAX_WORKERS,
+                thread_name_prefix="explore-prefetch",
+            )
+        return _executor
+
+
+def get_scope(user_id, query_id, data_source_index):
+    """Returns the scope of a prefetch: one pending prefetch per user, query
+    and data source
+
+    Args:
+        user_id:
+        query_id:
+        data_source_index:
+
+    Returns:
+
+    """
+    return f"{user_id}:{query_id}:{data_source_index}"
+
+
+def get_key(scope, json_query, page):
+    """Returns the key of a results page, changes with the query
+
+    Args:
+        scope:
+        json_query: serialized query, as returned by serialize_query
+        page:
+
+    Returns:
+
+    """
+    query_hash = hashlib.sha256(
+        json.dumps(json_query, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return f"{scope}:{page}:{query_hash}"
+
+
+def pop_staged(key):
+    """Returns a prefetched results page and removes it, None if missing
+
+    Args:
+        key:
+
+    Returns:
+
+    """
+    staged_page = _staged_pages.get(key)
+    if staged_page is not None:
+        _staged_pages.delete(key)
+    return staged_page
+
+
+def schedule(scope, key, task):
+    """Prefetch a results page in the background
+
+    A pending prefetch of the same scope for another page or query is
+    cancelled. Nothing is scheduled if too many prefetches are pending.
+
+    Args:
+        scope:
+        key:
+        task: callable without arguments returning the results page
+
+    Returns:
+
+    """
+    if not settings.EXPLORE_PREFETCH_ENABLED:
+        return
+
+    with _lock:
+        pending = _pending.get(scope)
+        if pending is not None:
+            if pending[0] == key:
+                return
+            # the query changed or the user moved elsewhere
+            pending[1].cancel()
+            del _pending[scope]
+        if len(_pending) >= settings.EXPLORE_PREFETCH_QUEUE_SIZE:
+            logger.debug("Prefetch queue is full, %s not prefetched.", key)
+            return
+        if _staged_pages.get(key) is not None:
+            return
+
+        def _prefetch():
+            try:
+                _staged_pages.set(key, task(), settings.EXPLORE_PREFETCH_TTL)
+            except Exception as exception:
+                logger.debug("Prefetch of %s failed: %s", key, str(exception))
+            finally:
+                with _lock:
+                    if _pending.get(scope, (None,))[0] == key:
+                        del _pending[scope]
+
+        future = next(
+            iter(fan_out.submit_all({key: _prefetch}, _get_executor()))
+        )
+        _pending[scope] = (key, future)
+
+
+def clear():
+    """Cancel pending prefetches and drop the staged pages
+
+    Returns:
+
+    """
+    with _lock:
+        for _, future in _pending.values():
+            future.cancel()
+        _pending.clear()
+    _staged_pages.clear()
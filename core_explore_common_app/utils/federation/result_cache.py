@@ -0,0 +1,120 @@
+""" Cache of remote result pages
+"""
+import hashlib
+import json
+
+from django.core.cache import caches
+
+from core_explore_common_app import settings
+from core_explore_common_app.utils.cache.lru_cache import LRUCache
+
+CACHE_KEY_PREFIX = "core_explore_common_app:result_page:"
+
+_local_cache = LRUCache(settings.EXPLORE_RESULT_CACHE_MAX_SIZE)
+
+
+def _canonicalize(value):
+    """Returns a canonical representation of a (possibly JSON encoded) value
+
+    Args:
+        value:
+
+    Returns:
+
+    """
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return value
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def get_cache_key(data_source, json_query, page):
+    """Returns the cache key of a result page
+
+    Args:
+        data_source:
+        json_query: serialized query, as returned by serialize_query
+        page:
+
+    Returns:
+
+    """
+    key = json.dumps(
+        [
+            data_source["url_query"],
+            {
+                field: _canonicalize(value)
+                for field, value in json_query.items()
+                if field != "order_by_field"
+            },
+            str(page),
+            _canonicalize(json_query.get("order_by_field", "")),
+        ],
+        sort_keys=True,
+    )
+    return CACHE_KEY_PREFIX + hashlib.sha256(key.encode()).hexdigest()
+
+
+def _get_backend():
+    """Returns the Django cache if configured, the in-process cache otherwise
+
+    Returns:
+
+    """
+    if settings.EXPLORE_RESULT_CACHE_BACKEND:
+        return caches[settings.EXPLORE_RESULT_CACHE_BACKEND]
+    return _local_cache
+
+
+def is_enabled():
+    """Check if remote result pages are cached
+
+    Returns:
+
+    """
+    return settings.EXPLORE_RESULT_CACHE_TTL > 0
+
+
+def get_result_page(cache_key):
+    """Returns a cached result page, None if not cached
+
+    Args:
+        cache_key:
+
+    Returns:
+
+    """
+    if not is_enabled():
+        return None
+    return _get_backend().get(cache_key)
+
+
+def set_result_page(cache_key, result_page, ttl=None):
+    """Cache a result page
+
+    Args:
+        cache_key:
+        result_page:
+        ttl: defaults to EXPLORE_RESULT_CACHE_TTL
+
+    Returns:
+
+    """
+    if not is_enabled():
+        return
+    _get_backend().set(
+        cache_key,
+        result_page,
+        ttl if ttl is not None else settings.EXPLORE_RESULT_CACHE_TTL,
+    )
+
+
+def clear():
+    """Clear the in-process cache
+
+    Returns:
+
+    """
+    _local_cache.clear()
@@ -0,0 +1,171 @@
+""" Retry of the queries sent to remote data sources
+
+Queries are read-only, so they can be sent again after a transient failure
+(dropped connection, peer restarting). Retries wait for a capped
+exponential backoff with full jitter, stay within the request deadline,
+and are limited by a retry budget per data source: each request earns a
+fraction of a retry, so retries never exceed a share of the traffic sent
+to a peer that is already struggling.
+"""
+import random
+import threading
+
+from core_explore_common_app import settings
+
+RETRYABLE_STATUS_CODES = (429, 502, 503, 504)
+
+_budgets = dict()
+_budgets_lock = threading.Lock()
+
+
+class RetryPolicy:
+    """Number of attempts and backoff of the retries of a data source"""
+
+    def __init__(self, max_attempts, base_delay, max_delay):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def get_delay(self, attempt):
+        """Returns the delay before the next attempt, with full jitter
+
+        Args:
+            attempt: number of attempts already made
+
+        Returns:
+
+        """
+        return random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        )
+
+
+class RetryBudget:
+    """Retries a data source can afford, earned by its requests"""
+
+    def __init__(self, ratio, max_tokens):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def record_request(self):
+        """Earn a fraction of a retry
+
+        Returns:
+
+        """
+        with self._lock:
+            self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self):
+        """Spend a retry if the budget allows it
+
+        Returns:
+
+        """
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+def get_policy(url_query):
+    """Returns the retry policy of a data source, the defaults overridden by
+    EXPLORE_RETRY_POLICIES
+
+    Args:
+        url_query:
+
+    Returns:
+
+    """
+    policy = settings.EXPLORE_RETRY_POLICIES.get(url_query, dict())
+    return RetryPolicy(
+        max_attempts=policy.get(
+            "max_attempts", settings.EXPLORE_RETRY_MAX_ATTEMPTS
+        ),
+        base_delay=policy.get("base_delay", settings.EXPLORE_RETRY_BASE_DELAY),
+        max_delay=policy.get("max_delay", settings.EXPLORE_RETRY_MAX_DELAY),
+    )
+
+
+def get_budget(url_query):
+    """Returns the retry budget of a data source, created if missing
+
+    Args:
+        url_query:
+
+    Returns:
+
+    """
+    with _budgets_lock:
+        budget = _budgets.get(url_query)
+        if budget is None:
+            budget = RetryBudget(
+                settings.EXPLORE_RETRY_BUDGET_RATIO,
+                settings.EXPLORE_RETRY_BUDGET_MAX,
+            )
+            _budgets[url_query] = budget
+        return budget
+
+
+def _parse_retry_after(retry_after):
+    """Returns the delay in seconds of a Retry-After header, None if absent
+    or not a number of seconds
+
+    Args:
+        retry_after:
+
+    Returns:
+
+    """
+    try:
+        return max(float(retry_after), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+def get_retry_delay(url_query, attempt, deadline=None, retry_after=None):
+    """Returns the delay before retrying a query, None if it must not be
+    retried
+
+    Args:
+        url_query:
+        attempt: number of attempts already made
+        deadline:
+        retry_after: Retry-After header of the failed response
+
+    Returns:
+
+    """
+    policy = get_policy(url_query)
+    if attempt >= policy.max_attempts:
+        return None
+
+    delay = policy.get_delay(attempt)
+    if retry_after is not None:
+        retry_after = _parse_retry_after(retry_after)
+        # the peer asks to wait longer than a retry is worth
+        if retry_after is None or retry_after > policy.max_delay:
+            return None
+        delay = retry_after
+
+    if deadline is not None and (
+        deadline.remaining() is not None and deadline.remaining() <= delay
+    ):
+        return None
+    if not get_budget(url_query).withdraw():
+        return None
+    return delay
+
+
+def clear():
+    """Reset the retry budgets
+
+    Returns:
+
+    """
+    with _budgets_lock:
+        _budgets.clear()
@@ -0,0 +1,55 @@
+""" Coalescing of identical in-flight calls
+
+The first caller of a key runs the call, callers of the same key arriving
+before it completes wait for its outcome instead of running it again.
+"""
+import threading
+from concurrent.futures import Future
+
+_calls = dict()
+_calls_lock = threading.Lock()
+
+
+def do(key, function, timeout=None):
+    """Run a function, or wait for the outcome of the identical call in
+    flight
+
+    Args:
+        key: identifies identical calls
+        function: callable without arguments
+        timeout: seconds a caller waits for the call in flight, raises
+            concurrent.futures.TimeoutError when exceeded
+
+    Returns:
+
+    """
+    with _calls_lock:
+        future = _calls.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            _calls[key] = future
+
+    if not is_leader:
+        return future.result(timeout=timeout)
+
+    try:
+        result = function()
+        future.set_result(result)
+        return result
+    except BaseException as exception:
+        future.set_exception(exception)
+        raise
+    finally:
+        with _calls_lock:
+            del _calls[key]
+
+
+def in_flight():
+    """Returns the number of calls in flight
+
+    Returns:
+
+    """
+    with _calls_lock:
+        return len(_calls)
@@ -0,0 +1,253 @@
+""" Process-wide store of the OAuth2 access tokens of remote instances
+
+Tokens are refreshed shortly before they expire, a single request refreshes
+the token of an instance while concurrent requests wait for its result.
+A token is only refreshed when the authentication params of its data source
+give the endpoint of the instance (its base url, with the path it is served
+under) and the refresh_token, client_id and client_secret. Otherwise the
+token of the data source is used as is.
+"""
+import datetime
+import logging
+import threading
+import time
+
+from django.utils.dateparse import parse_datetime
+
+from core_explore_common_app import settings
+from core_explore_common_app.utils.protocols import oauth2
+
+logger = logging.getLogger(__name__)
+
+_tokens = dict()
+_tokens_lock = threading.Lock()
+
+
+class _Token:
+    """OAuth2 token of a remote instance"""
+
+    def __init__(
+        self,
+        access_token,
+        refresh_token=None,
+        expires_at=None,
+        client_id=None,
+        client_secret=None,
+        endpoint=None,
+    ):
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.expires_at = expires_at
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.endpoint = endpoint
+        self.retry_at = 0
+        self.lock = threading.Lock()
+
+    def can_refresh(self):
+        """Check if the token can be refreshed
+
+        Returns:
+
+        """
+        return all(
+            (
+                self.refresh_token,
+                self.client_id,
+                self.client_secret,
+                self.endpoint,
+            )
+        )
+
+    def needs_refresh(self, now):
+        """Check if the token expires soon
+
+        Args:
+            now:
+
+        Returns:
+
+        """
+        return (
+            self.expires_at is not None
+            and self.expires_at - now <= settings.EXPLORE_TOKEN_REFRESH_MARGIN
+            and now >= self.retry_at
+        )
+
+
+def _to_timestamp(expires):
+    """Convert an expiration date (timestamp, datetime or ISO string) to a
+    timestamp
+
+    Args:
+        expires:
+
+    Returns:
+
+    """
+    if expires is None or isinstance(expires, (int, float)):
+        return expires
+    if isinstance(expires, str):
+        expires = parse_datetime(expires)
+        if expires is None:
+            return None
+    if isinstance(expires, datetime.datetime):
+        if expires.tzinfo is None:
+            expires = expires.replace(tzinfo=datetime.timezone.utc)
+        return expires.timestamp()
+    return None
+
+
+def _get_endpoint(data_source):
+    """Returns the endpoint of the remote instance of a data source, given
+    with its credentials, None if unknown
+
+    Args:
+        data_source:
+
+    Returns:
+
+    """
+    endpoint = data_source["authentication"]["params"].get("endpoint")
+    return endpoint.rstrip("/") if endpoint else None
+
+
+def get_instance_key(data_source):
+    """Returns the key of the remote instance of a data source: its endpoint,
+    the url of the query otherwise. Both keep their path, instances served
+    under different paths of a host do not share a token.
+
+    Args:
+        data_source:
+
+    Returns:
+
+    """
+    return _get_endpoint(data_source) or data_source["url_query"].rstrip("/")
+
+
+def _get_or_register(data_source):
+    """Returns the token of the data source instance, registers the token
+    copied in the data source if the instance is unknown
+
+    Args:
+        data_source:
+
+    Returns:
+
+    """
+    instance_key = get_instance_key(data_source)
+    params = data_source["authentication"]["params"]
+    with _tokens_lock:
+        token = _tokens.get(instance_key)
+        if token is None:
+            token = _Token(
+                params["access_token"],
+                refresh_token=params.get("refresh_token"),
+                expires_at=_to_timestamp(params.get("expires")),
+                client_id=params.get("client_id"),
+                client_secret=params.get("client_secret"),
+                endpoint=_get_endpoint(data_source),
+            )
+            _tokens[instance_key] = token
+        elif not token.can_refresh():
+            # the token can only be renewed by the owner of the data source
+            token.access_token = params["access_token"]
+        return token
+
+
+def _get_retry_at():
+    """Returns when a failed refresh can be attempted again
+
+    Returns:
+
+    """
+    return time.time() + settings.EXPLORE_TOKEN_REFRESH_MARGIN / 2
+
+
+def _refresh(token):
+    """Refresh a token (token lock held)
+
+    Args:
+        token:
+
+    Returns:
+
+    """
+    try:
+        response = oauth2.post_refresh_token(
+            token.endpoint,
+            token.client_id,
+            token.client_secret,
+            settings.EXPLORE_TOKEN_REQUEST_TIMEOUT,
+            token.refresh_token,
+        )
+        if response.status_code != 200:
+            logger.warning(
+                "Unable to refresh the token of %s (status code %s).",
+                token.endpoint,
+                str(response.status_code),
+            )
+            token.retry_at = _get_retry_at()
+            return
+        data = response.json()
+        token.access_token = data["access_token"]
+        token.refresh_token = data.get("refresh_token", token.refresh_token)
+        token.expires_at = (
+            time.time() + int(data["expires_in"])
+            if "expires_in" in data
+            else None
+        )
+        token.retry_at = 0
+    except Exception as exception:
+        logger.warning(
+            "Unable to refresh the token of %s: %s",
+            token.endpoint,
+            str(exception),
+        )
+        token.retry_at = _get_retry_at()
+
+
+def get_access_token(data_source):
+    """Returns a fresh access token for a remote data source
+
+    Args:
+        data_source:
+
+    Returns:
+
+    """
+    token = _get_or_register(data_source)
+    if token.can_refresh() and token.needs_refresh(time.time()):
+        with token.lock:
+            # another request may have refreshed the token meanwhile
+            if token.needs_refresh(time.time()):
+                _refresh(token)
+    return token.access_token
+
+
+def invalidate(data_source):
+    """Mark the token of a data source as expired, e.g. after a 401, so the
+    next request refreshes it
+
+    Args:
+        data_source:
+
+    Returns:
+
+    """
+    with _tokens_lock:
+        token = _tokens.get(get_instance_key(data_source))
+    if token is not None and token.can_refresh():
+        token.expires_at = 0
+        token.retry_at = 0
+
+
+def clear():
+    """Forget all tokens
+
+    Returns:
+
+    """
+    with _tokens_lock:
+        _tokens.clear()
@@ -0,0 +1,147 @@
+""" Compressed transport between federated instances
+
+Requests to remote instances accept every content encoding that urllib3
+decodes while streaming (gzip, deflate, and zstd or br when the optional
+modules are installed). Responses are compressed with zstd when the peer
+accepts it and zstandard is installed, with gzip otherwise.
+"""
+import re
+
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.decorators import decorator_from_middleware
+from urllib3.util.request import ACCEPT_ENCODING
+
+from core_explore_common_app import settings
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ZSTD_ENCODING = "zstd"
+re_accepts_zstd = re.compile(r"\bzstd\b")
+
+
+def get_accept_encoding():
+    """Returns the Accept-Encoding header sent to remote instances
+
+    Returns:
+
+    """
+    if not settings.EXPLORE_HTTP_COMPRESSION:
+        return "identity"
+    return ACCEPT_ENCODING
+
+
+def get_supported_encodings():
+    """Returns the encodings of the responses served by this instance
+
+    Returns:
+
+    """
+    encodings = ["gzip"]
+    if zstandard is not None:
+        encodings.insert(0, ZSTD_ENCODING)
+    return encodings
+
+
+def _accepts_zstd(request):
+    """Check if the peer accepts zstd and zstd is available
+
+    Args:
+        request:
+
+    Returns:
+
+    """
+    return zstandard is not None and bool(
+        re_accepts_zstd.search(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+    )
+
+
+def _compress_sequence(sequence):
+    """Compress a sequence of chunks with zstd, flushing after each chunk
+
+    Args:
+        sequence:
+
+    Returns:
+
+    """
+    compressor = zstandard.ZstdCompressor().compressobj()
+    for chunk in sequence:
+        data = compressor.compress(chunk) + compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def skip_compression(response):
+    """Mark a response not to be compressed, e.g. when its body is passed
+    through as received from a remote instance
+
+    Args:
+        response:
+
+    Returns:
+
+    """
+    response.skip_compression = True
+    return response
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """Compress responses with zstd or gzip, as accepted by the peer"""
+
+    def process_response(self, request, response):
+        """Compress the response
+
+        Args:
+            request:
+            response:
+
+        Returns:
+
+        """
+        if getattr(response, "skip_compression", False):
+            return response
+        if (
+            not _accepts_zstd(request)
+            or response.has_header("Content-Encoding")
+            or (response.streaming and response.is_async)
+        ):
+            return super().process_response(request, response)
+
+        # It's not worth attempting to compress really short responses.
+        if not response.streaming and len(response.content) < 200:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if response.streaming:
+            response.streaming_content = _compress_sequence(
+                response.streaming_content
+            )
+            del response.headers["Content-Length"]
+        else:
+            compressed_content = zstandard.ZstdCompressor().compress(
+                response.content
+            )
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response.headers["Content-Length"] = str(len(response.content))
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = ZSTD_ENCODING
+        return response
+
+
+compress_response = decorator_from_middleware(CompressionMiddleware)
+""" Decorator compressing the responses of a view, e.g. of the views
+executing local queries for remote instances.
+"""
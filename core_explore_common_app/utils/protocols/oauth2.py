@@ -1,29 +1,33 @@
 """ oauth2 utils
 """
 
-from core_main_app.utils.requests_utils import requests_utils
 from core_explore_common_app.commons.exceptions import (
     UsernamePasswordRequiredError,
 )
+from core_explore_common_app.utils.protocols import sessions
 
 HEADER = {"content-type": "application/x-www-form-urlencoded"}
 TOKEN_SUFFIX = "/o/token/"
 
 
-def send_get_request(url, access_token):
+def send_get_request(url, access_token, timeout=None):
     """Sends a GET request to an Oauth2 endpoint
 
     Args:
         url:
         access_token:
+        timeout:
 
     Returns:
 
     """
-    return requests_utils.send_get_request_with_access_token(url, access_token)
+    headers = {"Authorization": "Bearer " + access_token}
+    return sessions.get_session(url).get(url, headers=headers, timeout=timeout)
 
 
-def send_post_request(url, data, access_token, session_time_zone=None):
+def send_post_request(
+    url, data, access_token, session_time_zone=None, timeout=None, stream=False
+):
     """Sends a POST request to an Oauth2 endpoint
 
     Args:
@@ -31,6 +35,8 @@ def send_post_request(url, data, access_token, session_time_zone=None):
         data:
         access_token:
         session_time_zone:
+        timeout:
+        stream: read the response body lazily
 
     Returns:
 
@@ -41,7 +47,35 @@ def send_post_request(url, data, access_token, session_time_zone=None):
         "TZ": str(session_time_zone),
     }
     # post request
-    return requests_utils.send_post_request(url, data=data, headers=headers)
+    return sessions.get_session(url).post(
+        url, data=data, headers=headers, timeout=timeout, stream=stream
+    )
+
+
+def send_json_post_request(
+    url, data, access_token, session_time_zone=None, timeout=None
+):
+    """Sends a POST request with a JSON body to an Oauth2 endpoint
+
+    Args:
+        url:
+        data:
+        access_token:
+        session_time_zone:
+        timeout:
+
+    Returns:
+
+    """
+    # Builds header
+    headers = {
+        "Authorization": "Bearer " + access_token,
+        "TZ": str(session_time_zone),
+    }
+    # post request
+    return sessions.get_session(url).post(
+        url, json=data, headers=headers, timeout=timeout
+    )
 
 
 def post_request_token(
@@ -67,8 +101,8 @@ def post_request_token(
         client_id, client_secret, username=username, password=password
     )
 
-    return requests_utils.send_post_request(
-        url=token_url, data=data, headers=HEADER, timeout=int(timeout)
+    return sessions.get_session(token_url).post(
+        token_url, data=data, headers=HEADER, timeout=int(timeout)
     )
 
 
@@ -92,8 +126,8 @@ def post_refresh_token(url, client_id, client_secret, timeout, refresh_token):
         client_id, client_secret, refresh_token=refresh_token
     )
 
-    return requests_utils.send_post_request(
-        url=token_url, data=data, headers=HEADER, timeout=int(timeout)
+    return sessions.get_session(token_url).post(
+        token_url, data=data, headers=HEADER, timeout=int(timeout)
     )
 
 
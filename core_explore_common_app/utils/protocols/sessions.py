@@ -0,0 +1,101 @@
+""" Pooled keep-alive HTTP sessions, one per remote instance
+"""
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from core_explore_common_app import settings
+from core_explore_common_app.utils.protocols import compression
+from core_main_app.settings import SSL_CERTIFICATES_DIR
+
+_sessions = dict()
+_sessions_lock = threading.Lock()
+
+
+class _PooledSession:
+    """Session of a remote instance and the last time it was used"""
+
+    def __init__(self, session):
+        self.session = session
+        self.last_used = time.monotonic()
+
+
+def get_host_key(url):
+    """Returns the key of the connection pool serving the url
+
+    Args:
+        url:
+
+    Returns:
+
+    """
+    split_url = urlsplit(url)
+    return f"{split_url.scheme}://{split_url.netloc}"
+
+
+def _create_session():
+    """Create a keep-alive session with a bounded connection pool
+
+    Returns:
+
+    """
+    session = requests.Session()
+    session.verify = SSL_CERTIFICATES_DIR
+    # responses are decompressed while they are streamed
+    session.headers["Accept-Encoding"] = compression.get_accept_encoding()
+    adapter = HTTPAdapter(
+        pool_connections=1, pool_maxsize=settings.EXPLORE_HTTP_POOL_MAXSIZE
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _evict_idle_sessions(now):
+    """Close sessions that have not been used for a while (lock held)
+
+    Args:
+        now:
+
+    Returns:
+
+    """
+    idle_timeout = settings.EXPLORE_HTTP_SESSION_IDLE_TIMEOUT
+    for host_key in list(_sessions):
+        if now - _sessions[host_key].last_used > idle_timeout:
+            _sessions.pop(host_key).session.close()
+
+
+def get_session(url):
+    """Returns the pooled session of the remote instance serving the url
+
+    Args:
+        url:
+
+    Returns:
+
+    """
+    host_key = get_host_key(url)
+    now = time.monotonic()
+    with _sessions_lock:
+        _evict_idle_sessions(now)
+        pooled_session = _sessions.get(host_key)
+        if pooled_session is None:
+            pooled_session = _PooledSession(_create_session())
+            _sessions[host_key] = pooled_session
+        pooled_session.last_used = now
+        return pooled_session.session
+
+
+def close_all():
+    """Close all pooled sessions
+
+    Returns:
+
+    """
+    with _sessions_lock:
+        while _sessions:
+            _sessions.popitem()[1].session.close()
@@ -0,0 +1,160 @@
+""" Cache of the number of results of local queries
+
+Paginating local results counts the whole matching set on every page,
+while the count rarely changes between two pages. Counts are cached for a
+short time, per raw query and user. Each template has a generation,
+increased when one of its data is written, and the generations of the
+templates of a query are part of its key, so writes invalidate the counts
+of the queries on their templates. Queries that do not filter on
+templates depend on the generation of all data.
+"""
+import hashlib
+import json
+import threading
+
+from django.db.models.signals import post_delete, post_save
+
+from core_explore_common_app import settings
+from core_explore_common_app.utils.cache.lru_cache import LRUCache
+
+ALL_TEMPLATES = "*"
+
+_counts = LRUCache(settings.EXPLORE_COUNT_CACHE_MAX_SIZE)
+_generations = dict()
+_generations_lock = threading.Lock()
+
+
+def _get_template_ids(raw_query):
+    """Returns the ids of the templates a raw query filters on, None if it
+    does not filter on templates
+
+    Args:
+        raw_query:
+
+    Returns:
+
+    """
+    criteria = raw_query.get("$and", [raw_query])
+    for criterion in criteria:
+        template = (
+            criterion.get("template") if isinstance(criterion, dict) else None
+        )
+        if isinstance(template, dict) and isinstance(
+            template.get("$in"), list
+        ):
+            return sorted(str(template_id) for template_id in template["$in"])
+    return None
+
+
+def get_key(raw_query, user):
+    """Returns the key of the count of a raw query executed by a user
+
+    Args:
+        raw_query:
+        user:
+
+    Returns:
+
+    """
+    template_ids = _get_template_ids(raw_query)
+    with _generations_lock:
+        generations = [_generations.get(ALL_TEMPLATES, 0)]
+        if template_ids is not None:
+            generations = [
+                _generations.get(template_id, 0)
+                for template_id in template_ids
+            ]
+    key = json.dumps(
+        [raw_query, getattr(user, "id", None), generations],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def is_enabled():
+    """Check if counts are cached
+
+    Returns:
+
+    """
+    return settings.EXPLORE_COUNT_CACHE_TTL > 0
+
+
+def get_count(key):
+    """Returns a cached count, None if not cached
+
+    Args:
+        key:
+
+    Returns:
+
+    """
+    if not is_enabled():
+        return None
+    return _counts.get(key)
+
+
+def set_count(key, count):
+    """Cache a count
+
+    Args:
+        key:
+        count:
+
+    Returns:
+
+    """
+    if not is_enabled() or not isinstance(count, int):
+        return
+    _counts.set(key, count, settings.EXPLORE_COUNT_CACHE_TTL)
+
+
+def invalidate(template_id):
+    """Invalidate the counts of the queries on a template, and of the
+    queries on all templates
+
+    Args:
+        template_id:
+
+    Returns:
+
+    """
+    with _generations_lock:
+        for key in (str(template_id), ALL_TEMPLATES):
+            _generations[key] = _generations.get(key, 0) + 1
+
+
+def clear():
+    """Forget all counts
+
+    Returns:
+
+    """
+    _counts.clear()
+
+
+def _on_data_change(sender, instance, **kwargs):
+    """Invalidate the counts of the queries on the template of a data
+
+    Args:
+        sender:
+        instance:
+        kwargs:
+
+    Returns:
+
+    """
+    invalidate(instance.template_id)
+
+
+def init_signals():
+    """Invalidate the counts when a data is saved or deleted
+
+    Returns:
+
+    """
+    from core_main_app.components.data.models import Data
+
+    post_save.connect(_on_data_change, sender=Data)
+    post_delete.connect(_on_data_change, sender=Data)
@@ -0,0 +1,226 @@
+""" Keyset pagination of local results
+
+Offset pages get slower as users page deeper into a large collection, the
+database has to skip all the previous results. A cursor keeps the sorting
+values and id of the last result of a page, and the next page is fetched
+with a filter on these values, at the cost of the first page. Results are
+ordered by the sorting fields, with null values last, and by id, so every
+result has a single position.
+"""
+import base64
+import datetime
+import json
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.paginator import Page
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Q, QuerySet
+
+
+class _CursorEncoder(DjangoJSONEncoder):
+    """Encode the values of a cursor, dates and times keep their
+    microseconds so the position is exact"""
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.date, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+def is_supported(data_list, order_by_field):
+    """Check if keyset pagination can be used on the results of a query:
+    results of the database (not of the Mongo index), sorted by fields of
+    the model
+
+    Args:
+        data_list:
+        order_by_field:
+
+    Returns:
+
+    """
+    if not isinstance(data_list, QuerySet):
+        return False
+    try:
+        _get_fields(data_list.model, order_by_field)
+    except FieldDoesNotExist:
+        return False
+    return True
+
+
+def _get_fields(model, order_by_field):
+    """Returns the model fields and directions of the sorting fields
+
+    Args:
+        model:
+        order_by_field: list of fields, prefixed by "-" when descending
+
+    Returns:
+        list of (field, descending)
+    """
+    fields = list()
+    for name in order_by_field:
+        name = name.strip()
+        descending = name.startswith("-")
+        fields.append((model._meta.get_field(name.lstrip("+-")), descending))
+    return fields
+
+
+def order(data_list, order_by_field):
+    """Order the results by the sorting fields, null values last, then by id
+
+    Args:
+        data_list:
+        order_by_field:
+
+    Returns:
+
+    """
+    return data_list.order_by(
+        *[
+            F(field.attname).desc(nulls_last=True)
+            if descending
+            else F(field.attname).asc(nulls_last=True)
+            for field, descending in _get_fields(
+                data_list.model, order_by_field
+            )
+        ],
+        "pk",
+    )
+
+
+def _filter_after(data_list, order_by_field, values, pk):
+    """Returns the results after a position in the order
+
+    Args:
+        data_list:
+        order_by_field:
+        values: values of the sorting fields at the position
+        pk: id at the position
+
+    Returns:
+
+    """
+    after = Q()
+    equal = Q()
+    conditions = list()
+    for (field, descending), value in zip(
+        _get_fields(data_list.model, order_by_field), values
+    ):
+        name = field.attname
+        if value is None:
+            # null values are last, only the following fields can change
+            equal &= Q(**{f"{name}__isnull": True})
+            continue
+        lookup = "lt" if descending else "gt"
+        conditions.append(
+            equal
+            & (
+                Q(**{f"{name}__{lookup}": value})
+                | Q(**{f"{name}__isnull": True})
+            )
+        )
+        equal &= Q(**{name: value})
+    conditions.append(equal & Q(pk__gt=pk))
+    for condition in conditions:
+        after |= condition
+    return data_list.filter(after)
+
+
+def encode_cursor(order_by_field, result, number):
+    """Returns the cursor of the page following a result
+
+    Args:
+        order_by_field:
+        result: last result of a page
+        number: number of the next page
+
+    Returns:
+
+    """
+    values = [
+        getattr(result, field.attname)
+        for field, _ in _get_fields(type(result), order_by_field)
+    ]
+    cursor = json.dumps(
+        {"o": list(order_by_field), "v": values, "id": result.pk, "p": number},
+        cls=_CursorEncoder,
+    )
+    return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+
+def decode_cursor(cursor, data_list, order_by_field):
+    """Returns the position of a cursor, None if it is invalid or was created
+    for another order
+
+    Args:
+        cursor:
+        data_list:
+        order_by_field:
+
+    Returns:
+        the values of the sorting fields, the id and the page number
+    """
+    try:
+        cursor = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if cursor["o"] != list(order_by_field):
+            return None
+        fields = _get_fields(data_list.model, order_by_field)
+        if len(cursor["v"]) != len(fields):
+            return None
+        values = [
+            field.to_python(value) if value is not None else None
+            for (field, _), value in zip(fields, cursor["v"])
+        ]
+        return values, cursor["id"], int(cursor["p"])
+    except (
+        FieldDoesNotExist,
+        KeyError,
+        TypeError,
+        ValueError,
+        json.JSONDecodeError,
+    ):
+        return None
+
+
+def get_page(paginator, order_by_field, cursor):
+    """Returns the page at a cursor
+
+    Args:
+        paginator: paginator of the ordered results
+        order_by_field:
+        cursor:
+
+    Returns:
+        the page, None if the cursor is invalid
+    """
+    position = decode_cursor(cursor, paginator.object_list, order_by_field)
+    if position is None:
+        return None
+    values, pk, number = position
+    object_list = list(
+        _filter_after(paginator.object_list, order_by_field, values, pk)[
+            : paginator.per_page
+        ]
+    )
+    return Page(object_list, number, paginator)
+
+
+def set_next_cursor(page, order_by_field):
+    """Set the cursor of the next page on a page, None on the last page
+
+    Args:
+        page:
+        order_by_field:
+
+    Returns:
+
+    """
+    page.next_cursor = None
+    if page.has_next() and len(page.object_list) > 0:
+        page.next_cursor = encode_cursor(
+            order_by_field,
+            page.object_list[len(page.object_list) - 1],
+            page.number + 1,
+        )
+    return page
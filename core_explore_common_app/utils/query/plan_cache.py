@@ -0,0 +1,174 @@
+""" Cache of the raw queries built for local data
+
+Building a raw query parses the query, its templates and options, and runs
+the query builder. Paging through the results or sorting them again runs
+the same query, so the raw query is built once and reused. The raw query
+does not depend on the user, access control is applied when the query is
+executed, but public visibility includes the ids of the public
+workspaces. They are part of the key of these queries, so a workspace made
+public or private in any process is never served from a stale raw query.
+The cache is also cleared when a workspace changes in this process, to
+free the entries that can no longer be hit.
+"""
+import copy
+import hashlib
+import json
+
+from django.db.models.signals import post_delete, post_save
+
+from core_explore_common_app import settings
+from core_explore_common_app.utils.cache.lru_cache import LRUCache
+from core_main_app.components.workspace import api as workspace_api
+from core_main_app.utils.query.constants import (
+    VISIBILITY_OPTION,
+    VISIBILITY_PUBLIC,
+)
+
+_plans = LRUCache(settings.EXPLORE_QUERY_PLAN_CACHE_MAX_SIZE)
+
+
+def _canonicalize(value):
+    """Returns a canonical representation of a (possibly JSON encoded) value
+
+    Args:
+        value:
+
+    Returns:
+
+    """
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return value
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def _get_public_workspace_ids(options):
+    """Returns the ids of the public workspaces if the query is restricted to
+    public data, None otherwise
+
+    Args:
+        options:
+
+    Returns:
+
+    """
+    if isinstance(options, str):
+        try:
+            options = json.loads(options)
+        except ValueError:
+            return None
+    if not isinstance(options, dict) or (
+        options.get(VISIBILITY_OPTION) != VISIBILITY_PUBLIC
+    ):
+        return None
+    return sorted(
+        workspace_api.get_all_public_workspaces().values_list("id", flat=True)
+    )
+
+
+def get_key(query_data):
+    """Returns the fingerprint of the inputs of the raw query of a query: its
+    query, templates, options and title, and the public workspaces when it
+    is restricted to public data
+
+    Args:
+        query_data:
+
+    Returns:
+
+    """
+    key = json.dumps(
+        [
+            _canonicalize(query_data.get(field))
+            for field in ("query", "templates", "options", "title")
+        ]
+        + [_get_public_workspace_ids(query_data.get("options"))]
+    )
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def is_enabled():
+    """Check if raw queries are cached
+
+    Returns:
+
+    """
+    return settings.EXPLORE_QUERY_PLAN_CACHE_TTL > 0
+
+
+def get_raw_query(key):
+    """Returns a copy of a cached raw query, None if not cached
+
+    Args:
+        key:
+
+    Returns:
+
+    """
+    if not is_enabled():
+        return None
+    raw_query = _plans.get(key)
+    # the raw query is modified when executed
+    return copy.deepcopy(raw_query) if raw_query is not None else None
+
+
+def set_raw_query(key, raw_query):
+    """Cache a raw query
+
+    Args:
+        key:
+        raw_query:
+
+    Returns:
+
+    """
+    if not is_enabled():
+        return
+    _plans.set(
+        key, copy.deepcopy(raw_query), settings.EXPLORE_QUERY_PLAN_CACHE_TTL
+    )
+
+
+def get_stats():
+    """Returns the number of hits and misses of the cache, and its size
+
+    Returns:
+
+    """
+    return {"hits": _plans.hits, "misses": _plans.misses, "size": len(_plans)}
+
+
+def clear():
+    """Forget all raw queries and reset the statistics
+
+    Returns:
+
+    """
+    _plans.clear()
+
+
+def _on_workspace_change(sender, **kwargs):
+    """Forget the raw queries, they may filter on the public workspaces
+
+    Args:
+        sender:
+        kwargs:
+
+    Returns:
+
+    """
+    clear()
+
+
+def init_signals():
+    """Clear the cache when a workspace is saved or deleted
+
+    Returns:
+
+    """
+    from core_main_app.components.workspace.models import Workspace
+
+    post_save.connect(_on_workspace_change, sender=Workspace)
+    post_delete.connect(_on_workspace_change, sender=Workspace)
@@ -1,23 +1,57 @@
 """Explore Common query utils
 """
 
+import contextlib
+import functools
 import json
+import logging
+import time
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 
+from django import urls as django_urls
 from django.utils import timezone
-from requests import ConnectionError
+from requests import ConnectionError, Timeout
 
-from core_explore_common_app.commons.exceptions import ExploreRequestError
+from core_explore_common_app import settings
+from core_explore_common_app.commons.exceptions import (
+    DataSourceUnavailableError,
+    DeadlineExceededError,
+    ExploreRequestError,
+)
 from core_explore_common_app.components.abstract_query.models import (
     Authentication,
     DataSource,
 )
-from core_explore_common_app.constants import LOCAL_QUERY_NAME
-from core_explore_common_app.rest.result.serializers import ResultSerializer
-from core_explore_common_app.utils.protocols import oauth2
+from core_explore_common_app.constants import (
+    COUNT_ONLY_OPTION,
+    LOCAL_QUERY_NAME,
+)
+from core_explore_common_app.utils.federation import (
+    bulkhead,
+    capabilities,
+    circuit_breaker,
+    json_stream,
+    latency,
+    result_cache,
+    retry,
+    single_flight,
+    token_store,
+)
+from core_explore_common_app.utils.protocols import oauth2, sessions
+from core_explore_common_app.utils.result import (
+    validator as result_validator,
+)
 from core_main_app.settings import DATA_SORTING_FIELDS, SERVER_URI
+from core_main_app.utils.pagination.rest_framework_paginator.rest_framework_paginator import (
+    get_page_number,
+)
+
+logger = logging.getLogger(__name__)
 
 
-def send(request, json_query, data_source, page):
+def send(
+    request, json_query, data_source, page, deadline=None, count_only=False
+):
     """
 
     Args:
@@ -25,50 +59,696 @@ def send(request, json_query, data_source, page):
         json_query:
         data_source:
         page:
+        deadline:
+        count_only: only ask for the number of results. Peers ignoring the
+            option return a full page, which carries the count as well.
 
     Returns:
 
     """
+    if count_only:
+        json_query = dict(json_query, **{COUNT_ONLY_OPTION: True})
+        page = 1
     try:
-        # add page number to query url
-        query_url = f"{data_source['url_query']}/?page={page}"
-        # send query to data source
-        if data_source["authentication"]["auth_type"] == "oauth2":
-            response = oauth2.send_post_request(
-                query_url,
+        if data_source["authentication"]["auth_type"] != "oauth2":
+            raise ExploreRequestError("Unknown authentication type.")
+
+        # serve the page from cache if it was recently fetched
+        cache_key = result_cache.get_cache_key(data_source, json_query, page)
+        json_response = result_cache.get_result_page(cache_key)
+        if json_response is not None:
+            return json_response
+
+        # identical queries in flight share a single upstream request
+        return single_flight.do(
+            cache_key,
+            functools.partial(
+                _fetch_result_page,
                 json_query,
-                data_source["authentication"]["params"]["access_token"],
-                session_time_zone=timezone.get_current_timezone(),
+                data_source,
+                page,
+                deadline,
+                cache_key,
+            ),
+            timeout=deadline.remaining() if deadline is not None else None,
+        )
+    except FuturesTimeoutError:
+        # the identical query in flight did not complete in time
+        raise DeadlineExceededError(
+            f'Data source {data_source.get("name", "")} '
+            "did not answer in time."
+        )
+    except ExploreRequestError:
+        raise
+    except IndexError:
+        raise ExploreRequestError("The selected data source is not available.")
+    except ConnectionError:
+        raise ExploreRequestError("Unable to contact the remote server.")
+    except Exception as exception:
+        raise ExploreRequestError(str(exception))
+
+
+def is_pass_through_data_source(data_source):
+    """Check if the result pages of a data source are trusted and can be
+    passed through without being decoded and validated
+
+    Args:
+        data_source:
+
+    Returns:
+
+    """
+    return (
+        data_source["authentication"]["auth_type"] == "oauth2"
+        and data_source["url_query"]
+        in settings.EXPLORE_PASS_THROUGH_DATA_SOURCES
+    )
+
+
+def send_pass_through(request, json_query, data_source, page, deadline=None):
+    """Send the query to a trusted data source, and returns the raw body of
+    its result page. Only the urls of the previous and next pages are
+    replaced by page numbers, the results are passed through as received.
+
+    Args:
+        request:
+        json_query:
+        data_source:
+        page:
+        deadline:
+
+    Returns:
+        an iterable over the bytes of the result page, to be closed once
+        sent
+    """
+    try:
+        if not is_pass_through_data_source(data_source):
+            raise ExploreRequestError(
+                "The data source is not trusted for pass-through."
             )
-        else:
-            raise ExploreRequestError("Unknown authentication type.")
 
-        # if got a response from data source
-        if response.status_code == 200:
-            # transform response to json
-            json_response = response.json()
-            # Build serializer
-            results_serializer = ResultSerializer(
-                data=json_response["results"], many=True
+        if deadline is not None and deadline.expired():
+            raise DeadlineExceededError(
+                f'Data source {data_source.get("name", "")} '
+                "did not answer in time."
+            )
+        breaker = circuit_breaker.get_circuit_breaker(data_source["url_query"])
+        probe_token = breaker.allow_request()
+        if not probe_token:
+            raise DataSourceUnavailableError(
+                f'Data source {data_source.get("name", "")} '
+                "is temporarily unavailable."
             )
 
-            # Validate data
-            results_serializer.is_valid(raise_exception=True)
+        slot = contextlib.ExitStack()
+        try:
+            # adapt the query to what the instance supports
+            json_query = capabilities.adapt_query(
+                json_query,
+                capabilities.get_capabilities(data_source, deadline),
+            )
+            if json_query is None:
+                # the instance has none of the templates of the query
+                return iter(
+                    [
+                        b'{"count": 0, "next": null, "previous": null, "results": []}'
+                    ]
+                )
+
+            # the slot is held until the body is sent
+            slot.enter_context(
+                bulkhead.slot(data_source["url_query"], deadline)
+            )
+            response = _send_with_retries(
+                json_query, data_source, page, deadline, breaker
+            )
+            if response.status_code != 200:
+                response.close()
+                raise ExploreRequestError(
+                    f'Data source {data_source["name"]} '
+                    f"responded with status code {str(response.status_code)}."
+                )
+            return _ResponseBody(response, slot.pop_all())
+        finally:
+            slot.close()
+            # the query may end before its outcome is recorded
+            breaker.release_probe(probe_token)
+    except ExploreRequestError:
+        raise
+    except ConnectionError:
+        raise ExploreRequestError("Unable to contact the remote server.")
+    except Exception as exception:
+        raise ExploreRequestError(str(exception))
+
 
+class _ResponseBody:
+    """Chunks of the body of a response, closed by the streaming response
+    that sends them"""
+
+    def __init__(self, response, slot=None):
+        self._response = response
+        self._slot = slot
+
+    def __iter__(self):
+        try:
+            yield from json_stream.rewrite_metadata(
+                self._response.iter_content(
+                    settings.EXPLORE_STREAM_CHUNK_SIZE
+                ),
+                _get_page_numbers,
+            )
+        finally:
+            self.close()
+
+    def close(self):
+        """Release the connection to the pool, and the bulkhead slot
+
+        Returns:
+
+        """
+        try:
+            self._response.close()
+        finally:
+            if self._slot is not None:
+                self._slot.close()
+
+
+def _get_page_numbers(metadata):
+    """Replace the urls of the previous and next pages of a result page by
+    their page numbers
+
+    Args:
+        metadata:
+
+    Returns:
+
+    """
+    return dict(
+        metadata,
+        **{
+            key: get_page_number(metadata[key])
+            for key in ("next", "previous")
+            if key in metadata
+        },
+    )
+
+
+def _fetch_result_page(json_query, data_source, page, deadline, cache_key):
+    """Send the query to the data source and cache the result page
+
+    Args:
+        json_query:
+        data_source:
+        page:
+        deadline:
+        cache_key:
+
+    Returns:
+
+    """
+    if deadline is not None and deadline.expired():
+        raise DeadlineExceededError(
+            f'Data source {data_source.get("name", "")} '
+            "did not answer in time."
+        )
+
+    # fail fast if the data source is known to be unavailable
+    breaker = circuit_breaker.get_circuit_breaker(data_source["url_query"])
+    probe_token = breaker.allow_request()
+    if not probe_token:
+        raise DataSourceUnavailableError(
+            f'Data source {data_source.get("name", "")} '
+            "is temporarily unavailable."
+        )
+
+    try:
+        # adapt the query to what the instance supports
+        json_query = capabilities.adapt_query(
+            json_query, capabilities.get_capabilities(data_source, deadline)
+        )
+        if json_query is None:
+            # the instance has none of the templates of the query
+            json_response = {
+                "count": 0,
+                "next": None,
+                "previous": None,
+                "results": [],
+            }
+            result_cache.set_result_page(cache_key, json_response)
             return json_response
 
+        # the slot is held until the body is parsed, slow bodies count
+        # against the limits of concurrent queries
+        with bulkhead.slot(data_source["url_query"], deadline):
+            response = _send_with_retries(
+                json_query, data_source, page, deadline, breaker
+            )
+
+            # if got a response from data source
+            if response.status_code == 200:
+                json_response = _parse_result_page(response)
+                result_cache.set_result_page(cache_key, json_response)
+                return json_response
+
+        response.close()
         raise ExploreRequestError(
             f'Data source {data_source["name"]} '
             f"responded with status code {str(response.status_code)}."
         )
-    except IndexError:
-        raise ExploreRequestError("The selected data source is not available.")
+    finally:
+        # the query may end before its outcome is recorded
+        breaker.release_probe(probe_token)
+
+
+def _send_with_retries(json_query, data_source, page, deadline, breaker):
+    """Send the query to the data source, retried after transient failures
+
+    Args:
+        json_query:
+        data_source:
+        page:
+        deadline:
+        breaker: circuit breaker of the data source
+
+    Returns:
+
+    """
+    # transient failures are retried, queries are read-only
+    attempt = 1
+    while True:
+        retry_after = None
+        error = None
+        try:
+            response = _post_query(
+                json_query, data_source, page, deadline, breaker
+            )
+            if response.status_code not in retry.RETRYABLE_STATUS_CODES:
+                break
+            retry_after = response.headers.get("Retry-After")
+        except ConnectionError as exception:
+            response = None
+            error = exception
+
+        # retries never take the probe of a half-open circuit
+        delay = (
+            retry.get_retry_delay(
+                data_source["url_query"], attempt, deadline, retry_after
+            )
+            if breaker.state == circuit_breaker.CLOSED
+            else None
+        )
+        if delay is None:
+            if error is not None:
+                raise error
+            break
+        if response is not None:
+            response.close()
+        logger.info(
+            "Retrying the query to %s in %.2fs (attempt %d).",
+            data_source["url_query"],
+            delay,
+            attempt + 1,
+        )
+        time.sleep(delay)
+        attempt += 1
+
+    return response
+
+
+def _post_query(json_query, data_source, page, deadline, breaker):
+    """Send the query to the data source once
+
+    Args:
+        json_query:
+        data_source:
+        page:
+        deadline:
+        breaker: circuit breaker of the data source
+
+    Returns:
+
+    """
+    # add page number to query url
+    query_url = f"{data_source['url_query']}/?page={page}"
+    adaptive_timeout = latency.get_timeout(data_source["url_query"])
+    timeout = _get_timeout(adaptive_timeout, deadline)
+    access_token = token_store.get_access_token(data_source)
+    retry.get_budget(data_source["url_query"]).record_request()
+    # send query to data source
+    start_time = time.monotonic()
+    try:
+        response = oauth2.send_post_request(
+            query_url,
+            json_query,
+            access_token,
+            session_time_zone=timezone.get_current_timezone(),
+            timeout=timeout,
+            stream=settings.EXPLORE_STREAM_RESULTS,
+        )
+    except Timeout:
+        # count the timeout as a response time, so the timeout of a data
+        # source that became slower can grow again
+        if timeout is not None and timeout == adaptive_timeout:
+            latency.record(data_source["url_query"], timeout)
+        breaker.record_failure()
+        raise DeadlineExceededError(
+            f'Data source {data_source.get("name", "")} '
+            "did not answer in time."
+        )
+    except Exception:
+        breaker.record_failure()
+        raise
+
+    latency.record(data_source["url_query"], time.monotonic() - start_time)
+
+    # the token was revoked or expired early, refresh it next time
+    if response.status_code == 401:
+        token_store.invalidate(data_source)
+
+    # server errors count as failures of the data source
+    if response.status_code >= 500:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    return response
+
+
+def _get_timeout(adaptive_timeout, deadline):
+    """Returns the timeout of a request to a data source: its adaptive
+    timeout, within the remaining time of the deadline
+
+    Args:
+        adaptive_timeout:
+        deadline:
+
+    Returns:
+
+    """
+    timeouts = [
+        timeout
+        for timeout in (
+            adaptive_timeout,
+            deadline.remaining() if deadline is not None else None,
+        )
+        if timeout is not None
+    ]
+    return min(timeouts) if timeouts else None
+
+
+def _parse_result_page(response):
+    """Parse and validate the result page returned by a data source
+
+    When streaming, results are parsed and validated one at a time while the
+    body is read, so the raw body and its decoded copy are never held in
+    memory.
+
+    Args:
+        response:
+
+    Returns:
+
+    """
+    if not settings.EXPLORE_STREAM_RESULTS:
+        json_response = response.json()
+        # Validate data
+        result_validator.validate_results(json_response["results"])
+        return json_response
+
+    try:
+        result_page_stream = json_stream.ResultPageStream(
+            response.iter_content(settings.EXPLORE_STREAM_CHUNK_SIZE)
+        )
+        results = list()
+        for result in result_page_stream:
+            # Validate data
+            result_validator.validate_result(result)
+            results.append(result)
+    finally:
+        # release the connection to the pool
+        response.close()
+    json_response = result_page_stream.metadata
+    json_response["results"] = results
+    return json_response
+
+
+def send_batch(request, queries, data_source, deadline=None):
+    """Send several queries to a data source, in a single request when the
+    instance supports batches
+
+    Args:
+        request:
+        queries: list of (json_query, page)
+        data_source:
+        deadline:
+
+    Returns:
+        a (result page, error) pair per query, in the order of the queries
+    """
+    try:
+        if data_source["authentication"]["auth_type"] != "oauth2":
+            raise ExploreRequestError("Unknown authentication type.")
+
+        responses = [None] * len(queries)
+        cache_keys = [
+            result_cache.get_cache_key(data_source, json_query, page)
+            for json_query, page in queries
+        ]
+        # serve the pages from cache if they were recently fetched
+        pending = list()
+        for index, cache_key in enumerate(cache_keys):
+            json_response = result_cache.get_result_page(cache_key)
+            if json_response is not None:
+                responses[index] = (json_response, None)
+            else:
+                pending.append(index)
+        if not pending:
+            return responses
+
+        max_queries = capabilities.get_capabilities(data_source, deadline).get(
+            "batch"
+        )
+        if not max_queries or len(pending) == 1:
+            # the instance does not support batches
+            for index in pending:
+                json_query, page = queries[index]
+                try:
+                    responses[index] = (
+                        send(request, json_query, data_source, page, deadline),
+                        None,
+                    )
+                except ExploreRequestError as exception:
+                    responses[index] = (None, exception)
+            return responses
+
+        for start in range(0, len(pending), max_queries):
+            indexes = pending[start : start + max_queries]
+            batch_responses = _fetch_batch(
+                [queries[index] for index in indexes],
+                data_source,
+                deadline,
+                [cache_keys[index] for index in indexes],
+            )
+            for index, response in zip(indexes, batch_responses):
+                responses[index] = response
+        return responses
+    except ExploreRequestError:
+        raise
     except ConnectionError:
         raise ExploreRequestError("Unable to contact the remote server.")
     except Exception as exception:
         raise ExploreRequestError(str(exception))
 
 
+def send_with_next_page(request, json_query, data_source, page, deadline=None):
+    """Send a query, and ask for the next page in the same request when the
+    instance supports batches. The next page is then served from the result
+    cache.
+
+    Args:
+        request:
+        json_query:
+        data_source:
+        page:
+        deadline:
+
+    Returns:
+
+    """
+    if not capabilities.get_cached_capabilities(data_source).get(
+        "batch"
+    ) or result_cache.get_result_page(
+        result_cache.get_cache_key(data_source, json_query, page)
+    ):
+        # fetching the next page alone would delay this one
+        return send(request, json_query, data_source, page, deadline)
+
+    (json_response, error), _ = send_batch(
+        request,
+        [(json_query, page), (json_query, page + 1)],
+        data_source,
+        deadline,
+    )
+    if error is not None:
+        raise error
+    return json_response
+
+
+def _get_batch_url(data_source):
+    """Returns the url of the batch query endpoint of a remote instance
+
+    Args:
+        data_source:
+
+    Returns:
+
+    """
+    path = settings.EXPLORE_BATCH_PATH or django_urls.reverse(
+        "core_explore_common_app_batch_query"
+    )
+    return sessions.get_host_key(data_source["url_query"]) + path
+
+
+def _fetch_batch(queries, data_source, deadline, cache_keys):
+    """Send a batch of queries to the data source and cache the result pages
+
+    Args:
+        queries: list of (json_query, page)
+        data_source:
+        deadline:
+        cache_keys:
+
+    Returns:
+        a (result page, error) pair per query
+    """
+    if deadline is not None and deadline.expired():
+        raise DeadlineExceededError(
+            f'Data source {data_source.get("name", "")} '
+            "did not answer in time."
+        )
+    breaker = circuit_breaker.get_circuit_breaker(data_source["url_query"])
+    probe_token = breaker.allow_request()
+    if not probe_token:
+        raise DataSourceUnavailableError(
+            f'Data source {data_source.get("name", "")} '
+            "is temporarily unavailable."
+        )
+    try:
+        return _send_batch_request(
+            queries, data_source, deadline, cache_keys, breaker
+        )
+    finally:
+        # the batch may end before its outcome is recorded
+        breaker.release_probe(probe_token)
+
+
+def _send_batch_request(queries, data_source, deadline, cache_keys, breaker):
+    """Send a batch of queries to the data source, once the circuit breaker
+    let it through
+
+    Args:
+        queries: list of (json_query, page)
+        data_source:
+        deadline:
+        cache_keys:
+        breaker: circuit breaker of the data source
+
+    Returns:
+        a (result page, error) pair per query
+    """
+    # adapt the queries to what the instance supports
+    instance_capabilities = capabilities.get_cached_capabilities(data_source)
+    responses = [None] * len(queries)
+    batch = list()
+    for index, (json_query, page) in enumerate(queries):
+        json_query = capabilities.adapt_query(
+            json_query, instance_capabilities
+        )
+        if json_query is None:
+            # the instance has none of the templates of the query
+            responses[index] = (
+                {"count": 0, "next": None, "previous": None, "results": []},
+                None,
+            )
+        else:
+            batch.append({"id": str(index), "query": json_query, "page": page})
+    if not batch:
+        return responses
+
+    access_token = token_store.get_access_token(data_source)
+    # the slot is held until the body is decoded
+    with bulkhead.slot(data_source["url_query"], deadline):
+        try:
+            response = oauth2.send_json_post_request(
+                _get_batch_url(data_source),
+                {"queries": batch},
+                access_token,
+                session_time_zone=timezone.get_current_timezone(),
+                timeout=_get_timeout(None, deadline),
+            )
+        except Timeout:
+            breaker.record_failure()
+            raise DeadlineExceededError(
+                f'Data source {data_source.get("name", "")} '
+                "did not answer in time."
+            )
+        except Exception:
+            breaker.record_failure()
+            raise
+
+        if response.status_code == 401:
+            token_store.invalidate(data_source)
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        if response.status_code != 200:
+            raise ExploreRequestError(
+                f'Data source {data_source["name"]} '
+                f"responded with status code {str(response.status_code)}."
+            )
+        items = response.json()["responses"]
+
+    for item in items:
+        index = int(item["id"])
+        if item["status"] != 200:
+            responses[index] = (
+                None,
+                ExploreRequestError(
+                    f'Data source {data_source["name"]} '
+                    f'responded with status code {str(item["status"])}: '
+                    f'{item.get("message", "")}'
+                ),
+            )
+            continue
+        json_response = {
+            "count": item["count"],
+            "next": item["next"],
+            "previous": item["previous"],
+            "results": item["results"],
+        }
+        try:
+            # Validate data
+            result_validator.validate_results(json_response["results"])
+        except Exception as exception:
+            responses[index] = (None, ExploreRequestError(str(exception)))
+            continue
+        result_cache.set_result_page(cache_keys[index], json_response)
+        responses[index] = (json_response, None)
+
+    # queries left out of the response
+    return [
+        response
+        if response is not None
+        else (
+            None,
+            ExploreRequestError(
+                f'Data source {data_source["name"]} did not answer the query.'
+            ),
+        )
+        for response in responses
+    ]
+
+
 def create_local_data_source(request):
     """Create local datasource
 
@@ -0,0 +1,92 @@
+"""De-duplication of the results returned by several data sources
+"""
+import hashlib
+import re
+
+# whitespaces between tags are not significant in the content of a result
+_WHITESPACE_BETWEEN_TAGS = re.compile(r">\s+<")
+
+
+def _get_field(result, name):
+    """Returns a field of a result (dict or Result)
+
+    Args:
+        result:
+        name:
+
+    Returns:
+
+    """
+    if isinstance(result, dict):
+        return result.get(name)
+    return getattr(result, name, None)
+
+
+def normalize_content(content):
+    """Returns the content of a result without insignificant whitespaces
+
+    Args:
+        content:
+
+    Returns:
+
+    """
+    content = _WHITESPACE_BETWEEN_TAGS.sub("><", content.strip())
+    return " ".join(content.split())
+
+
+def get_fingerprint(result):
+    """Returns a 64-bit fingerprint of a result, from its template hash and
+    its normalized content
+
+    Args:
+        result:
+
+    Returns:
+
+    """
+    template_info = _get_field(result, "template_info") or {}
+    fingerprint = hashlib.blake2b(digest_size=8)
+    fingerprint.update(str(template_info.get("hash", "")).encode())
+    fingerprint.update(b"\x00")
+    fingerprint.update(
+        normalize_content(_get_field(result, "content") or "").encode()
+    )
+    return int.from_bytes(fingerprint.digest(), "big")
+
+
+class Deduplicator:
+    """Drop the results already seen, only their fingerprints are kept"""
+
+    def __init__(self):
+        self._fingerprints = set()
+        self.duplicate_count = 0
+
+    def is_duplicate(self, result):
+        """Check if a result was already seen, remembers it otherwise
+
+        Args:
+            result:
+
+        Returns:
+
+        """
+        fingerprint = get_fingerprint(result)
+        if fingerprint in self._fingerprints:
+            self.duplicate_count += 1
+            return True
+        self._fingerprints.add(fingerprint)
+        return False
+
+    def filter(self, results):
+        """Yield the results not seen yet
+
+        Args:
+            results: iterable of results
+
+        Returns:
+
+        """
+        for result in results:
+            if not self.is_duplicate(result):
+                yield result
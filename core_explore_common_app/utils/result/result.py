@@ -7,6 +7,10 @@ from core_explore_common_app.rest.result.serializers import (
     ResultSerializer,
     ResultBaseSerializer,
 )
+from core_main_app.access_control import api as access_control_api
+from core_main_app.access_control.exceptions import AccessControlError
+from core_main_app.components.data.models import Data
+from core_main_app.components.workspace import api as workspace_api
 
 
 def get_template_info(template, include_template_id=True):
@@ -30,6 +34,54 @@ def get_template_info(template, include_template_id=True):
     return return_value
 
 
+def get_readable_blob_ids(data_ids, user):
+    """Returns the ids of the blobs attached to a list of data, when the user
+    can read them, in a single query
+
+    Applies the rules of Data.blob (see can_read_blob) to all the data at
+    once: the user reads its own blobs and the blobs of the workspaces it
+    can read.
+
+    Args:
+        data_ids:
+        user:
+
+    Returns:
+        dict of blob ids, by data id
+    """
+    if not data_ids:
+        return dict()
+    blobs = Data.objects.filter(
+        pk__in=data_ids, _blob__isnull=False
+    ).values_list("id", "_blob_id", "_blob__user_id", "_blob__workspace_id")
+    if user.is_superuser:
+        return {data_id: blob_id for data_id, blob_id, _, _ in blobs}
+
+    try:
+        access_control_api.check_anonymous_access(user)
+    except AccessControlError:
+        return dict()
+
+    blob_ids = dict()
+    accessible_workspace_ids = None
+    for data_id, blob_id, blob_user_id, blob_workspace_id in blobs:
+        if str(blob_user_id) != str(user.id):
+            if blob_workspace_id is None:
+                continue
+            # only evaluated once, when a blob of another user is found
+            if accessible_workspace_ids is None:
+                accessible_workspace_ids = {
+                    workspace.id
+                    for workspace in workspace_api.get_all_workspaces_with_read_access_by_user(
+                        user
+                    )
+                }
+            if blob_workspace_id not in accessible_workspace_ids:
+                continue
+        blob_ids[data_id] = blob_id
+    return blob_ids
+
+
 def get_result_from_rest_data_response(response):
     """Returns result object from data rest response
 
@@ -0,0 +1,200 @@
+"""Fast validation of the results returned by remote data sources
+"""
+import re
+
+from django.core.validators import (
+    MaxLengthValidator,
+    ProhibitNullCharactersValidator,
+)
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import CharField, JSONField, empty
+from rest_framework.validators import ProhibitSurrogateCharactersValidator
+
+from core_explore_common_app import settings
+from core_explore_common_app.rest.result.serializers import ResultSerializer
+
+# characters rejected by ProhibitSurrogateCharactersValidator
+_SURROGATES = re.compile("[\ud800-\udfff]")
+_CHAR_FIELD_VALIDATORS = (
+    MaxLengthValidator,
+    ProhibitNullCharactersValidator,
+    ProhibitSurrogateCharactersValidator,
+)
+
+
+class ResultValidator:
+    """Validate results against the fields of a serializer
+
+    The serializer fields are built once. Each result is checked by a fast
+    path that only accepts values the serializer would accept; anything else
+    is validated by the serializer itself, so errors are the same.
+    """
+
+    def __init__(self, serializer_class=ResultSerializer):
+        self.serializer_class = serializer_class
+        self._checks = [
+            (name, self._compile(field))
+            for name, field in serializer_class().fields.items()
+            if not field.read_only
+        ]
+
+    @staticmethod
+    def _compile(field):
+        """Returns a function checking a value quickly, True if it is valid,
+        False if it has to be validated by the serializer
+
+        Args:
+            field:
+
+        Returns:
+
+        """
+
+        def _check_empty(value):
+            if value is empty:
+                return not field.required
+            if value is None:
+                return field.allow_null
+            return None
+
+        if isinstance(field, CharField) and all(
+            isinstance(validator, _CHAR_FIELD_VALIDATORS)
+            for validator in field.validators
+        ):
+
+            def _check_char_field(value):
+                is_valid = _check_empty(value)
+                if is_valid is not None:
+                    return is_valid
+                if type(value) is not str:
+                    return False
+                if not field.allow_blank and (
+                    not value or (field.trim_whitespace and value.isspace())
+                ):
+                    return False
+                # stripping can only shorten the value, avoid copying it
+                if field.max_length is not None and len(value) > (
+                    field.max_length
+                ):
+                    stripped_value = (
+                        value.strip() if field.trim_whitespace else value
+                    )
+                    if len(stripped_value) > field.max_length:
+                        return False
+                if "\x00" in value:
+                    return False
+                # ASCII strings cannot contain surrogates
+                return value.isascii() or _SURROGATES.search(value) is None
+
+            return _check_char_field
+
+        if isinstance(field, JSONField) and not field.validators:
+
+            def _check_json_field(value):
+                is_valid = _check_empty(value)
+                if is_valid is not None:
+                    return is_valid
+                # values were decoded from JSON, they can be encoded back
+                return type(value) in (dict, list, str, int, float, bool)
+
+            return _check_json_field
+
+        def _check_field(value):
+            is_valid = _check_empty(value)
+            if is_valid is not None:
+                return is_valid
+            try:
+                field.run_validation(value)
+                return True
+            except ValidationError:
+                return False
+
+        return _check_field
+
+    def is_valid(self, data):
+        """Check if a result is valid using the fast path only
+
+        Args:
+            data:
+
+        Returns:
+
+        """
+        if type(data) is not dict:
+            return False
+        return all(
+            check(data.get(name, empty)) for name, check in self._checks
+        )
+
+    def validate(self, data):
+        """Validate a result, raises the serializer ValidationError
+
+        Args:
+            data:
+
+        Returns:
+
+        """
+        if not self.is_valid(data):
+            self.serializer_class(data=data).is_valid(raise_exception=True)
+
+    def validate_many(self, data):
+        """Validate a list of results, raises the serializer ValidationError
+
+        Args:
+            data:
+
+        Returns:
+
+        """
+        if type(data) is not list or not all(
+            self.is_valid(result) for result in data
+        ):
+            self.serializer_class(data=data, many=True).is_valid(
+                raise_exception=True
+            )
+
+
+_result_validator = None
+
+
+def get_result_validator():
+    """Returns the validator of remote results
+
+    Returns:
+
+    """
+    global _result_validator
+    if _result_validator is None:
+        _result_validator = ResultValidator()
+    return _result_validator
+
+
+def validate_result(data):
+    """Validate a remote result, with the serializer in strict mode
+
+    Args:
+        data:
+
+    Returns:
+
+    """
+    if settings.EXPLORE_STRICT_RESULT_VALIDATION:
+        ResultSerializer(data=data).is_valid(raise_exception=True)
+    else:
+        get_result_validator().validate(data)
+
+
+def validate_results(data):
+    """Validate a list of remote results, with the serializer in strict mode
+
+    Args:
+        data:
+
+    Returns:
+
+    """
+    if settings.EXPLORE_STRICT_RESULT_VALIDATION:
+        ResultSerializer(data=data, many=True).is_valid(raise_exception=True)
+    else:
+        get_result_validator().validate_many(data)
@@ -1,5 +1,6 @@
 """AJAX Explore common user views
 """
+import functools
 import json
 import math
 from abc import ABCMeta, abstractmethod
@@ -7,7 +8,11 @@ from os.path import join
 
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import EmptyPage
-from django.http.response import HttpResponse, HttpResponseBadRequest
+from django.http.response import (
+    HttpResponse,
+    HttpResponseBadRequest,
+    StreamingHttpResponse,
+)
 from django.shortcuts import render as django_render
 from django.template import loader
 from django.urls import reverse
@@ -16,7 +21,10 @@ from django.utils.html import escape
 from django.views import View
 
 from core_explore_common_app import settings
-from core_explore_common_app.commons.exceptions import ExploreRequestError
+from core_explore_common_app.commons.exceptions import (
+    DeadlineExceededError,
+    ExploreRequestError,
+)
 from core_explore_common_app.components.abstract_persistent_query import (
     api as abstract_persistent_query_api,
 )
@@ -24,15 +32,38 @@ from core_explore_common_app.components.abstract_persistent_query.models import
     AbstractPersistentQuery,
 )
 from core_explore_common_app.components.query import api as query_api
+from core_explore_common_app.components.result.models import Result
 from core_explore_common_app.constants import LOCAL_QUERY_NAME
 from core_explore_common_app.rest.query import views as query_views
+from core_explore_common_app.rest.result.serializers import ResultSerializer
+from core_explore_common_app.utils.federation import (
+    capabilities as capabilities_utils,
+)
+from core_explore_common_app.utils.federation import circuit_breaker
+from core_explore_common_app.utils.federation import (
+    deadline as deadline_utils,
+)
+from core_explore_common_app.utils.federation import (
+    fan_out as fan_out_utils,
+)
+from core_explore_common_app.utils.federation import merge as merge_utils
+from core_explore_common_app.utils.federation import (
+    prefetch as prefetch_utils,
+)
 from core_explore_common_app.utils.oaipmh import oaipmh as oaipmh_utils
+from core_explore_common_app.utils.protocols.compression import (
+    compress_response,
+    skip_compression,
+)
 from core_explore_common_app.utils.query import query as query_utils
+from core_explore_common_app.utils.result import result as result_utils
 from core_explore_common_app.access_control import (
     api as explore_common_acl_api,
 )
 from core_main_app.access_control.decorators import access_control
+from core_main_app.access_control.exceptions import AccessControlError
 from core_main_app.commons.exceptions import DoesNotExist
+from core_main_app.components.data import api as data_api
 from core_main_app.settings import SERVER_URI, BOOTSTRAP_VERSION
 from core_main_app.utils.pagination.rest_framework_paginator.rest_framework_paginator import (
     get_page_number,
@@ -158,7 +189,18 @@ def get_data_sources_html(request):
             "default_date_toggle_value": settings.DEFAULT_DATE_TOGGLE_VALUE,
             "BOOTSTRAP_VERSION": BOOTSTRAP_VERSION,
         }
-        context.update({"query": query})
+        context.update(
+            {
+                "query": query,
+                "unavailable_data_sources": [
+                    data_source["url_query"]
+                    for data_source in query.data_sources
+                    if not circuit_breaker.is_available(
+                        data_source["url_query"]
+                    )
+                ],
+            }
+        )
 
         # render html results
         html_template = loader.get_template(
@@ -181,6 +223,7 @@ def get_data_sources_html(request):
         return HttpResponseBadRequest(escape(str(exception)))
 
 
+@compress_response
 @access_control(explore_common_acl_api.can_access_explore_views)
 def get_data_source_results(request, query_id, data_source_index, page=1):
     """Gets results from a data source
@@ -195,137 +238,767 @@ def get_data_source_results(request, query_id, data_source_index, page=1):
 
     """
 
+    try:
+        # get query
+        query = query_api.get_by_id(query_id, request.user)
+        response_dict = _get_data_source_results_dict(
+            request,
+            query,
+            query_id,
+            data_source_index,
+            page,
+            deadline_utils.Deadline(settings.EXPLORE_REQUEST_DEADLINE),
+            cursor=request.GET.get("cursor"),
+        )
+        return HttpResponse(
+            json.dumps(response_dict), content_type="application/json"
+        )
+
+    except DoesNotExist:
+        return HttpResponseBadRequest("The query does not exist.")
+    except DeadlineExceededError:
+        response_dict = _get_data_source_timeout_dict(
+            query_id, data_source_index, page
+        )
+        return HttpResponse(
+            json.dumps(response_dict), content_type="application/json"
+        )
+    except ExploreRequestError as ex:
+        return HttpResponseBadRequest(
+            "An error occurred while sending the query: " + escape(str(ex)),
+        )
+    except Exception as exception:
+        return HttpResponseBadRequest(
+            "An unexpected error occurred: " + escape(str(exception)),
+        )
+
+
+@compress_response
+@access_control(explore_common_acl_api.can_access_explore_views)
+def get_data_source_results_json(request, query_id, data_source_index, page=1):
+    """Gets a page of results from a data source, as JSON
+
+    The result pages of trusted data sources (see
+    EXPLORE_PASS_THROUGH_DATA_SOURCES) are streamed as received, without
+    being decoded and encoded again, or compressed again. Their next and
+    previous pages are given as page numbers, as for other data sources.
+
+    Args:
+        request:
+        query_id:
+        data_source_index:
+        page:
+
+    Returns:
+
+    """
     try:
         # get query
         query = query_api.get_by_id(query_id, request.user)
         data_source = query.data_sources[int(data_source_index)]
         json_query = query_utils.serialize_query(query, data_source)
-
-        # If querying the local system
-        if data_source["authentication"]["auth_type"] == "session":
-            if query_utils.is_local_data_source(data_source):
-                results = query_views.execute_local_query(
-                    json_query, page, request
-                )
-                data_list = query_views.format_local_results(results, request)
-            elif oaipmh_utils.is_oai_data_source(data_source):
-                from core_explore_oaipmh_app.rest.query.views import (
-                    execute_oaipmh_query,
-                    format_oaipmh_results,
+        page = max(int(page), 1)
+
+        if query_utils.is_pass_through_data_source(data_source):
+            _check_template_hashes(json_query)
+            # the body was decoded from the peer, it is not compressed again
+            return skip_compression(
+                StreamingHttpResponse(
+                    query_utils.send_pass_through(
+                        request,
+                        json_query,
+                        data_source,
+                        page,
+                        deadline=deadline_utils.Deadline(
+                            settings.EXPLORE_REQUEST_DEADLINE
+                        ),
+                    ),
+                    content_type="application/json",
                 )
+            )
 
-                results = execute_oaipmh_query(json_query, page, request)
-                data_list = format_oaipmh_results(results, request)
-            else:
-                raise ExploreRequestError("Unknown data source.")
-            # Get pagination info for local sources
-            results_count = results.paginator.count
-            page_count = int(
-                math.ceil(float(results_count) / settings.RESULTS_PER_PAGE)
+        if data_source["authentication"][
+            "auth_type"
+        ] == "session" and query_utils.is_local_data_source(data_source):
+            # local pages can follow a cursor instead of an offset
+            results = query_views.execute_local_query(
+                json_query, page, request, cursor=request.GET.get("cursor")
+            )
+            response_dict = {
+                "count": results.paginator.count,
+                "next": results.next_page_number()
+                if results.has_next()
+                else None,
+                "previous": results.previous_page_number()
+                if results.has_previous()
+                else None,
+                "next_cursor": getattr(results, "next_cursor", None),
+                "results": ResultSerializer(
+                    query_views.format_local_results(results, request),
+                    many=True,
+                ).data,
+            }
+            return HttpResponse(
+                json.dumps(response_dict), content_type="application/json"
             )
 
-            try:
-                previous_page_number = results.previous_page_number()
-            except EmptyPage:
-                previous_page_number = None
+        results, next_page_number, results_count = _fetch_data_source_page(
+            request, data_source, json_query, page
+        )
+        response_dict = {
+            "count": results_count,
+            "next": next_page_number,
+            "previous": page - 1 if page > 1 else None,
+            "results": [
+                result
+                if isinstance(result, dict)
+                else ResultSerializer(result).data
+                for result in results
+            ],
+        }
+        return HttpResponse(
+            json.dumps(response_dict), content_type="application/json"
+        )
+    except DoesNotExist:
+        return HttpResponseBadRequest("The query does not exist.")
+    except ExploreRequestError as ex:
+        return HttpResponseBadRequest(
+            "An error occurred while sending the query: " + escape(str(ex)),
+        )
+    except Exception as exception:
+        return HttpResponseBadRequest(
+            "An unexpected error occurred: " + escape(str(exception)),
+        )
 
-            try:
-                next_page_number = results.next_page_number()
-            except EmptyPage:
-                next_page_number = None
 
-            has_other_pages = results.has_other_pages()
-            has_previous = results.has_previous()
-            has_next = results.has_next()
-        else:
-            # Check template hash
-            if any(
-                not template["hash"]
-                for template in json.loads(json_query["templates"])
-            ):
-                raise ExploreRequestError(
-                    "Some selected templates are missing the hash value."
-                )
-            # send query, and get results from data source
-            results = query_utils.send(request, json_query, data_source, page)
-            data_list = results["results"]
-
-            # get pagination information
-            previous_page_number = get_page_number(results["previous"])
-            next_page_number = get_page_number(results["next"])
-            results_count = results["count"]
-            page_count = int(
-                math.ceil(float(results_count) / settings.RESULTS_PER_PAGE)
-            )
+@access_control(explore_common_acl_api.can_access_explore_views)
+def get_data_sources_counts(request, query_id):
+    """Gets the number of results of all data sources of a query
+
+    Only the counts are requested, so the tabs can show their totals before
+    the results of the selected data source are fetched. Counts are streamed
+    back (one JSON document per line) as soon as they are ready.
 
-            # pagination has other pages?
-            has_other_pages = results_count > settings.RESULTS_PER_PAGE
+    Args:
+        request:
+        query_id:
+
+    Returns:
 
-            # pagination has previous?
-            has_previous = previous_page_number is not None
+    """
+    try:
+        # get query
+        query = query_api.get_by_id(query_id, request.user)
+    except DoesNotExist:
+        return HttpResponseBadRequest("The query does not exist.")
+    except Exception as exception:
+        return HttpResponseBadRequest(
+            "An unexpected error occurred: " + escape(str(exception)),
+        )
 
-            # pagination has next?
-            has_next = (
-                next_page_number is not None and next_page_number <= page_count
+    # the data sources share the time budget of the request
+    deadline = deadline_utils.Deadline(settings.EXPLORE_REQUEST_DEADLINE)
+    # send all the count queries at once
+    futures = fan_out_utils.submit_all(
+        {
+            data_source_index: functools.partial(
+                _get_data_source_count_dict,
+                request,
+                query,
+                data_source_index,
+                deadline,
             )
+            for data_source_index in range(len(query.data_sources))
+        }
+    )
+    return StreamingHttpResponse(
+        _stream_data_sources_dicts(
+            futures,
+            lambda data_source_index: {"nb_results": "-", "timed_out": True},
+            deadline,
+        ),
+        content_type="application/x-ndjson",
+    )
+
+
+@compress_response
+@access_control(explore_common_acl_api.can_access_explore_views)
+def get_result_content(request):
+    """Gets the content of a local result, listed without it in summary mode
+
+    Args:
+        request:
+
+    Returns:
 
-        # set results in context
-        context_data = {
-            "results": data_list,
-            "query_id": query_id,
-            "data_source_index": data_source_index,
-            "pagination": {
-                "number": int(page),
-                "paginator": {"num_pages": page_count},
-                "has_other_pages": has_other_pages,
-                "previous_page_number": previous_page_number,
-                "next_page_number": next_page_number,
-                "has_previous": has_previous,
-                "has_next": has_next,
+    """
+    data_id = request.GET.get("id", None)
+    if data_id is None:
+        return HttpResponseBadRequest("The data id is missing.")
+    try:
+        data = data_api.get_by_id(data_id, request.user)
+        result = Result(
+            title=data.title,
+            content=data.content,
+            template_info=result_utils.get_template_info(data.template),
+        )
+        return django_render(
+            request,
+            "core_explore_common_app/user/results/result_content.html",
+            context={
+                "result": result,
+                "blobs_preview": "core_file_preview_app"
+                in settings.INSTALLED_APPS,
             },
-            "blobs_preview": "core_file_preview_app"
-            in settings.INSTALLED_APPS,
-            "display_edit_button": settings.DISPLAY_EDIT_BUTTON,
-            "exporter_app": "core_exporters_app" in settings.INSTALLED_APPS,
-        }
+        )
+    except (DoesNotExist, AccessControlError):
+        return HttpResponseBadRequest("The data does not exist.")
+    except Exception as exception:
+        return HttpResponseBadRequest(
+            "An unexpected error occurred: " + escape(str(exception)),
+        )
 
-        # create context
-        context = {}
-        context.update(request)
-        context.update(context_data)
 
-        # generate html with context
-        html_template = loader.get_template(
-            join(
-                "core_explore_common_app",
-                "user",
-                "results",
-                "data_source_results.html",
+def _stream_data_sources_dicts(futures, get_timeout_dict, deadline=None):
+    """Yield the response of each data source, one JSON document per line,
+    in completion order
+
+    Args:
+        futures: futures returned by fan_out.submit_all
+        get_timeout_dict: returns the response of a data source that did not
+            answer in time, from its index
+        deadline: data sources still running when it passes get the timeout
+            response
+
+    Returns:
+
+    """
+    for (
+        data_source_index,
+        response_dict,
+        exception,
+    ) in fan_out_utils.iter_completed(futures, deadline):
+        if exception is None:
+            response_dict["data_source_index"] = data_source_index
+        elif isinstance(exception, DeadlineExceededError):
+            response_dict = get_timeout_dict(data_source_index)
+            response_dict["data_source_index"] = data_source_index
+        elif isinstance(exception, ExploreRequestError):
+            response_dict = {
+                "data_source_index": data_source_index,
+                "error": "An error occurred while sending the query: "
+                + escape(str(exception)),
+            }
+        else:
+            response_dict = {
+                "data_source_index": data_source_index,
+                "error": "An unexpected error occurred: "
+                + escape(str(exception)),
+            }
+        yield json.dumps(response_dict) + "\n"
+
+
+def _get_data_source_count_dict(
+    request, query, data_source_index, deadline=None
+):
+    """Count the results of the query on a data source
+
+    Args:
+        request:
+        query:
+        data_source_index:
+        deadline:
+
+    Returns:
+
+    """
+    data_source = query.data_sources[int(data_source_index)]
+    json_query = query_utils.serialize_query(query, data_source)
+
+    if data_source["authentication"]["auth_type"] == "session":
+        if query_utils.is_local_data_source(data_source):
+            results_count = query_views.execute_local_query(
+                json_query, 1, request, count_only=True
             )
+        elif oaipmh_utils.is_oai_data_source(data_source):
+            from core_explore_oaipmh_app.rest.query.views import (
+                execute_oaipmh_query,
+            )
+
+            results_count = execute_oaipmh_query(
+                json_query, 1, request
+            ).paginator.count
+        else:
+            raise ExploreRequestError("Unknown data source.")
+    else:
+        _check_template_hashes(json_query)
+        results_count = query_utils.send(
+            request,
+            json_query,
+            data_source,
+            1,
+            deadline=deadline,
+            count_only=True,
+        )["count"]
+
+    return {"nb_results": results_count}
+
+
+@compress_response
+@access_control(explore_common_acl_api.can_access_explore_views)
+def get_merged_results(request, query_id, page=1):
+    """Gets a page of the results of all data sources, merged in a single
+    sorted list
+
+    Args:
+        request:
+        query_id:
+        page:
+
+    Returns:
+
+    """
+    try:
+        # get query
+        query = query_api.get_by_id(query_id, request.user)
+        response_dict = _get_merged_results_dict(
+            request, query, query_id, max(int(page), 1)
         )
-        # render html
-        results_html = html_template.render(context)
-        # set response with html results
-        response_dict = {
-            "results": results_html,
-            "nb_results": results_count,
-        }
         return HttpResponse(
             json.dumps(response_dict), content_type="application/json"
         )
-
     except DoesNotExist:
         return HttpResponseBadRequest("The query does not exist.")
-    except ExploreRequestError as ex:
-        return HttpResponseBadRequest(
-            "An error occurred while sending the query: " + escape(str(ex)),
-        )
     except Exception as exception:
         return HttpResponseBadRequest(
             "An unexpected error occurred: " + escape(str(exception)),
         )
 
 
+def _get_merged_order_by_field(query):
+    """Returns the order shared by the data sources of a query, the default
+    merged order if they are not sorted the same way
+
+    Args:
+        query:
+
+    Returns:
+
+    """
+    orders_by_field = {
+        data_source["order_by_field"] for data_source in query.data_sources
+    }
+    if len(orders_by_field) == 1:
+        order_by_field = orders_by_field.pop()
+        if order_by_field:
+            return order_by_field
+    return settings.EXPLORE_MERGED_RESULTS_ORDER_BY_FIELD
+
+
+def _get_merged_results_dict(request, query, query_id, page):
+    """Merge the results of all data sources and render a page
+
+    Args:
+        request:
+        query:
+        query_id:
+        page:
+
+    Returns:
+
+    """
+    order_by_field = _get_merged_order_by_field(query)
+    json_queries = list()
+    for data_source in query.data_sources:
+        json_query = query_utils.serialize_query(query, data_source)
+        json_query["order_by_field"] = order_by_field
+        json_queries.append(json_query)
+
+    def _create_stream():
+        return merge_utils.MergedStream(
+            [
+                functools.partial(
+                    _fetch_data_source_page, request, data_source, json_query
+                )
+                for data_source, json_query in zip(
+                    query.data_sources, json_queries
+                )
+            ],
+            order_by_field,
+        )
+
+    data_list, merged_stream = merge_utils.get_page(
+        merge_utils.get_key(request.user.id, query_id, json_queries),
+        page,
+        settings.RESULTS_PER_PAGE,
+        _create_stream,
+    )
+
+    results_count = merged_stream.count
+    page_count = int(
+        math.ceil(float(results_count) / settings.RESULTS_PER_PAGE)
+    )
+    has_next = page < page_count
+    context_data = {
+        "results": data_list,
+        "query_id": query_id,
+        "pagination": {
+            "number": page,
+            "paginator": {"num_pages": page_count},
+            "has_other_pages": page_count > 1,
+            "previous_page_number": page - 1 if page > 1 else None,
+            "next_page_number": page + 1 if has_next else None,
+            "has_previous": page > 1,
+            "has_next": has_next,
+        },
+        "unavailable_data_sources": [
+            query.data_sources[index]["name"] for index in merged_stream.errors
+        ],
+        "blobs_preview": "core_file_preview_app" in settings.INSTALLED_APPS,
+        "display_edit_button": settings.DISPLAY_EDIT_BUTTON,
+        "exporter_app": "core_exporters_app" in settings.INSTALLED_APPS,
+    }
+
+    # create context
+    context = {}
+    context.update(request)
+    context.update(context_data)
+
+    html_template = loader.get_template(
+        join(
+            "core_explore_common_app",
+            "user",
+            "results",
+            "merged_results.html",
+        )
+    )
+    return {
+        "results": html_template.render(context),
+        "nb_results": results_count,
+    }
+
+
+def _fetch_data_source_page(request, data_source, json_query, page):
+    """Returns a page of results of a data source, for the merged results
+
+    Args:
+        request:
+        data_source:
+        json_query:
+        page:
+
+    Returns:
+        the results, the next page number (None on the last page) and the
+        number of results
+    """
+    if data_source["authentication"]["auth_type"] == "session":
+        if query_utils.is_local_data_source(data_source):
+            results = query_views.execute_local_query(
+                json_query, page, request
+            )
+            data_list = query_views.format_local_results(results, request)
+        elif oaipmh_utils.is_oai_data_source(data_source):
+            from core_explore_oaipmh_app.rest.query.views import (
+                execute_oaipmh_query,
+                format_oaipmh_results,
+            )
+
+            results = execute_oaipmh_query(json_query, page, request)
+            data_list = format_oaipmh_results(results, request)
+        else:
+            raise ExploreRequestError("Unknown data source.")
+        next_page_number = (
+            results.next_page_number() if results.has_next() else None
+        )
+        return data_list, next_page_number, results.paginator.count
+
+    _check_template_hashes(json_query)
+    results = query_utils.send(
+        request,
+        json_query,
+        data_source,
+        page,
+        deadline=deadline_utils.Deadline(settings.EXPLORE_REQUEST_DEADLINE),
+    )
+    return (
+        results["results"],
+        get_page_number(results["next"]),
+        results["count"],
+    )
+
+
+def _check_template_hashes(json_query):
+    """Check that the templates of a query sent to a remote data source have
+    a hash
+
+    Args:
+        json_query:
+
+    Returns:
+
+    """
+    if any(
+        not template["hash"]
+        for template in json.loads(json_query["templates"])
+    ):
+        raise ExploreRequestError(
+            "Some selected templates are missing the hash value."
+        )
+
+
+def _get_data_source_timeout_dict(query_id, data_source_index, page):
+    """Render the placeholder of a data source that did not answer in time
+
+    Args:
+        query_id:
+        data_source_index:
+        page:
+
+    Returns:
+
+    """
+    html_template = loader.get_template(
+        join(
+            "core_explore_common_app",
+            "user",
+            "results",
+            "data_source_timeout.html",
+        )
+    )
+    return {
+        "results": html_template.render(
+            {
+                "query_id": query_id,
+                "data_source_index": data_source_index,
+                "page": page,
+            }
+        ),
+        "nb_results": "-",
+        "timed_out": True,
+    }
+
+
+def _get_data_source_results_dict(
+    request,
+    query,
+    query_id,
+    data_source_index,
+    page,
+    deadline=None,
+    prefetch_next=True,
+    cursor=None,
+):
+    """Execute the query on a data source and render its results
+
+    Args:
+        request:
+        query:
+        query_id:
+        data_source_index:
+        page:
+        deadline:
+        prefetch_next: fetch the next page in the background
+        cursor: cursor of the page, for the local data source
+
+    Returns:
+
+    """
+    data_source = query.data_sources[int(data_source_index)]
+    json_query = query_utils.serialize_query(query, data_source)
+
+    # use the page if it was prefetched
+    prefetch_scope = prefetch_utils.get_scope(
+        request.user.id, query_id, data_source_index
+    )
+    response_dict = prefetch_utils.pop_staged(
+        prefetch_utils.get_key(prefetch_scope, json_query, page)
+    )
+    if response_dict is not None:
+        if prefetch_next and response_dict["next_page_number"] is not None:
+            _prefetch_data_source_results(
+                request,
+                query,
+                query_id,
+                data_source_index,
+                response_dict["next_page_number"],
+                json_query,
+            )
+        return response_dict
+
+    # If querying the local system
+    next_cursor = None
+    if data_source["authentication"]["auth_type"] == "session":
+        if query_utils.is_local_data_source(data_source):
+            results = query_views.execute_local_query(
+                json_query,
+                page,
+                request,
+                cursor=cursor,
+                summary=settings.EXPLORE_SUMMARY_RESULTS,
+            )
+            data_list = query_views.format_local_results(
+                results, request, summary=settings.EXPLORE_SUMMARY_RESULTS
+            )
+            next_cursor = getattr(results, "next_cursor", None)
+        elif oaipmh_utils.is_oai_data_source(data_source):
+            from core_explore_oaipmh_app.rest.query.views import (
+                execute_oaipmh_query,
+                format_oaipmh_results,
+            )
+
+            results = execute_oaipmh_query(json_query, page, request)
+            data_list = format_oaipmh_results(results, request)
+        else:
+            raise ExploreRequestError("Unknown data source.")
+        # Get pagination info for local sources
+        results_count = results.paginator.count
+        page_count = int(
+            math.ceil(float(results_count) / settings.RESULTS_PER_PAGE)
+        )
+
+        try:
+            previous_page_number = results.previous_page_number()
+        except EmptyPage:
+            previous_page_number = None
+
+        try:
+            next_page_number = results.next_page_number()
+        except EmptyPage:
+            next_page_number = None
+
+        has_other_pages = results.has_other_pages()
+        has_previous = results.has_previous()
+        has_next = results.has_next()
+    else:
+        _check_template_hashes(json_query)
+        # send query, and get results from data source
+        if prefetch_next and settings.EXPLORE_PREFETCH_ENABLED:
+            # the prefetch of the next page then reads it from the cache
+            results = query_utils.send_with_next_page(
+                request, json_query, data_source, int(page), deadline=deadline
+            )
+        else:
+            results = query_utils.send(
+                request, json_query, data_source, page, deadline=deadline
+            )
+        data_list = results["results"]
+
+        # get pagination information
+        previous_page_number = get_page_number(results["previous"])
+        next_page_number = get_page_number(results["next"])
+        results_count = results["count"]
+        # remote instances may use another page size
+        page_size = capabilities_utils.get_cached_capabilities(
+            data_source
+        ).get("page_size", settings.RESULTS_PER_PAGE)
+        page_count = int(math.ceil(float(results_count) / page_size))
+
+        # pagination has other pages?
+        has_other_pages = results_count > page_size
+
+        # pagination has previous?
+        has_previous = previous_page_number is not None
+
+        # pagination has next?
+        has_next = (
+            next_page_number is not None and next_page_number <= page_count
+        )
+
+    if prefetch_next and has_next:
+        _prefetch_data_source_results(
+            request,
+            query,
+            query_id,
+            data_source_index,
+            next_page_number,
+            json_query,
+        )
+
+    # set results in context
+    context_data = {
+        "results": data_list,
+        "query_id": query_id,
+        "data_source_index": data_source_index,
+        "pagination": {
+            "number": int(page),
+            "paginator": {"num_pages": page_count},
+            "has_other_pages": has_other_pages,
+            "previous_page_number": previous_page_number,
+            "next_page_number": next_page_number,
+            "has_previous": has_previous,
+            "has_next": has_next,
+            "next_cursor": next_cursor if has_next else None,
+        },
+        "blobs_preview": "core_file_preview_app" in settings.INSTALLED_APPS,
+        "display_edit_button": settings.DISPLAY_EDIT_BUTTON,
+        "exporter_app": "core_exporters_app" in settings.INSTALLED_APPS,
+    }
+
+    # create context
+    context = {}
+    context.update(request)
+    context.update(context_data)
+
+    # generate html with context
+    html_template = loader.get_template(
+        join(
+            "core_explore_common_app",
+            "user",
+            "results",
+            "data_source_results.html",
+        )
+    )
+    # render html
+    results_html = html_template.render(context)
+    # set response with html results
+    response_dict = {
+        "results": results_html,
+        "nb_results": results_count,
+        "next_page_number": next_page_number if has_next else None,
+        "next_cursor": next_cursor if has_next else None,
+    }
+    return response_dict
+
+
+def _prefetch_data_source_results(
+    request, query, query_id, data_source_index, page, json_query
+):
+    """Render a results page of a data source in the background
+
+    Args:
+        request:
+        query:
+        query_id:
+        data_source_index:
+        page:
+        json_query:
+
+    Returns:
+
+    """
+    prefetch_scope = prefetch_utils.get_scope(
+        request.user.id, query_id, data_source_index
+    )
+
+    def _prefetch():
+        # the time budget starts when the prefetch leaves the queue
+        return _get_data_source_results_dict(
+            request,
+            query,
+            query_id,
+            data_source_index,
+            page,
+            deadline_utils.Deadline(settings.EXPLORE_REQUEST_DEADLINE),
+            prefetch_next=False,
+        )
+
+    prefetch_utils.schedule(
+        prefetch_scope,
+        prefetch_utils.get_key(prefetch_scope, json_query, page),
+        _prefetch,
+    )
+
+
 class CreatePersistentQueryUrlView(View, metaclass=ABCMeta):
     """Create the persistent url from a Query"""
 
@@ -0,0 +1,220 @@
+""" Unit tests for the batch query REST API
+"""
+from unittest.mock import patch, MagicMock
+
+from django.test import SimpleTestCase
+from rest_framework import status
+
+from core_explore_common_app.rest.batch.views import execute_batch_query
+from core_explore_common_app.rest.query import views as query_views
+from core_main_app.commons.exceptions import ApiError
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_main_app.utils.tests_tools.RequestMock import RequestMock
+
+
+class TestExecuteBatchQuery(SimpleTestCase):
+    """TestExecuteBatchQuery"""
+
+    @patch.object(query_views, "format_federated_results")
+    @patch.object(query_views, "execute_local_query")
+    def test_execute_batch_query_returns_a_page_per_query(
+        self, mock_execute_local_query, mock_format_federated_results
+    ):
+        """test_execute_batch_query_returns_a_page_per_query
+
+        Returns:
+
+        """
+        mock_page = MagicMock()
+        mock_page.paginator.count = 12
+        mock_page.has_next.return_value = True
+        mock_page.next_page_number.return_value = 2
+        mock_page.has_previous.return_value = False
+        mock_page.next_cursor = "cursor"
+        mock_execute_local_query.return_value = mock_page
+        mock_format_federated_results.return_value = []
+
+        response = RequestMock.do_request_post(
+            execute_batch_query,
+            create_mock_user("1"),
+            data={
+                "queries": [
+                    {"id": "a", "query": {"query": "{}"}, "page": 1},
+                    {"id": "b", "query": {"query": "{}"}, "page": 3},
+                ]
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["id"] for item in response.data["responses"]], ["a", "b"]
+        )
+        self.assertEqual(
+            response.data["responses"][0],
+            {
+                "id": "a",
+                "status": status.HTTP_200_OK,
+                "count": 12,
+                "next": 2,
+                "previous": None,
+                "next_cursor": "cursor",
+                "results": [],
+            },
+        )
+        self.assertEqual(mock_execute_local_query.call_args.args[1], 3)
+
+    @patch.object(query_views, "execute_local_query")
+    def test_execute_batch_query_counts_count_only_queries(
+        self, mock_execute_local_query
+    ):
+        """test_execute_batch_query_counts_count_only_queries
+
+        Returns:
+
+        """
+        mock_execute_local_query.return_value = 5
+
+        response = RequestMock.do_request_post(
+            execute_batch_query,
+            create_mock_user("1"),
+            data={
+                "queries": [
+                    {"id": "a", "query": {"query": "{}", "count_only": True}}
+                ]
+            },
+        )
+
+        self.assertEqual(response.data["responses"][0]["count"], 5)
+        self.assertTrue(
+            mock_execute_local_query.call_args.kwargs["count_only"]
+        )
+
+    @patch.object(query_views, "execute_local_query")
+    def test_failing_query_does_not_fail_the_batch(
+        self, mock_execute_local_query
+    ):
+        """test_failing_query_does_not_fail_the_batch
+
+        Returns:
+
+        """
+        mock_execute_local_query.side_effect = ApiError("invalid query")
+
+        response = RequestMock.do_request_post(
+            execute_batch_query,
+            create_mock_user("1"),
+            data={"queries": [{"id": "a", "query": {}}]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["responses"][0]["status"],
+            status.HTTP_400_BAD_REQUEST,
+        )
+
+    def test_execute_batch_query_without_queries_returns_http_400(self):
+        """test_execute_batch_query_without_queries_returns_http_400
+
+        Returns:
+
+        """
+        response = RequestMock.do_request_post(
+            execute_batch_query, create_mock_user("1"), data={}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch("core_explore_common_app.settings.EXPLORE_BATCH_MAX_QUERIES", 1)
+    def test_execute_batch_query_too_large_returns_http_400(self):
+        """test_execute_batch_query_too_large_returns_http_400
+
+        Returns:
+
+        """
+        response = RequestMock.do_request_post(
+            execute_batch_query,
+            create_mock_user("1"),
+            data={"queries": [{"id": "a"}, {"id": "b"}]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch.object(query_views, "format_federated_results")
+    @patch.object(query_views, "execute_local_query")
+    @patch.object(query_views.template_api, "get_all_accessible_by_hash_list")
+    def test_execute_batch_query_matches_templates_by_hash(
+        self,
+        mock_get_all_accessible_by_hash_list,
+        mock_execute_local_query,
+        mock_format_federated_results,
+    ):
+        """test_execute_batch_query_matches_templates_by_hash
+
+        Returns:
+
+        """
+        mock_get_all_accessible_by_hash_list.return_value = [MagicMock(id=7)]
+        mock_page = MagicMock()
+        mock_page.paginator.count = 1
+        mock_page.has_next.return_value = False
+        mock_page.has_previous.return_value = False
+        mock_execute_local_query.return_value = mock_page
+        mock_format_federated_results.return_value = []
+
+        response = RequestMock.do_request_post(
+            execute_batch_query,
+            create_mock_user("1"),
+            data={
+                "queries": [
+                    {
+                        "id": "a",
+                        "query": {
+                            "query": "{}",
+                            "templates": '[{"id": 1, "hash": "hash"}]',
+                        },
+                    }
+                ]
+            },
+        )
+
+        self.assertEqual(
+            response.data["responses"][0]["status"], status.HTTP_200_OK
+        )
+        self.assertEqual(
+            mock_get_all_accessible_by_hash_list.call_args.args[0], ["hash"]
+        )
+        self.assertEqual(
+            mock_execute_local_query.call_args.args[0]["templates"],
+            [{"id": 7}],
+        )
+
+    @patch.object(query_views, "execute_local_query")
+    @patch.object(query_views.template_api, "get_all_accessible_by_hash_list")
+    def test_execute_batch_query_without_local_template_returns_no_results(
+        self, mock_get_all_accessible_by_hash_list, mock_execute_local_query
+    ):
+        """test_execute_batch_query_without_local_template_returns_no_results
+
+        Returns:
+
+        """
+        mock_get_all_accessible_by_hash_list.return_value = []
+
+        response = RequestMock.do_request_post(
+            execute_batch_query,
+            create_mock_user("1"),
+            data={
+                "queries": [
+                    {
+                        "id": "a",
+                        "query": {
+                            "query": "{}",
+                            "templates": '[{"id": 1, "hash": "hash"}]',
+                        },
+                    }
+                ]
+            },
+        )
+
+        self.assertEqual(response.data["responses"][0]["count"], 0)
+        mock_execute_local_query.assert_not_called()
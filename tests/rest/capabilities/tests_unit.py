@@ -0,0 +1,56 @@
+""" Unit tests for the capabilities REST API
+"""
+from unittest.mock import patch, MagicMock
+
+from django.test import SimpleTestCase
+from rest_framework import status
+
+from core_explore_common_app.rest.capabilities.views import get_capabilities
+from core_main_app.components.template import api as template_api
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_main_app.utils.tests_tools.RequestMock import RequestMock
+
+
+class TestGetCapabilities(SimpleTestCase):
+    """TestGetCapabilities"""
+
+    @patch.object(template_api, "get_all")
+    def test_get_capabilities_returns_template_hashes(self, mock_get_all):
+        """test_get_capabilities_returns_template_hashes
+
+        Returns:
+
+        """
+        mock_template_1 = MagicMock()
+        mock_template_1.hash = "hash_2"
+        mock_template_2 = MagicMock()
+        mock_template_2.hash = "hash_1"
+        mock_get_all.return_value = [mock_template_1, mock_template_2]
+
+        response = RequestMock.do_request_get(
+            get_capabilities, create_mock_user("1")
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["template_hashes"], ["hash_1", "hash_2"]
+        )
+        self.assertTrue(response.data["count_only"])
+        self.assertIn("gzip", response.data["compression"])
+
+    @patch.object(template_api, "get_all")
+    def test_get_capabilities_returns_http_500_on_error(self, mock_get_all):
+        """test_get_capabilities_returns_http_500_on_error
+
+        Returns:
+
+        """
+        mock_get_all.side_effect = Exception("error")
+
+        response = RequestMock.do_request_get(
+            get_capabilities, create_mock_user("1")
+        )
+
+        self.assertEqual(
+            response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
@@ -1,14 +1,18 @@
 """ Unit tests for local query views
 """
 
+import datetime
 from unittest.mock import patch, MagicMock
 
 from django.core import paginator as django_paginator
-from django.test import SimpleTestCase, override_settings
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.test import tag
 
 from core_explore_common_app.rest.query import views as query_views
+from core_explore_common_app.utils.query import count_cache, plan_cache
 from core_main_app.commons.exceptions import ApiError
+from core_main_app.components.data.models import Data
+from core_main_app.components.template.models import Template
 from core_main_app.utils.pagination.mongoengine_paginator import (
     paginator as mongo_paginator,
 )
@@ -21,6 +25,15 @@ from core_main_app.utils.tests_tools.RequestMock import (
 class TestExecuteLocalQuery(SimpleTestCase):
     """TestExecuteLocalQuery"""
 
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        plan_cache.clear()
+        count_cache.clear()
+
     @patch("core_main_app.components.data.api.execute_json_query")
     def test_execute_local_query_returns_page_of_results(
         self, mock_execute_json_query
@@ -42,6 +55,20 @@ class TestExecuteLocalQuery(SimpleTestCase):
         self.assertTrue(isinstance(page, django_paginator.Page))
         self.assertTrue(isinstance(page.paginator, django_paginator.Paginator))
 
+    def test_build_local_query_logs_raw_query_cache_statistics(self):
+        """test_build_local_query_logs_raw_query_cache_statistics
+
+        Returns:
+
+        """
+        with self.assertLogs(query_views.logger, "DEBUG") as logs:
+            query_views.build_local_query({"query": {}})
+            query_views.build_local_query({"query": {}})
+
+        self.assertIn("miss", logs.output[0])
+        self.assertIn("hit", logs.output[1])
+        self.assertIn("'hits': 1", logs.output[1])
+
     @patch("core_main_app.components.workspace.api.get_all_public_workspaces")
     @patch("core_main_app.components.data.api.execute_json_query")
     def test_execute_local_query_with_params_returns_page_of_results(
@@ -98,6 +125,29 @@ class TestExecuteLocalQuery(SimpleTestCase):
             isinstance(page.paginator, mongo_paginator.MongoenginePaginator)
         )
 
+    @patch("core_main_app.components.data.api.execute_json_query")
+    def test_execute_local_query_reuses_count_of_previous_page(
+        self, mock_execute_json_query
+    ):
+        """test_execute_local_query_reuses_count_of_previous_page"""
+        # Arrange
+        mock_user = create_mock_user(1)
+        mock_query_data = {"query": {}}
+        mock_request = create_mock_request(user=mock_user)
+        mock_execute_json_query.return_value = list(range(42))
+        query_views.execute_local_query(
+            query_data=mock_query_data, page=1, request=mock_request
+        )
+        mock_execute_json_query.return_value = list(range(50))
+
+        # Act
+        page = query_views.execute_local_query(
+            query_data=mock_query_data, page=2, request=mock_request
+        )
+
+        # Assert
+        self.assertEqual(page.paginator.count, 42)
+
     def test_execute_local_query_none_raises_api_error(self):
         """test_execute_local_query_none_raises_api_error"""
         # Arrange
@@ -112,6 +162,121 @@ class TestExecuteLocalQuery(SimpleTestCase):
             )
 
 
+class TestExecuteLocalQuerySummary(TestCase):
+    """TestExecuteLocalQuerySummary"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        plan_cache.clear()
+        count_cache.clear()
+        template = Template.objects.create(
+            filename="template.xsd", content="<schema/>", _hash="hash"
+        )
+        Data.objects.bulk_create(
+            Data(
+                template=template,
+                user_id="1",
+                title=f"data_{index}",
+                dict_content={"root": "value"},
+                last_modification_date=datetime.datetime(2023, 1, 1),
+            )
+            for index in range(2)
+        )
+
+    @patch("core_main_app.components.data.api.execute_json_query")
+    def test_execute_local_query_in_summary_mode_loads_only_listed_fields(
+        self, mock_execute_json_query
+    ):
+        """test_execute_local_query_in_summary_mode_loads_only_listed_fields
+
+        Returns:
+
+        """
+        # Arrange
+        mock_request = create_mock_request(user=create_mock_user(1))
+        mock_execute_json_query.return_value = Data.objects.all()
+
+        # Act
+        page = query_views.execute_local_query(
+            query_data={"query": {}},
+            page=1,
+            request=mock_request,
+            summary=True,
+        )
+        data_list = list(page.object_list)
+
+        # Assert
+        self.assertEqual(len(data_list), 2)
+        self.assertTrue(
+            {"file", "dict_content", "vector_column", "checksum"}.issubset(
+                data_list[0].get_deferred_fields()
+            )
+        )
+        with self.assertNumQueries(0):
+            for data in data_list:
+                (
+                    data.id,
+                    data.title,
+                    data.template_id,
+                    data.last_modification_date,
+                )
+
+
+class TestExecuteLocalQueryCountOnly(SimpleTestCase):
+    """TestExecuteLocalQueryCountOnly"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        plan_cache.clear()
+        count_cache.clear()
+
+    @patch("core_main_app.components.data.api.execute_json_query")
+    def test_execute_local_query_count_only_returns_count(
+        self, mock_execute_json_query
+    ):
+        """test_execute_local_query_count_only_returns_count"""
+        # Arrange
+        mock_request = create_mock_request(user=create_mock_user(1))
+        mock_queryset = MagicMock()
+        mock_queryset.count.return_value = 42
+        mock_execute_json_query.return_value = mock_queryset
+
+        # Act
+        count = query_views.execute_local_query(
+            query_data={"query": {}},
+            page=1,
+            request=mock_request,
+            count_only=True,
+        )
+
+        # Assert
+        self.assertEqual(count, 42)
+        # results are not sorted
+        self.assertEqual(mock_execute_json_query.call_args.args[2], [])
+
+    def test_is_count_only_query_reads_form_value(self):
+        """test_is_count_only_query_reads_form_value"""
+        self.assertTrue(
+            query_views.is_count_only_query({"count_only": "True"})
+        )
+        self.assertTrue(query_views.is_count_only_query({"count_only": True}))
+
+    def test_is_count_only_query_is_false_by_default(self):
+        """test_is_count_only_query_is_false_by_default"""
+        self.assertFalse(query_views.is_count_only_query({"query": {}}))
+        self.assertFalse(
+            query_views.is_count_only_query({"count_only": "False"})
+        )
+
+
 class TestFormatLocalResults(SimpleTestCase):
     """TestFormatLocalResults"""
 
@@ -138,8 +303,9 @@ class TestFormatLocalResults(SimpleTestCase):
         self.assertIsInstance(results, list)
 
     @override_settings(INSTALLED_APPS=[])
+    @patch("core_explore_common_app.utils.result.result.get_readable_blob_ids")
     def test_format_local_results_returns_list(
-        self,
+        self, mock_get_readable_blob_ids
     ):
         """test_format_local_results_returns_list
 
@@ -157,6 +323,7 @@ class TestFormatLocalResults(SimpleTestCase):
         mock_results = MagicMock()
         mock_results.object_list = [mock_data]
         mock_request = create_mock_request(user=mock_user)
+        mock_get_readable_blob_ids.return_value = dict()
 
         # Act
         results = query_views.format_local_results(
@@ -171,8 +338,12 @@ class TestFormatLocalResults(SimpleTestCase):
         "core_explore_common_app.utils.linked_records.pid.is_auto_set_pid_enabled"
     )
     @patch("core_explore_common_app.utils.linked_records.pid.get_pid_url")
+    @patch("core_explore_common_app.utils.result.result.get_readable_blob_ids")
     def test_format_local_results_with_pid_returns_list(
-        self, mock_get_pid_url, mock_auto_set_pid_enabled
+        self,
+        mock_get_readable_blob_ids,
+        mock_get_pid_url,
+        mock_auto_set_pid_enabled,
     ):
         """test_format_local_results_with_pid_returns_list
 
@@ -193,6 +364,7 @@ class TestFormatLocalResults(SimpleTestCase):
 
         mock_get_pid_url.return_value = None
         mock_auto_set_pid_enabled.return_value = True
+        mock_get_readable_blob_ids.return_value = dict()
 
         # Act
         results = query_views.format_local_results(
@@ -202,3 +374,42 @@ class TestFormatLocalResults(SimpleTestCase):
         # Assert
         self.assertIsInstance(results, list)
         self.assertTrue(len(results), 1)
+
+
+class TestFormatFederatedResults(SimpleTestCase):
+    """TestFormatFederatedResults"""
+
+    @override_settings(INSTALLED_APPS=[])
+    @patch("core_explore_common_app.utils.result.result.get_readable_blob_ids")
+    def test_format_federated_results_returns_absolute_urls_without_template_id(
+        self, mock_get_readable_blob_ids
+    ):
+        """test_format_federated_results_returns_absolute_urls_without_template_id
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data = MagicMock()
+        mock_data.id = 1
+        mock_data.template_id = 1
+        mock_data.template.id = 1
+        mock_results = MagicMock()
+        mock_results.object_list = [mock_data]
+        mock_request = create_mock_request(user=create_mock_user(1))
+        mock_get_readable_blob_ids.return_value = dict()
+
+        # Act
+        results = query_views.format_federated_results(
+            results=mock_results, request=mock_request
+        )
+
+        # Assert
+        self.assertEqual(results[0].template_info["id"], "")
+        self.assertTrue(
+            results[0].detail_url.startswith(query_views.SERVER_URI)
+        )
+        self.assertTrue(
+            results[0].access_data_url.startswith(query_views.SERVER_URI)
+        )
+        self.assertIsNone(results[0].permission_url)
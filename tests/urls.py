@@ -1,5 +1,6 @@
 """ Url router for the core explore common test application
 """
+from django.conf.urls import include
 from django.urls import re_path
 
 from core_explore_common_app.rest.result import views as result_views
@@ -29,4 +30,5 @@ urlpatterns = [
         common_views.ViewBlob.as_view(),
         name="core_main_app_blob_detail",
     ),
+    re_path(r"^explore/", include("core_explore_common_app.urls")),
 ]
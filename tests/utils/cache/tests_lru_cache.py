@@ -0,0 +1,66 @@
+""" LRU cache test class
+"""
+from unittest import TestCase
+from unittest.mock import patch
+
+from core_explore_common_app.utils.cache.lru_cache import LRUCache
+
+
+class TestLRUCache(TestCase):
+    """TestLRUCache"""
+
+    def test_get_returns_value_set(self):
+        """test_get_returns_value_set
+
+        Returns:
+
+        """
+        cache = LRUCache(2)
+        cache.set("key", "value", 60)
+
+        self.assertEqual(cache.get("key"), "value")
+        self.assertEqual(cache.hits, 1)
+
+    def test_get_missing_key_returns_default(self):
+        """test_get_missing_key_returns_default
+
+        Returns:
+
+        """
+        cache = LRUCache(2)
+
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.misses, 1)
+
+    def test_least_recently_used_key_is_evicted(self):
+        """test_least_recently_used_key_is_evicted
+
+        Returns:
+
+        """
+        cache = LRUCache(2)
+        cache.set("a", 1, 60)
+        cache.set("b", 2, 60)
+        cache.get("a")
+
+        cache.set("c", 3, 60)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(cache), 2)
+
+    @patch("core_explore_common_app.utils.cache.lru_cache.time.monotonic")
+    def test_expired_key_is_not_returned(self, mock_monotonic):
+        """test_expired_key_is_not_returned
+
+        Returns:
+
+        """
+        cache = LRUCache(2)
+        mock_monotonic.return_value = 0
+        cache.set("key", "value", 10)
+
+        mock_monotonic.return_value = 11
+
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(len(cache), 0)
@@ -0,0 +1,159 @@
+""" Bulkhead test class
+"""
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+from core_explore_common_app.commons.exceptions import DataSourceBusyError
+from core_explore_common_app.utils.federation import bulkhead
+from core_explore_common_app.utils.federation.bulkhead import Bulkhead
+from core_explore_common_app.utils.federation.deadline import Deadline
+
+
+class TestBulkhead(TestCase):
+    """TestBulkhead"""
+
+    def test_acquire_within_limit_succeeds(self):
+        """test_acquire_within_limit_succeeds
+
+        Returns:
+
+        """
+        limit = Bulkhead("remote", max_concurrent=2, max_queue=0)
+        self.assertTrue(limit.acquire(0))
+        self.assertTrue(limit.acquire(0))
+        self.assertEqual(limit.active, 2)
+
+    def test_acquire_with_full_queue_is_rejected(self):
+        """test_acquire_with_full_queue_is_rejected
+
+        Returns:
+
+        """
+        limit = Bulkhead("remote", max_concurrent=1, max_queue=0)
+        limit.acquire(0)
+        self.assertFalse(limit.acquire(10))
+
+    def test_acquire_times_out(self):
+        """test_acquire_times_out
+
+        Returns:
+
+        """
+        limit = Bulkhead("remote", max_concurrent=1, max_queue=1)
+        limit.acquire(0)
+        self.assertFalse(limit.acquire(0.01))
+        self.assertEqual(limit.waiting, 0)
+
+    def test_waiting_query_gets_released_slot(self):
+        """test_waiting_query_gets_released_slot
+
+        Returns:
+
+        """
+        limit = Bulkhead("remote", max_concurrent=1, max_queue=1)
+        limit.acquire(0)
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(limit.acquire(10))
+        )
+        thread.start()
+        while limit.waiting == 0:
+            pass
+        limit.release()
+        thread.join()
+        self.assertEqual(results, [True])
+        self.assertEqual(limit.active, 1)
+
+
+class TestSlot(TestCase):
+    """TestSlot"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        bulkhead.clear()
+
+    @patch(
+        "core_explore_common_app.settings.EXPLORE_BULKHEAD_MAX_CONCURRENT_PER_SOURCE",
+        1,
+    )
+    @patch("core_explore_common_app.settings.EXPLORE_BULKHEAD_MAX_QUEUE", 0)
+    def test_slot_of_busy_data_source_is_rejected(self):
+        """test_slot_of_busy_data_source_is_rejected
+
+        Returns:
+
+        """
+        with bulkhead.slot("http://remote"):
+            with self.assertRaises(DataSourceBusyError):
+                with bulkhead.slot("http://remote"):
+                    pass
+            # other data sources are not limited
+            with bulkhead.slot("http://other"):
+                pass
+
+    @patch(
+        "core_explore_common_app.settings.EXPLORE_BULKHEAD_MAX_CONCURRENT", 1
+    )
+    @patch("core_explore_common_app.settings.EXPLORE_BULKHEAD_MAX_QUEUE", 0)
+    def test_global_limit_is_shared_by_data_sources(self):
+        """test_global_limit_is_shared_by_data_sources
+
+        Returns:
+
+        """
+        with bulkhead.slot("http://remote"):
+            with self.assertRaises(DataSourceBusyError):
+                with bulkhead.slot("http://other"):
+                    pass
+        # the data source slot taken before the rejection was released
+        self.assertEqual(bulkhead.get_bulkhead("http://other").active, 0)
+
+    def test_slot_is_released_on_error(self):
+        """test_slot_is_released_on_error
+
+        Returns:
+
+        """
+        with self.assertRaises(ValueError):
+            with bulkhead.slot("http://remote"):
+                raise ValueError()
+        self.assertEqual(bulkhead.get_bulkhead("http://remote").active, 0)
+        self.assertEqual(bulkhead.get_global_bulkhead().active, 0)
+
+    @patch(
+        "core_explore_common_app.settings.EXPLORE_BULKHEAD_MAX_CONCURRENT_PER_SOURCE",
+        1,
+    )
+    def test_slot_does_not_wait_past_deadline(self):
+        """test_slot_does_not_wait_past_deadline
+
+        Returns:
+
+        """
+        with bulkhead.slot("http://remote"):
+            with self.assertRaises(DataSourceBusyError):
+                with bulkhead.slot("http://remote", Deadline(0)):
+                    pass
+
+    @patch(
+        "core_explore_common_app.settings.EXPLORE_BULKHEAD_MAX_CONCURRENT", 0
+    )
+    @patch(
+        "core_explore_common_app.settings.EXPLORE_BULKHEAD_MAX_CONCURRENT_PER_SOURCE",
+        0,
+    )
+    def test_zero_disables_the_limits(self):
+        """test_zero_disables_the_limits
+
+        Returns:
+
+        """
+        self.assertIsNone(bulkhead.get_bulkhead("http://remote"))
+        self.assertIsNone(bulkhead.get_global_bulkhead())
+        with bulkhead.slot("http://remote"):
+            pass
@@ -0,0 +1,199 @@
+""" Capabilities test class
+"""
+import json
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+
+from core_explore_common_app.utils.federation import capabilities
+from core_explore_common_app.utils.federation import (
+    deadline as deadline_utils,
+)
+
+
+def _get_data_source():
+    """Returns a data source
+
+    Returns:
+
+    """
+    return {
+        "url_query": "https://remote.example.org/rest/data/query/",
+        "authentication": {
+            "auth_type": "oauth2",
+            "params": {"access_token": "token"},
+        },
+        "capabilities": {},
+    }
+
+
+class TestGetCapabilities(TestCase):
+    """TestGetCapabilities"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        capabilities.clear()
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_get_request")
+    def test_get_capabilities_probes_instance_once(
+        self, mock_send_get_request
+    ):
+        """test_get_capabilities_probes_instance_once
+
+        Returns:
+
+        """
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"page_size": 20}
+        mock_send_get_request.return_value = mock_response
+        data_source = _get_data_source()
+
+        self.assertEqual(
+            capabilities.get_capabilities(data_source), {"page_size": 20}
+        )
+        self.assertEqual(
+            capabilities.get_capabilities(_get_data_source()),
+            {"page_size": 20},
+        )
+        self.assertEqual(mock_send_get_request.call_count, 1)
+        self.assertTrue(
+            mock_send_get_request.call_args.args[0].startswith(
+                "https://remote.example.org/"
+            )
+        )
+        self.assertEqual(data_source["capabilities"], {"page_size": 20})
+        self.assertEqual(
+            capabilities.get_cached_capabilities(data_source),
+            {"page_size": 20},
+        )
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_get_request")
+    def test_get_capabilities_of_unreachable_instance_are_empty(
+        self, mock_send_get_request
+    ):
+        """test_get_capabilities_of_unreachable_instance_are_empty
+
+        Returns:
+
+        """
+        mock_send_get_request.side_effect = Exception("error")
+        self.assertEqual(capabilities.get_capabilities(_get_data_source()), {})
+
+    @patch("core_explore_common_app.settings.EXPLORE_CAPABILITIES_TTL", 0)
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_get_request")
+    def test_get_capabilities_does_not_probe_if_disabled(
+        self, mock_send_get_request
+    ):
+        """test_get_capabilities_does_not_probe_if_disabled
+
+        Returns:
+
+        """
+        self.assertEqual(capabilities.get_capabilities(_get_data_source()), {})
+        self.assertFalse(mock_send_get_request.called)
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_get_request")
+    def test_get_capabilities_without_deadline_budget_probes_instance(
+        self, mock_send_get_request
+    ):
+        """test_get_capabilities_without_deadline_budget_probes_instance
+
+        Returns:
+
+        """
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"page_size": 20}
+        mock_send_get_request.return_value = mock_response
+
+        self.assertEqual(
+            capabilities.get_capabilities(
+                _get_data_source(), deadline_utils.Deadline(None)
+            ),
+            {"page_size": 20},
+        )
+
+
+class TestAdaptQuery(TestCase):
+    """TestAdaptQuery"""
+
+    def test_adapt_query_without_capabilities_keeps_query(self):
+        """test_adapt_query_without_capabilities_keeps_query
+
+        Returns:
+
+        """
+        json_query = {
+            "query": "{}",
+            "templates": '[{"id": 1, "hash": "hash"}]',
+            "order_by_field": "-title",
+            "count_only": True,
+        }
+        self.assertEqual(capabilities.adapt_query(json_query, {}), json_query)
+
+    def test_adapt_query_drops_unsupported_options(self):
+        """test_adapt_query_drops_unsupported_options
+
+        Returns:
+
+        """
+        json_query = capabilities.adapt_query(
+            {
+                "query": "{}",
+                "order_by_field": "-title,template",
+                "count_only": True,
+            },
+            {"count_only": False, "sort_fields": ["title"]},
+        )
+        self.assertEqual(
+            json_query, {"query": "{}", "order_by_field": "-title"}
+        )
+
+    def test_adapt_query_keeps_supported_ascending_fields(self):
+        """test_adapt_query_keeps_supported_ascending_fields
+
+        Returns:
+
+        """
+        json_query = capabilities.adapt_query(
+            {"query": "{}", "order_by_field": "+title,-template"},
+            {"sort_fields": ["title"]},
+        )
+        self.assertEqual(
+            json_query, {"query": "{}", "order_by_field": "+title"}
+        )
+
+    def test_adapt_query_keeps_known_templates(self):
+        """test_adapt_query_keeps_known_templates
+
+        Returns:
+
+        """
+        json_query = capabilities.adapt_query(
+            {
+                "templates": json.dumps(
+                    [{"id": 1, "hash": "hash_1"}, {"id": 2, "hash": "hash_2"}]
+                )
+            },
+            {"template_hashes": ["hash_2"]},
+        )
+        self.assertEqual(
+            json.loads(json_query["templates"]), [{"id": 2, "hash": "hash_2"}]
+        )
+
+    def test_adapt_query_without_known_templates_returns_none(self):
+        """test_adapt_query_without_known_templates_returns_none
+
+        Returns:
+
+        """
+        self.assertIsNone(
+            capabilities.adapt_query(
+                {"templates": '[{"id": 1, "hash": "hash_1"}]'},
+                {"template_hashes": ["hash_2"]},
+            )
+        )
@@ -0,0 +1,199 @@
+""" Circuit breaker test class
+"""
+from unittest import TestCase
+from unittest.mock import patch
+
+from core_explore_common_app.utils.federation import circuit_breaker
+from core_explore_common_app.utils.federation.circuit_breaker import (
+    CircuitBreaker,
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+)
+
+
+class TestCircuitBreaker(TestCase):
+    """TestCircuitBreaker"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.breaker = CircuitBreaker(
+            "remote", failure_threshold=2, reset_timeout=30
+        )
+
+    def test_breaker_opens_after_threshold(self):
+        """test_breaker_opens_after_threshold
+
+        Returns:
+
+        """
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertFalse(self.breaker.allow_request())
+
+    def test_success_resets_failure_count(self):
+        """test_success_resets_failure_count
+
+        Returns:
+
+        """
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CLOSED)
+
+    @patch(
+        "core_explore_common_app.utils.federation.circuit_breaker.time.monotonic"
+    )
+    def test_breaker_half_opens_with_single_probe(self, mock_monotonic):
+        """test_breaker_half_opens_with_single_probe
+
+        Returns:
+
+        """
+        mock_monotonic.return_value = 0
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+
+        mock_monotonic.return_value = 31
+
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.assertTrue(self.breaker.allow_request())
+        self.assertFalse(self.breaker.allow_request())
+
+    @patch(
+        "core_explore_common_app.utils.federation.circuit_breaker.time.monotonic"
+    )
+    def test_failed_probe_reopens_breaker(self, mock_monotonic):
+        """test_failed_probe_reopens_breaker
+
+        Returns:
+
+        """
+        mock_monotonic.return_value = 0
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        mock_monotonic.return_value = 31
+        self.breaker.allow_request()
+
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, OPEN)
+
+    @patch(
+        "core_explore_common_app.utils.federation.circuit_breaker.time.monotonic"
+    )
+    def test_successful_probe_closes_breaker(self, mock_monotonic):
+        """test_successful_probe_closes_breaker
+
+        Returns:
+
+        """
+        mock_monotonic.return_value = 0
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        mock_monotonic.return_value = 31
+        self.breaker.allow_request()
+
+        self.breaker.record_success()
+
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertTrue(self.breaker.allow_request())
+
+    @patch(
+        "core_explore_common_app.utils.federation.circuit_breaker.time.monotonic"
+    )
+    def test_released_probe_lets_another_probe_through(self, mock_monotonic):
+        """test_released_probe_lets_another_probe_through
+
+        Returns:
+
+        """
+        mock_monotonic.return_value = 0
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        mock_monotonic.return_value = 31
+        probe_token = self.breaker.allow_request()
+
+        self.breaker.release_probe(probe_token)
+
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.assertTrue(self.breaker.allow_request())
+
+    def test_release_probe_after_outcome_does_nothing(self):
+        """test_release_probe_after_outcome_does_nothing
+
+        Returns:
+
+        """
+        probe_token = self.breaker.allow_request()
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+
+        self.breaker.release_probe(probe_token)
+
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertFalse(self.breaker.allow_request())
+
+    @patch(
+        "core_explore_common_app.utils.federation.circuit_breaker.time.monotonic"
+    )
+    def test_release_of_previous_probe_keeps_current_probe(
+        self, mock_monotonic
+    ):
+        """test_release_of_previous_probe_keeps_current_probe
+
+        Returns:
+
+        """
+        mock_monotonic.return_value = 0
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        mock_monotonic.return_value = 31
+        previous_probe_token = self.breaker.allow_request()
+        self.breaker.record_failure()
+        mock_monotonic.return_value = 62
+        self.breaker.allow_request()
+
+        self.breaker.release_probe(previous_probe_token)
+
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.assertFalse(self.breaker.allow_request())
+
+
+class TestIsAvailable(TestCase):
+    """TestIsAvailable"""
+
+    def tearDown(self):
+        """tearDown
+
+        Returns:
+
+        """
+        circuit_breaker.reset_all()
+
+    def test_unknown_data_source_is_available(self):
+        """test_unknown_data_source_is_available
+
+        Returns:
+
+        """
+        self.assertTrue(circuit_breaker.is_available("http://unknown"))
+
+    def test_data_source_with_open_breaker_is_not_available(self):
+        """test_data_source_with_open_breaker_is_not_available
+
+        Returns:
+
+        """
+        breaker = circuit_breaker.get_circuit_breaker("http://remote")
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+
+        self.assertFalse(circuit_breaker.is_available("http://remote"))
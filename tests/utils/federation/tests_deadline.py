@@ -0,0 +1,39 @@
+""" Deadline test class
+"""
+from unittest import TestCase
+from unittest.mock import patch
+
+from core_explore_common_app.utils.federation.deadline import Deadline
+
+
+class TestDeadline(TestCase):
+    """TestDeadline"""
+
+    def test_deadline_without_budget_never_expires(self):
+        """test_deadline_without_budget_never_expires
+
+        Returns:
+
+        """
+        deadline = Deadline(None)
+
+        self.assertIsNone(deadline.remaining())
+        self.assertFalse(deadline.expired())
+
+    @patch("core_explore_common_app.utils.federation.deadline.time.monotonic")
+    def test_remaining_decreases_until_expired(self, mock_monotonic):
+        """test_remaining_decreases_until_expired
+
+        Returns:
+
+        """
+        mock_monotonic.return_value = 100
+        deadline = Deadline(5)
+
+        mock_monotonic.return_value = 103
+        self.assertEqual(deadline.remaining(), 2)
+        self.assertFalse(deadline.expired())
+
+        mock_monotonic.return_value = 106
+        self.assertEqual(deadline.remaining(), 0)
+        self.assertTrue(deadline.expired())
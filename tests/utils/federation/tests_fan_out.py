@@ -0,0 +1,124 @@
+""" Fan-out utils test class
+"""
+import threading
+from unittest import TestCase
+
+from django.utils import timezone
+
+from core_explore_common_app.commons.exceptions import DeadlineExceededError
+from core_explore_common_app.utils.federation import fan_out
+from core_explore_common_app.utils.federation.deadline import Deadline
+
+
+class TestIterCompleted(TestCase):
+    """TestIterCompleted"""
+
+    def test_iter_completed_returns_all_results(self):
+        """test_iter_completed_returns_all_results
+
+        Returns:
+
+        """
+        # Arrange
+        futures = fan_out.submit_all(
+            {index: (lambda i=index: i * 2) for index in range(4)}
+        )
+
+        # Act
+        results = {
+            key: result for key, result, _ in fan_out.iter_completed(futures)
+        }
+
+        # Assert
+        self.assertEqual(results, {0: 0, 1: 2, 2: 4, 3: 6})
+
+    def test_iter_completed_returns_exception_of_failing_task(self):
+        """test_iter_completed_returns_exception_of_failing_task
+
+        Returns:
+
+        """
+
+        # Arrange
+        def _fail():
+            raise ValueError("error")
+
+        futures = fan_out.submit_all({"ok": lambda: 1, "ko": _fail})
+
+        # Act
+        results = {
+            key: (result, exception)
+            for key, result, exception in fan_out.iter_completed(futures)
+        }
+
+        # Assert
+        self.assertEqual(results["ok"], (1, None))
+        self.assertIsInstance(results["ko"][1], ValueError)
+
+    def test_tasks_run_concurrently(self):
+        """test_tasks_run_concurrently
+
+        Returns:
+
+        """
+        # Arrange: each task waits for the others, deadlocks if sequential
+        barrier = threading.Barrier(3, timeout=5)
+        futures = fan_out.submit_all(
+            {index: barrier.wait for index in range(3)}
+        )
+
+        # Act
+        exceptions = [
+            exception for _, _, exception in fan_out.iter_completed(futures)
+        ]
+
+        # Assert
+        self.assertEqual(exceptions, [None, None, None])
+
+    def test_iter_completed_returns_deadline_error_for_late_tasks(self):
+        """test_iter_completed_returns_deadline_error_for_late_tasks
+
+        Returns:
+
+        """
+        # Arrange
+        release = threading.Event()
+        futures = fan_out.submit_all(
+            {"fast": lambda: 1, "slow": lambda: release.wait(5)}
+        )
+
+        # Act
+        try:
+            results = {
+                key: (result, exception)
+                for key, result, exception in fan_out.iter_completed(
+                    futures, Deadline(0.2)
+                )
+            }
+        finally:
+            release.set()
+
+        # Assert
+        self.assertEqual(results["fast"], (1, None))
+        self.assertIsInstance(results["slow"][1], DeadlineExceededError)
+
+    def test_tasks_run_with_request_time_zone(self):
+        """test_tasks_run_with_request_time_zone
+
+        Returns:
+
+        """
+        # Arrange
+        timezone.activate("Europe/Paris")
+        try:
+            futures = fan_out.submit_all(
+                {"tz": lambda: str(timezone.get_current_timezone())}
+            )
+        finally:
+            timezone.deactivate()
+
+        # Act
+        _, result, _ = next(fan_out.iter_completed(futures))
+
+        # Assert
+        self.assertEqual(result, "Europe/Paris")
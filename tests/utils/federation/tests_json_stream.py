@@ -0,0 +1,135 @@
+""" JSON stream test class
+"""
+import json
+from unittest import TestCase
+
+from core_explore_common_app.utils.federation.json_stream import (
+    ResultPageStream,
+    rewrite_metadata,
+)
+
+
+def _chunks(data, size):
+    return [data[index : index + size] for index in range(0, len(data), size)]
+
+
+class TestResultPageStream(TestCase):
+    """TestResultPageStream"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.page = {
+            "count": 123,
+            "next": "http://remote/?page=2",
+            "previous": None,
+            "results": [
+                {"title": f"title é {index}", "content": "<a>" * index}
+                for index in range(5)
+            ],
+        }
+
+    def test_stream_returns_results_and_metadata(self):
+        """test_stream_returns_results_and_metadata
+
+        Returns:
+
+        """
+        stream = ResultPageStream([json.dumps(self.page).encode()])
+
+        results = list(stream)
+
+        self.assertEqual(results, self.page["results"])
+        self.assertEqual(
+            stream.metadata,
+            {"count": 123, "next": "http://remote/?page=2", "previous": None},
+        )
+
+    def test_stream_handles_values_split_across_chunks(self):
+        """test_stream_handles_values_split_across_chunks
+
+        Returns:
+
+        """
+        data = json.dumps(self.page, indent=2, ensure_ascii=False).encode()
+        for size in (1, 2, 3, 7):
+            stream = ResultPageStream(_chunks(data, size))
+
+            self.assertEqual(list(stream), self.page["results"])
+            self.assertEqual(stream.metadata["count"], 123)
+
+    def test_stream_handles_results_before_metadata(self):
+        """test_stream_handles_results_before_metadata
+
+        Returns:
+
+        """
+        data = json.dumps(
+            {"results": self.page["results"], "count": 5}
+        ).encode()
+        stream = ResultPageStream(_chunks(data, 4))
+
+        self.assertEqual(len(list(stream)), 5)
+        self.assertEqual(stream.metadata, {"count": 5})
+
+    def test_stream_with_empty_results(self):
+        """test_stream_with_empty_results
+
+        Returns:
+
+        """
+        stream = ResultPageStream([b'{"count": 0, "results": [ ]}'])
+
+        self.assertEqual(list(stream), [])
+
+    def test_stream_with_truncated_body_raises_error(self):
+        """test_stream_with_truncated_body_raises_error
+
+        Returns:
+
+        """
+        stream = ResultPageStream([b'{"count": 1, "results": [{"title": '])
+
+        with self.assertRaises(ValueError):
+            list(stream)
+
+
+class TestRewriteMetadata(TestCase):
+    """TestRewriteMetadata"""
+
+    def test_rewrite_metadata_passes_results_through(self):
+        """test_rewrite_metadata_passes_results_through
+
+        Returns:
+
+        """
+        page = {
+            "count": 2,
+            "next": "http://remote/?page=2",
+            "results": [{"title": "é"}, {"title": "title"}],
+        }
+        data = json.dumps(page, ensure_ascii=False).encode()
+
+        body = b"".join(
+            rewrite_metadata(
+                _chunks(data, 7), lambda metadata: dict(metadata, next=2)
+            )
+        )
+
+        self.assertEqual(json.loads(body), dict(page, next=2))
+        self.assertTrue(body.endswith(data[data.index(b"[") :]))
+
+    def test_rewrite_metadata_without_results(self):
+        """test_rewrite_metadata_without_results
+
+        Returns:
+
+        """
+        body = b"".join(
+            rewrite_metadata([b'{"count": 0}'], lambda metadata: metadata)
+        )
+
+        self.assertEqual(json.loads(body), {"count": 0})
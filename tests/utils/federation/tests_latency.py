@@ -0,0 +1,118 @@
+""" Latency test class
+"""
+from unittest import TestCase
+from unittest.mock import patch
+
+from core_explore_common_app.utils.federation import latency
+from core_explore_common_app.utils.federation.latency import LatencyTracker
+
+
+class TestLatencyTracker(TestCase):
+    """TestLatencyTracker"""
+
+    def test_percentile_of_empty_tracker_is_none(self):
+        """test_percentile_of_empty_tracker_is_none
+
+        Returns:
+
+        """
+        self.assertIsNone(LatencyTracker(10).percentile(95))
+
+    def test_percentile_returns_nearest_rank(self):
+        """test_percentile_returns_nearest_rank
+
+        Returns:
+
+        """
+        tracker = LatencyTracker(100)
+        for duration in range(1, 101):
+            tracker.record(duration / 100)
+        self.assertEqual(tracker.percentile(95), 0.95)
+        self.assertEqual(tracker.percentile(50), 0.5)
+        self.assertEqual(tracker.percentile(100), 1)
+
+    def test_window_keeps_latest_samples(self):
+        """test_window_keeps_latest_samples
+
+        Returns:
+
+        """
+        tracker = LatencyTracker(3)
+        for duration in (10, 1, 1, 1):
+            tracker.record(duration)
+        self.assertEqual(len(tracker), 3)
+        self.assertEqual(tracker.percentile(100), 1)
+
+
+class TestGetTimeout(TestCase):
+    """TestGetTimeout"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        latency.clear()
+
+    @patch(
+        "core_explore_common_app.settings.EXPLORE_ADAPTIVE_TIMEOUT_MIN_SAMPLES",
+        5,
+    )
+    def test_get_timeout_is_none_until_enough_samples(self):
+        """test_get_timeout_is_none_until_enough_samples
+
+        Returns:
+
+        """
+        for _ in range(4):
+            latency.record("http://remote", 0.2)
+        self.assertIsNone(latency.get_timeout("http://remote"))
+
+    @patch(
+        "core_explore_common_app.settings.EXPLORE_ADAPTIVE_TIMEOUT_MIN_SAMPLES",
+        5,
+    )
+    @patch("core_explore_common_app.settings.EXPLORE_ADAPTIVE_TIMEOUT_MIN", 0)
+    @patch(
+        "core_explore_common_app.settings.EXPLORE_ADAPTIVE_TIMEOUT_MARGIN", 0.5
+    )
+    def test_get_timeout_adapts_to_each_data_source(self):
+        """test_get_timeout_adapts_to_each_data_source
+
+        Returns:
+
+        """
+        for _ in range(5):
+            latency.record("http://fast", 0.2)
+            latency.record("http://slow", 4)
+        self.assertEqual(latency.get_timeout("http://fast"), 0.7)
+        self.assertEqual(latency.get_timeout("http://slow"), 4.5)
+
+    @patch(
+        "core_explore_common_app.settings.EXPLORE_ADAPTIVE_TIMEOUT_MIN_SAMPLES",
+        1,
+    )
+    @patch("core_explore_common_app.settings.EXPLORE_ADAPTIVE_TIMEOUT_MIN", 2)
+    def test_get_timeout_has_lower_bound(self):
+        """test_get_timeout_has_lower_bound
+
+        Returns:
+
+        """
+        latency.record("http://remote", 0.01)
+        self.assertEqual(latency.get_timeout("http://remote"), 2)
+
+    @patch(
+        "core_explore_common_app.settings.EXPLORE_ADAPTIVE_TIMEOUT_ENABLED",
+        False,
+    )
+    def test_get_timeout_is_none_if_disabled(self):
+        """test_get_timeout_is_none_if_disabled
+
+        Returns:
+
+        """
+        for _ in range(100):
+            latency.record("http://remote", 0.2)
+        self.assertIsNone(latency.get_timeout("http://remote"))
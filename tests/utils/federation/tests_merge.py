@@ -0,0 +1,270 @@
+""" Merged stream test class
+"""
+import datetime
+from unittest import TestCase
+
+from core_explore_common_app.utils.federation import merge
+from core_explore_common_app.utils.federation.merge import (
+    MergedStream,
+    SourceCursor,
+    get_sort_key,
+)
+
+
+def _get_fetch_page(values, page_size, fetched_pages=None):
+    """Returns a fetch_page function serving sorted values page by page
+
+    Args:
+        values:
+        page_size:
+        fetched_pages: list receiving the fetched page numbers
+
+    Returns:
+
+    """
+
+    def _fetch_page(page):
+        if fetched_pages is not None:
+            fetched_pages.append(page)
+        start = (page - 1) * page_size
+        results = [
+            {"title": value} for value in values[start : start + page_size]
+        ]
+        next_page = page + 1 if start + page_size < len(values) else None
+        return results, next_page, len(values)
+
+    return _fetch_page
+
+
+class TestGetSortKey(TestCase):
+    """TestGetSortKey"""
+
+    def test_sort_key_sorts_ascending_and_descending_fields(self):
+        """test_sort_key_sorts_ascending_and_descending_fields
+
+        Returns:
+
+        """
+        results = [
+            {"title": "b", "template_info": {"id": 1, "name": "t2"}},
+            {"title": "a", "template_info": {"id": 1, "name": "t2"}},
+            {"title": "c", "template_info": {"id": 2, "name": "t1"}},
+        ]
+        sorted_results = sorted(results, key=get_sort_key("-template,title"))
+        self.assertEqual(
+            [result["title"] for result in sorted_results], ["c", "a", "b"]
+        )
+
+    def test_sort_key_sorts_template_by_id(self):
+        """test_sort_key_sorts_template_by_id
+
+        Returns:
+
+        """
+        results = [
+            {"title": "a", "template_info": {"id": "10", "name": "a"}},
+            {"title": "b", "template_info": {"id": "", "name": "b"}},
+            {"title": "c", "template_info": {"id": 9, "name": "c"}},
+        ]
+        sorted_results = sorted(results, key=get_sort_key("template"))
+        self.assertEqual(
+            [result["title"] for result in sorted_results], ["c", "a", "b"]
+        )
+
+    def test_sort_key_sorts_fields_prefixed_by_plus_ascending(self):
+        """test_sort_key_sorts_fields_prefixed_by_plus_ascending
+
+        Returns:
+
+        """
+        results = [{"title": "b"}, {"title": "c"}, {"title": "a"}]
+        sorted_results = sorted(results, key=get_sort_key("+title"))
+        self.assertEqual(
+            [result["title"] for result in sorted_results], ["a", "b", "c"]
+        )
+
+    def test_merged_stream_merges_data_sources_sorted_by_plus_field(self):
+        """test_merged_stream_merges_data_sources_sorted_by_plus_field
+
+        Returns:
+
+        """
+        stream = merge.MergedStream(
+            [
+                _get_fetch_page(["a", "d"], 2),
+                _get_fetch_page(["b", "c"], 2),
+            ],
+            "+title",
+            deduplicate=False,
+        )
+        self.assertEqual(
+            [result["title"] for result in stream.get_page(1, 4)],
+            ["a", "b", "c", "d"],
+        )
+
+    def test_sort_key_compares_dates_from_strings_and_datetimes(self):
+        """test_sort_key_compares_dates_from_strings_and_datetimes
+
+        Returns:
+
+        """
+        results = [
+            {"last_modification_date": "2023-01-02T00:00:00+01:00"},
+            {
+                "last_modification_date": datetime.datetime(
+                    2023, 1, 1, 23, 30, tzinfo=datetime.timezone.utc
+                )
+            },
+            {"last_modification_date": None},
+        ]
+        sorted_results = sorted(
+            results, key=get_sort_key("-last_modification_date")
+        )
+        self.assertEqual(sorted_results, [results[1], results[0], results[2]])
+
+
+class TestSourceCursor(TestCase):
+    """TestSourceCursor"""
+
+    def test_cursor_iterates_over_all_pages(self):
+        """test_cursor_iterates_over_all_pages
+
+        Returns:
+
+        """
+        cursor = SourceCursor(_get_fetch_page(list("abcde"), 2), 0)
+        self.assertEqual([result["title"] for result in cursor], list("abcde"))
+        self.assertEqual(cursor.count, 5)
+
+    def test_cursor_keeps_error_of_failing_data_source(self):
+        """test_cursor_keeps_error_of_failing_data_source
+
+        Returns:
+
+        """
+
+        def _fetch_page(page):
+            raise ValueError("error")
+
+        cursor = SourceCursor(_fetch_page, 0)
+        self.assertEqual(list(cursor), [])
+        self.assertIsInstance(cursor.error, ValueError)
+
+
+class TestMergedStream(TestCase):
+    """TestMergedStream"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        merge.clear()
+
+    def test_merged_stream_merges_sorted_data_sources(self):
+        """test_merged_stream_merges_sorted_data_sources
+
+        Returns:
+
+        """
+        stream = MergedStream(
+            [
+                _get_fetch_page(list("adgj"), 2),
+                _get_fetch_page(list("behk"), 2),
+                _get_fetch_page(list("cfi"), 2),
+            ],
+            "title",
+        )
+        self.assertEqual(
+            [result["title"] for result in stream.get_page(1, 5)],
+            list("abcde"),
+        )
+        self.assertEqual(
+            [result["title"] for result in stream.get_page(2, 5)],
+            list("fghij"),
+        )
+        self.assertEqual(stream.count, 11)
+
+    def test_merged_page_only_fetches_needed_pages(self):
+        """test_merged_page_only_fetches_needed_pages
+
+        Returns:
+
+        """
+        fetched_pages = [list(), list()]
+        stream = MergedStream(
+            [
+                _get_fetch_page(list(range(0, 1000, 2)), 10, fetched_pages[0]),
+                _get_fetch_page(list(range(1, 1000, 2)), 10, fetched_pages[1]),
+            ],
+            "title",
+            low_watermark=0,
+        )
+        self.assertEqual(
+            [result["title"] for result in stream.get_page(1, 10)],
+            list(range(10)),
+        )
+        self.assertEqual(fetched_pages, [[1], [1]])
+
+    def test_merged_stream_drops_duplicates_across_data_sources(self):
+        """test_merged_stream_drops_duplicates_across_data_sources
+
+        Returns:
+
+        """
+
+        def _get_results_fetch_page(titles):
+            def _fetch_page(page):
+                return (
+                    [
+                        {
+                            "title": title,
+                            "content": f"<{title}/>",
+                            "template_info": {"hash": "hash"},
+                        }
+                        for title in titles
+                    ],
+                    None,
+                    len(titles),
+                )
+
+            return _fetch_page
+
+        stream = MergedStream(
+            [
+                _get_results_fetch_page(list("abc")),
+                _get_results_fetch_page(list("bcd")),
+            ],
+            "title",
+            deduplicate=True,
+        )
+        self.assertEqual(
+            [result["title"] for result in stream.get_page(1, 10)],
+            list("abcd"),
+        )
+        self.assertEqual(stream.count, 4)
+
+    def test_get_page_reuses_stream_for_next_page(self):
+        """test_get_page_reuses_stream_for_next_page
+
+        Returns:
+
+        """
+        created_streams = list()
+
+        def _create_stream():
+            created_streams.append(
+                MergedStream([_get_fetch_page(list("abcdef"), 2)], "title")
+            )
+            return created_streams[-1]
+
+        first_page, _ = merge.get_page("key", 1, 2, _create_stream)
+        second_page, _ = merge.get_page("key", 2, 2, _create_stream)
+        self.assertEqual(len(created_streams), 1)
+        first_page_again, _ = merge.get_page("key", 1, 2, _create_stream)
+        self.assertEqual(len(created_streams), 2)
+        self.assertEqual(first_page, first_page_again)
+        self.assertEqual(
+            [result["title"] for result in second_page], ["c", "d"]
+        )
@@ -0,0 +1,133 @@
+""" Prefetch test class
+"""
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+from core_explore_common_app.utils.federation import prefetch
+
+
+class TestPrefetch(TestCase):
+    """TestPrefetch"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        prefetch.clear()
+
+    def tearDown(self):
+        """tearDown
+
+        Returns:
+
+        """
+        prefetch.clear()
+
+    def _wait_for_pending(self, scope):
+        pending = prefetch._pending.get(scope)
+        if pending is not None:
+            pending[1].result(timeout=5)
+
+    def test_get_key_changes_with_query(self):
+        """test_get_key_changes_with_query
+
+        Returns:
+
+        """
+        scope = prefetch.get_scope(1, 1, 0)
+
+        self.assertNotEqual(
+            prefetch.get_key(scope, {"order_by_field": "title"}, 2),
+            prefetch.get_key(scope, {"order_by_field": "-title"}, 2),
+        )
+
+    def test_scheduled_page_is_staged_once(self):
+        """test_scheduled_page_is_staged_once
+
+        Returns:
+
+        """
+        scope = prefetch.get_scope(1, 1, 0)
+        key = prefetch.get_key(scope, {}, 2)
+
+        prefetch.schedule(scope, key, lambda: {"results": "page 2"})
+        self._wait_for_pending(scope)
+
+        self.assertEqual(prefetch.pop_staged(key), {"results": "page 2"})
+        self.assertIsNone(prefetch.pop_staged(key))
+
+    def test_schedule_cancels_pending_prefetch_of_previous_query(self):
+        """test_schedule_cancels_pending_prefetch_of_previous_query
+
+        Returns:
+
+        """
+        scope = prefetch.get_scope(1, 1, 0)
+        release = threading.Event()
+        # keep the prefetch workers busy
+        busy_scopes = [f"busy_{index}" for index in range(2)]
+        for busy_scope in busy_scopes:
+            prefetch.schedule(busy_scope, busy_scope, lambda: release.wait(5))
+        try:
+            old_key = prefetch.get_key(scope, {"query": "old"}, 2)
+            prefetch.schedule(scope, old_key, lambda: "old")
+            old_future = prefetch._pending[scope][1]
+
+            new_key = prefetch.get_key(scope, {"query": "new"}, 2)
+            prefetch.schedule(scope, new_key, lambda: "new")
+        finally:
+            release.set()
+        self._wait_for_pending(scope)
+
+        self.assertTrue(old_future.cancelled())
+        self.assertIsNone(prefetch.pop_staged(old_key))
+        self.assertEqual(prefetch.pop_staged(new_key), "new")
+
+    @patch("core_explore_common_app.settings.EXPLORE_PREFETCH_QUEUE_SIZE", 0)
+    def test_schedule_drops_prefetch_when_queue_is_full(self):
+        """test_schedule_drops_prefetch_when_queue_is_full
+
+        Returns:
+
+        """
+        scope = prefetch.get_scope(1, 1, 0)
+
+        prefetch.schedule(scope, "key", lambda: "page")
+
+        self.assertNotIn(scope, prefetch._pending)
+
+    @patch.object(prefetch, "_executor", None)
+    @patch.object(prefetch, "ThreadPoolExecutor")
+    def test_concurrent_calls_create_a_single_executor(
+        self, mock_thread_pool_executor
+    ):
+        """test_concurrent_calls_create_a_single_executor
+
+        Returns:
+
+        """
+        barrier = threading.Barrier(8)
+
+        def _create_executor(**kwargs):
+            # let the other threads reach the check meanwhile
+            threading.Event().wait(0.05)
+            return object()
+
+        mock_thread_pool_executor.side_effect = _create_executor
+        executors = list()
+
+        def _get_executor():
+            barrier.wait()
+            executors.append(prefetch._get_executor())
+
+        threads = [threading.Thread(target=_get_executor) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(mock_thread_pool_executor.call_count, 1)
+        self.assertEqual(len(set(map(id, executors))), 1)
@@ -0,0 +1,106 @@
+""" Result cache test class
+"""
+from unittest import TestCase
+from unittest.mock import patch
+
+from django.core.cache import caches
+
+from core_explore_common_app.utils.federation import result_cache
+
+DATA_SOURCE = {"url_query": "http://remote:8000/rest/explore"}
+
+
+class TestGetCacheKey(TestCase):
+    """TestGetCacheKey"""
+
+    def test_cache_key_ignores_json_formatting(self):
+        """test_cache_key_ignores_json_formatting
+
+        Returns:
+
+        """
+        self.assertEqual(
+            result_cache.get_cache_key(
+                DATA_SOURCE, {"query": '{"a": 1, "b": 2}'}, 1
+            ),
+            result_cache.get_cache_key(
+                DATA_SOURCE, {"query": '{"b":2,"a":1}'}, "1"
+            ),
+        )
+
+    def test_cache_key_depends_on_page(self):
+        """test_cache_key_depends_on_page
+
+        Returns:
+
+        """
+        self.assertNotEqual(
+            result_cache.get_cache_key(DATA_SOURCE, {"query": "{}"}, 1),
+            result_cache.get_cache_key(DATA_SOURCE, {"query": "{}"}, 2),
+        )
+
+    def test_cache_key_depends_on_order_by_field(self):
+        """test_cache_key_depends_on_order_by_field
+
+        Returns:
+
+        """
+        self.assertNotEqual(
+            result_cache.get_cache_key(
+                DATA_SOURCE, {"query": "{}", "order_by_field": "title"}, 1
+            ),
+            result_cache.get_cache_key(
+                DATA_SOURCE, {"query": "{}", "order_by_field": "-title"}, 1
+            ),
+        )
+
+    def test_cache_key_depends_on_data_source(self):
+        """test_cache_key_depends_on_data_source
+
+        Returns:
+
+        """
+        self.assertNotEqual(
+            result_cache.get_cache_key(DATA_SOURCE, {"query": "{}"}, 1),
+            result_cache.get_cache_key(
+                {"url_query": "http://other"}, {"query": "{}"}, 1
+            ),
+        )
+
+
+class TestResultPageCache(TestCase):
+    """TestResultPageCache"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        result_cache.clear()
+
+    def test_get_result_page_returns_cached_page(self):
+        """test_get_result_page_returns_cached_page
+
+        Returns:
+
+        """
+        result_cache.set_result_page("key", {"results": []})
+
+        self.assertEqual(result_cache.get_result_page("key"), {"results": []})
+
+    @patch(
+        "core_explore_common_app.settings.EXPLORE_RESULT_CACHE_BACKEND",
+        "default",
+    )
+    def test_set_result_page_uses_django_cache_backend(self):
+        """test_set_result_page_uses_django_cache_backend
+
+        Returns:
+
+        """
+        result_cache.set_result_page("key", {"results": []})
+
+        self.assertEqual(caches["default"].get("key"), {"results": []})
+        self.assertIsNone(result_cache._local_cache.get("key"))
+        caches["default"].delete("key")
@@ -0,0 +1,160 @@
+""" Retry test class
+"""
+from unittest import TestCase
+from unittest.mock import patch
+
+from core_explore_common_app.utils.federation import retry
+from core_explore_common_app.utils.federation.deadline import Deadline
+from core_explore_common_app.utils.federation.retry import (
+    RetryBudget,
+    RetryPolicy,
+)
+
+
+class TestRetryPolicy(TestCase):
+    """TestRetryPolicy"""
+
+    def test_delay_grows_exponentially(self):
+        """test_delay_grows_exponentially
+
+        Returns:
+
+        """
+        policy = RetryPolicy(max_attempts=5, base_delay=1, max_delay=100)
+        with patch("random.uniform", side_effect=lambda low, high: high):
+            delays = [policy.get_delay(attempt) for attempt in (1, 2, 3)]
+        self.assertEqual(delays, [1, 2, 4])
+
+    def test_delay_is_capped(self):
+        """test_delay_is_capped
+
+        Returns:
+
+        """
+        policy = RetryPolicy(max_attempts=5, base_delay=1, max_delay=3)
+        with patch("random.uniform", side_effect=lambda low, high: high):
+            self.assertEqual(policy.get_delay(10), 3)
+
+    def test_delay_has_full_jitter(self):
+        """test_delay_has_full_jitter
+
+        Returns:
+
+        """
+        policy = RetryPolicy(max_attempts=5, base_delay=1, max_delay=3)
+        for _ in range(100):
+            self.assertTrue(0 <= policy.get_delay(2) <= 2)
+
+
+class TestRetryBudget(TestCase):
+    """TestRetryBudget"""
+
+    def test_withdraw_fails_when_budget_is_spent(self):
+        """test_withdraw_fails_when_budget_is_spent
+
+        Returns:
+
+        """
+        budget = RetryBudget(ratio=0.5, max_tokens=2)
+        self.assertTrue(budget.withdraw())
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+
+    def test_requests_earn_retries(self):
+        """test_requests_earn_retries
+
+        Returns:
+
+        """
+        budget = RetryBudget(ratio=0.5, max_tokens=2)
+        budget.withdraw()
+        budget.withdraw()
+        budget.record_request()
+        budget.record_request()
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+
+    def test_budget_is_capped(self):
+        """test_budget_is_capped
+
+        Returns:
+
+        """
+        budget = RetryBudget(ratio=1, max_tokens=2)
+        for _ in range(10):
+            budget.record_request()
+        self.assertEqual(budget.tokens, 2)
+
+
+class TestGetRetryDelay(TestCase):
+    """TestGetRetryDelay"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        retry.clear()
+
+    @patch("core_explore_common_app.settings.EXPLORE_RETRY_MAX_ATTEMPTS", 3)
+    def test_no_retry_after_max_attempts(self):
+        """test_no_retry_after_max_attempts
+
+        Returns:
+
+        """
+        self.assertIsNotNone(retry.get_retry_delay("http://remote", 2))
+        self.assertIsNone(retry.get_retry_delay("http://remote", 3))
+
+    @patch(
+        "core_explore_common_app.settings.EXPLORE_RETRY_POLICIES",
+        {"http://remote": {"max_attempts": 1}},
+    )
+    def test_policy_of_data_source_overrides_defaults(self):
+        """test_policy_of_data_source_overrides_defaults
+
+        Returns:
+
+        """
+        self.assertIsNone(retry.get_retry_delay("http://remote", 1))
+        self.assertIsNotNone(retry.get_retry_delay("http://other", 1))
+
+    @patch("core_explore_common_app.settings.EXPLORE_RETRY_MAX_DELAY", 5)
+    def test_retry_after_header_is_honored(self):
+        """test_retry_after_header_is_honored
+
+        Returns:
+
+        """
+        self.assertEqual(
+            retry.get_retry_delay("http://remote", 1, retry_after="2"), 2
+        )
+        self.assertIsNone(
+            retry.get_retry_delay("http://remote", 1, retry_after="60")
+        )
+
+    @patch("core_explore_common_app.settings.EXPLORE_RETRY_BASE_DELAY", 1)
+    @patch("core_explore_common_app.settings.EXPLORE_RETRY_MAX_DELAY", 1)
+    def test_no_retry_past_deadline(self):
+        """test_no_retry_past_deadline
+
+        Returns:
+
+        """
+        with patch("random.uniform", side_effect=lambda low, high: high):
+            self.assertIsNone(
+                retry.get_retry_delay(
+                    "http://remote", 1, deadline=Deadline(0.5)
+                )
+            )
+
+    @patch("core_explore_common_app.settings.EXPLORE_RETRY_BUDGET_MAX", 1)
+    def test_no_retry_when_budget_is_spent(self):
+        """test_no_retry_when_budget_is_spent
+
+        Returns:
+
+        """
+        self.assertIsNotNone(retry.get_retry_delay("http://remote", 1))
+        self.assertIsNone(retry.get_retry_delay("http://remote", 1))
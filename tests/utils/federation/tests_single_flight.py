@@ -0,0 +1,129 @@
+""" Single-flight test class
+"""
+import threading
+import time
+from unittest import TestCase
+
+from core_explore_common_app.utils.federation import single_flight
+
+
+class TestSingleFlight(TestCase):
+    """TestSingleFlight"""
+
+    def test_do_returns_function_result(self):
+        """test_do_returns_function_result
+
+        Returns:
+
+        """
+        self.assertEqual(single_flight.do("key", lambda: 1), 1)
+        self.assertEqual(single_flight.in_flight(), 0)
+
+    def test_identical_calls_in_flight_run_once(self):
+        """test_identical_calls_in_flight_run_once
+
+        Returns:
+
+        """
+        calls = list()
+        started = threading.Event()
+        release = threading.Event()
+
+        def _function():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "result"
+
+        results = list()
+        leader = threading.Thread(
+            target=lambda: results.append(single_flight.do("key", _function))
+        )
+        leader.start()
+        started.wait(5)
+        waiters = [
+            threading.Thread(
+                target=lambda: results.append(
+                    single_flight.do("key", _function)
+                )
+            )
+            for _ in range(5)
+        ]
+        for waiter in waiters:
+            waiter.start()
+        # let the waiters reach the call in flight
+        time.sleep(0.05)
+        release.set()
+        for thread in [leader] + waiters:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["result"] * 6)
+
+    def test_waiters_get_the_exception(self):
+        """test_waiters_get_the_exception
+
+        Returns:
+
+        """
+        started = threading.Event()
+        release = threading.Event()
+
+        def _function():
+            started.set()
+            release.wait(5)
+            raise ValueError("error")
+
+        exceptions = list()
+
+        def _call():
+            try:
+                single_flight.do("key", _function)
+            except ValueError as exception:
+                exceptions.append(exception)
+
+        leader = threading.Thread(target=_call)
+        leader.start()
+        started.wait(5)
+        waiter = threading.Thread(target=_call)
+        waiter.start()
+        time.sleep(0.05)
+        release.set()
+        leader.join()
+        waiter.join()
+
+        self.assertEqual(len(exceptions), 2)
+
+    def test_waiter_times_out(self):
+        """test_waiter_times_out
+
+        Returns:
+
+        """
+        started = threading.Event()
+        release = threading.Event()
+
+        def _function():
+            started.set()
+            release.wait(5)
+
+        leader = threading.Thread(
+            target=single_flight.do, args=("key", _function)
+        )
+        leader.start()
+        started.wait(5)
+        try:
+            with self.assertRaises(TimeoutError):
+                single_flight.do("key", _function, timeout=0.01)
+        finally:
+            release.set()
+            leader.join()
+
+    def test_different_keys_run_separately(self):
+        """test_different_keys_run_separately
+
+        Returns:
+
+        """
+        self.assertEqual(single_flight.do("key_1", lambda: 1), 1)
+        self.assertEqual(single_flight.do("key_2", lambda: 2), 2)
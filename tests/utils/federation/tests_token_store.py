@@ -0,0 +1,235 @@
+""" Token store test class
+"""
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+
+from core_explore_common_app.utils.federation import token_store
+
+
+def _get_data_source(
+    url_query="https://remote.example.org/cdcs/rest/data/query/", **params
+):
+    """Returns a data source
+
+    Args:
+        url_query:
+        params:
+
+    Returns:
+
+    """
+    return {
+        "url_query": url_query,
+        "authentication": {
+            "auth_type": "oauth2",
+            "params": {"access_token": "token", **params},
+        },
+    }
+
+
+def _get_refresh_response(access_token="new_token", expires_in=3600):
+    """Returns a mocked token response
+
+    Args:
+        access_token:
+        expires_in:
+
+    Returns:
+
+    """
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {
+        "access_token": access_token,
+        "refresh_token": "new_refresh_token",
+        "expires_in": expires_in,
+    }
+    return response
+
+
+class TestTokenStore(TestCase):
+    """TestTokenStore"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        token_store.clear()
+        self.credentials = {
+            "refresh_token": "refresh_token",
+            "client_id": "client_id",
+            "client_secret": "client_secret",
+            "endpoint": "https://remote.example.org/cdcs/",
+        }
+
+    def test_get_access_token_returns_data_source_token(self):
+        """test_get_access_token_returns_data_source_token
+
+        Returns:
+
+        """
+        self.assertEqual(
+            token_store.get_access_token(_get_data_source()), "token"
+        )
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.post_refresh_token")
+    def test_valid_token_is_not_refreshed(self, mock_post_refresh_token):
+        """test_valid_token_is_not_refreshed
+
+        Returns:
+
+        """
+        data_source = _get_data_source(
+            expires=time.time() + 3600, **self.credentials
+        )
+        self.assertEqual(token_store.get_access_token(data_source), "token")
+        mock_post_refresh_token.assert_not_called()
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.post_refresh_token")
+    def test_token_expiring_soon_is_refreshed(self, mock_post_refresh_token):
+        """test_token_expiring_soon_is_refreshed
+
+        Returns:
+
+        """
+        mock_post_refresh_token.return_value = _get_refresh_response()
+        data_source = _get_data_source(
+            expires=time.time() + 1, **self.credentials
+        )
+        self.assertEqual(
+            token_store.get_access_token(data_source), "new_token"
+        )
+        self.assertEqual(
+            token_store.get_access_token(data_source), "new_token"
+        )
+        mock_post_refresh_token.assert_called_once()
+        self.assertEqual(
+            mock_post_refresh_token.call_args[0][0],
+            "https://remote.example.org/cdcs",
+        )
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.post_refresh_token")
+    def test_token_without_credentials_is_not_refreshed(
+        self, mock_post_refresh_token
+    ):
+        """test_token_without_credentials_is_not_refreshed
+
+        Returns:
+
+        """
+        data_source = _get_data_source(expires=time.time() - 1)
+        self.assertEqual(token_store.get_access_token(data_source), "token")
+        mock_post_refresh_token.assert_not_called()
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.post_refresh_token")
+    def test_failed_refresh_keeps_token_and_waits(
+        self, mock_post_refresh_token
+    ):
+        """test_failed_refresh_keeps_token_and_waits
+
+        Returns:
+
+        """
+        mock_post_refresh_token.side_effect = Exception("unreachable")
+        data_source = _get_data_source(
+            expires=time.time() + 1, **self.credentials
+        )
+        self.assertEqual(token_store.get_access_token(data_source), "token")
+        self.assertEqual(token_store.get_access_token(data_source), "token")
+        mock_post_refresh_token.assert_called_once()
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.post_refresh_token")
+    def test_concurrent_requests_refresh_once(self, mock_post_refresh_token):
+        """test_concurrent_requests_refresh_once
+
+        Returns:
+
+        """
+
+        def _slow_refresh(*args):
+            time.sleep(0.05)
+            return _get_refresh_response()
+
+        mock_post_refresh_token.side_effect = _slow_refresh
+        data_source = _get_data_source(
+            expires=time.time() + 1, **self.credentials
+        )
+        access_tokens = list()
+        threads = [
+            threading.Thread(
+                target=lambda: access_tokens.append(
+                    token_store.get_access_token(data_source)
+                )
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(access_tokens, ["new_token"] * 8)
+        mock_post_refresh_token.assert_called_once()
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.post_refresh_token")
+    def test_invalidate_forces_refresh(self, mock_post_refresh_token):
+        """test_invalidate_forces_refresh
+
+        Returns:
+
+        """
+        mock_post_refresh_token.return_value = _get_refresh_response()
+        data_source = _get_data_source(
+            expires=time.time() + 3600, **self.credentials
+        )
+        self.assertEqual(token_store.get_access_token(data_source), "token")
+        token_store.invalidate(data_source)
+        self.assertEqual(
+            token_store.get_access_token(data_source), "new_token"
+        )
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.post_refresh_token")
+    def test_token_without_endpoint_is_not_refreshed(
+        self, mock_post_refresh_token
+    ):
+        """test_token_without_endpoint_is_not_refreshed
+
+        Returns:
+
+        """
+        del self.credentials["endpoint"]
+        data_source = _get_data_source(
+            expires=time.time() - 1, **self.credentials
+        )
+        self.assertEqual(token_store.get_access_token(data_source), "token")
+        mock_post_refresh_token.assert_not_called()
+
+    def test_instances_under_different_paths_do_not_share_token(self):
+        """test_instances_under_different_paths_do_not_share_token
+
+        Returns:
+
+        """
+        data_source = _get_data_source(
+            "https://remote.example.org/a/rest/data/query/",
+            refresh_token="refresh_token",
+            client_id="client_id",
+            client_secret="client_secret",
+            endpoint="https://remote.example.org/a",
+        )
+        other_data_source = _get_data_source(
+            "https://remote.example.org/b/rest/data/query/",
+            refresh_token="refresh_token",
+            client_id="client_id",
+            client_secret="client_secret",
+            endpoint="https://remote.example.org/b",
+        )
+        other_data_source["authentication"]["params"]["access_token"] = "other"
+
+        self.assertEqual(token_store.get_access_token(data_source), "token")
+        self.assertEqual(
+            token_store.get_access_token(other_data_source), "other"
+        )
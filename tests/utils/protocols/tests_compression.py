@@ -0,0 +1,145 @@
+""" Compressed transport test class
+"""
+import gzip
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory
+
+from core_explore_common_app.utils.protocols import compression, sessions
+
+CONTENT = b"<root><element>value</element></root>" * 100
+
+
+class TestGetAcceptEncoding(TestCase):
+    """TestGetAcceptEncoding"""
+
+    def tearDown(self):
+        """tearDown
+
+        Returns:
+
+        """
+        sessions.close_all()
+
+    def test_get_accept_encoding_accepts_gzip(self):
+        """test_get_accept_encoding_accepts_gzip
+
+        Returns:
+
+        """
+        self.assertIn("gzip", compression.get_accept_encoding())
+
+    @patch(
+        "core_explore_common_app.settings.EXPLORE_HTTP_COMPRESSION",
+        False,
+    )
+    def test_get_accept_encoding_returns_identity_if_disabled(self):
+        """test_get_accept_encoding_returns_identity_if_disabled
+
+        Returns:
+
+        """
+        self.assertEqual(compression.get_accept_encoding(), "identity")
+
+    def test_session_sends_accept_encoding(self):
+        """test_session_sends_accept_encoding
+
+        Returns:
+
+        """
+        session = sessions.get_session("https://remote:8000/rest/explore/")
+        self.assertEqual(
+            session.headers["Accept-Encoding"],
+            compression.get_accept_encoding(),
+        )
+
+
+class TestCompressionMiddleware(TestCase):
+    """TestCompressionMiddleware"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.factory = RequestFactory()
+        self.middleware = compression.CompressionMiddleware(
+            lambda request: None
+        )
+
+    def test_response_is_gzipped_if_accepted(self):
+        """test_response_is_gzipped_if_accepted
+
+        Returns:
+
+        """
+        request = self.factory.get("/", HTTP_ACCEPT_ENCODING="gzip")
+        response = self.middleware.process_response(
+            request, HttpResponse(CONTENT)
+        )
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), CONTENT)
+
+    def test_response_is_not_compressed_if_not_accepted(self):
+        """test_response_is_not_compressed_if_not_accepted
+
+        Returns:
+
+        """
+        request = self.factory.get("/")
+        response = self.middleware.process_response(
+            request, HttpResponse(CONTENT)
+        )
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response.content, CONTENT)
+
+    @patch.object(compression, "zstandard", None)
+    def test_response_falls_back_to_gzip_without_zstandard(self):
+        """test_response_falls_back_to_gzip_without_zstandard
+
+        Returns:
+
+        """
+        request = self.factory.get("/", HTTP_ACCEPT_ENCODING="zstd, gzip")
+        response = self.middleware.process_response(
+            request, HttpResponse(CONTENT)
+        )
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+
+    def test_streaming_response_is_gzipped(self):
+        """test_streaming_response_is_gzipped
+
+        Returns:
+
+        """
+        request = self.factory.get("/", HTTP_ACCEPT_ENCODING="gzip")
+        response = self.middleware.process_response(
+            request, StreamingHttpResponse([CONTENT, CONTENT])
+        )
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(
+            gzip.decompress(b"".join(response.streaming_content)),
+            CONTENT * 2,
+        )
+
+    @skipIf(compression.zstandard is None, "zstandard is not installed")
+    def test_response_is_zstd_compressed_if_accepted(self):
+        """test_response_is_zstd_compressed_if_accepted
+
+        Returns:
+
+        """
+        request = self.factory.get("/", HTTP_ACCEPT_ENCODING="zstd, gzip")
+        response = self.middleware.process_response(
+            request, HttpResponse(CONTENT)
+        )
+        self.assertEqual(response.headers["Content-Encoding"], "zstd")
+        self.assertEqual(
+            compression.zstandard.ZstdDecompressor().decompress(
+                response.content
+            ),
+            CONTENT,
+        )
@@ -0,0 +1,79 @@
+""" Pooled sessions test class
+"""
+from unittest import TestCase
+from unittest.mock import patch
+
+from core_explore_common_app.utils.protocols import oauth2, sessions
+
+
+class TestGetSession(TestCase):
+    """TestGetSession"""
+
+    def tearDown(self):
+        """tearDown
+
+        Returns:
+
+        """
+        sessions.close_all()
+
+    def test_get_session_returns_same_session_for_same_host(self):
+        """test_get_session_returns_same_session_for_same_host
+
+        Returns:
+
+        """
+        self.assertIs(
+            sessions.get_session("https://remote:8000/rest/explore/"),
+            sessions.get_session("https://remote:8000/o/token/"),
+        )
+
+    def test_get_session_returns_different_sessions_for_different_hosts(
+        self,
+    ):
+        """test_get_session_returns_different_sessions_for_different_hosts
+
+        Returns:
+
+        """
+        self.assertIsNot(
+            sessions.get_session("https://remote_1/rest/explore/"),
+            sessions.get_session("https://remote_2/rest/explore/"),
+        )
+
+    @patch("core_explore_common_app.utils.protocols.sessions.time.monotonic")
+    def test_get_session_evicts_idle_sessions(self, mock_monotonic):
+        """test_get_session_evicts_idle_sessions
+
+        Returns:
+
+        """
+        # Arrange
+        mock_monotonic.return_value = 0
+        session = sessions.get_session("https://remote/")
+
+        # Act
+        mock_monotonic.return_value = (
+            sessions.settings.EXPLORE_HTTP_SESSION_IDLE_TIMEOUT + 1
+        )
+
+        # Assert
+        self.assertIsNot(sessions.get_session("https://remote/"), session)
+
+
+class TestOauth2SendPostRequest(TestCase):
+    """TestOauth2SendPostRequest"""
+
+    @patch("core_explore_common_app.utils.protocols.sessions.get_session")
+    def test_send_post_request_uses_pooled_session(self, mock_get_session):
+        """test_send_post_request_uses_pooled_session
+
+        Returns:
+
+        """
+        # Act
+        oauth2.send_post_request("https://remote/rest/", {}, "token")
+
+        # Assert
+        mock_get_session.assert_called_with("https://remote/rest/")
+        self.assertTrue(mock_get_session.return_value.post.called)
@@ -0,0 +1,94 @@
+""" Count cache test class
+"""
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from core_explore_common_app.utils.query import count_cache
+
+
+class TestCountCache(TestCase):
+    """TestCountCache"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        count_cache.clear()
+        self.user = MagicMock(id=1)
+        self.raw_query = {"$and": [{"template": {"$in": [1, 2]}}, {"a": 1}]}
+
+    def test_count_is_cached_per_user(self):
+        """test_count_is_cached_per_user
+
+        Returns:
+
+        """
+        count_cache.set_count(
+            count_cache.get_key(self.raw_query, self.user), 10
+        )
+        self.assertEqual(
+            count_cache.get_count(
+                count_cache.get_key(self.raw_query, self.user)
+            ),
+            10,
+        )
+        self.assertIsNone(
+            count_cache.get_count(
+                count_cache.get_key(self.raw_query, MagicMock(id=2))
+            )
+        )
+
+    def test_data_write_invalidates_counts_of_its_template(self):
+        """test_data_write_invalidates_counts_of_its_template
+
+        Returns:
+
+        """
+        key = count_cache.get_key(self.raw_query, self.user)
+        other_key = count_cache.get_key({"template": {"$in": [3]}}, self.user)
+        count_cache.set_count(key, 10)
+        count_cache.set_count(other_key, 5)
+
+        count_cache.invalidate(2)
+
+        self.assertNotEqual(
+            count_cache.get_key(self.raw_query, self.user), key
+        )
+        self.assertEqual(
+            count_cache.get_key({"template": {"$in": [3]}}, self.user),
+            other_key,
+        )
+
+    def test_data_write_invalidates_counts_of_queries_on_all_templates(self):
+        """test_data_write_invalidates_counts_of_queries_on_all_templates
+
+        Returns:
+
+        """
+        key = count_cache.get_key({"a": 1}, self.user)
+        count_cache.invalidate(3)
+        self.assertNotEqual(count_cache.get_key({"a": 1}, self.user), key)
+
+    def test_data_signal_invalidates_counts(self):
+        """test_data_signal_invalidates_counts
+
+        Returns:
+
+        """
+        key = count_cache.get_key(self.raw_query, self.user)
+        count_cache._on_data_change(None, instance=MagicMock(template_id=1))
+        self.assertNotEqual(
+            count_cache.get_key(self.raw_query, self.user), key
+        )
+
+    @patch("core_explore_common_app.settings.EXPLORE_COUNT_CACHE_TTL", 0)
+    def test_disabled_cache_returns_none(self):
+        """test_disabled_cache_returns_none
+
+        Returns:
+
+        """
+        count_cache.set_count("key", 10)
+        self.assertIsNone(count_cache.get_count("key"))
@@ -0,0 +1,179 @@
+""" Keyset pagination test class
+"""
+import datetime
+
+from django.core.paginator import Paginator
+from django.test import SimpleTestCase, TestCase
+
+from core_explore_common_app.utils.query import keyset
+from core_main_app.components.data.models import Data
+from core_main_app.components.template.models import Template
+
+
+class TestCursor(SimpleTestCase):
+    """TestCursor"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.result = Data(
+            id=7,
+            title="title",
+            last_modification_date=datetime.datetime(2023, 1, 1),
+        )
+        self.order_by_field = ["-last_modification_date", "title"]
+
+    def test_decode_returns_position_of_encoded_cursor(self):
+        """test_decode_returns_position_of_encoded_cursor
+
+        Returns:
+
+        """
+        cursor = keyset.encode_cursor(self.order_by_field, self.result, 3)
+
+        self.assertEqual(
+            keyset.decode_cursor(
+                cursor, Data.objects.none(), self.order_by_field
+            ),
+            ([self.result.last_modification_date, "title"], 7, 3),
+        )
+
+    def test_decode_cursor_of_another_order_returns_none(self):
+        """test_decode_cursor_of_another_order_returns_none
+
+        Returns:
+
+        """
+        cursor = keyset.encode_cursor(self.order_by_field, self.result, 3)
+
+        self.assertIsNone(
+            keyset.decode_cursor(cursor, Data.objects.none(), ["title"])
+        )
+
+    def test_decode_invalid_cursor_returns_none(self):
+        """test_decode_invalid_cursor_returns_none
+
+        Returns:
+
+        """
+        self.assertIsNone(
+            keyset.decode_cursor(
+                "invalid", Data.objects.none(), self.order_by_field
+            )
+        )
+
+    def test_is_supported_requires_model_fields(self):
+        """test_is_supported_requires_model_fields
+
+        Returns:
+
+        """
+        self.assertTrue(
+            keyset.is_supported(Data.objects.none(), self.order_by_field)
+        )
+        self.assertFalse(keyset.is_supported(Data.objects.none(), ["unknown"]))
+        self.assertFalse(keyset.is_supported([], self.order_by_field))
+
+
+class TestGetPage(TestCase):
+    """TestGetPage"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        template = Template.objects.create(
+            filename="template.xsd", content="<schema/>", _hash="hash"
+        )
+        dates = [datetime.datetime(2023, 1, day) for day in (1, 2, 2, 3)] + [
+            None
+        ]
+        Data.objects.bulk_create(
+            Data(
+                template=template,
+                user_id="1",
+                title=f"data_{index}",
+                last_modification_date=date,
+            )
+            for index, date in enumerate(dates)
+        )
+        self.order_by_field = ["-last_modification_date"]
+        self.data_list = keyset.order(Data.objects.all(), self.order_by_field)
+
+    def test_cursor_pages_match_offset_pages(self):
+        """test_cursor_pages_match_offset_pages
+
+        Returns:
+
+        """
+        paginator = Paginator(self.data_list, 2)
+        offset_titles = [
+            [data.title for data in paginator.page(number)]
+            for number in paginator.page_range
+        ]
+
+        cursor_titles = list()
+        page = keyset.set_next_cursor(paginator.page(1), self.order_by_field)
+        cursor_titles.append([data.title for data in page])
+        while page.next_cursor is not None:
+            page = keyset.set_next_cursor(
+                keyset.get_page(
+                    paginator, self.order_by_field, page.next_cursor
+                ),
+                self.order_by_field,
+            )
+            cursor_titles.append([data.title for data in page])
+
+        self.assertEqual(cursor_titles, offset_titles)
+        self.assertEqual(
+            offset_titles,
+            [["data_3", "data_1"], ["data_2", "data_0"], ["data_4"]],
+        )
+        self.assertEqual(page.number, 3)
+
+    def test_cursor_pages_match_offset_pages_with_sub_millisecond_dates(
+        self,
+    ):
+        """test_cursor_pages_match_offset_pages_with_sub_millisecond_dates
+
+        Returns:
+
+        """
+        Data.objects.all().delete()
+        template = Template.objects.first()
+        base_date = datetime.datetime(2023, 1, 1, 12, 0, 0, 123000)
+        Data.objects.bulk_create(
+            Data(
+                template=template,
+                user_id="1",
+                title=f"date_{index}",
+                last_modification_date=base_date
+                - datetime.timedelta(microseconds=100 * index),
+            )
+            for index in range(6)
+        )
+        paginator = Paginator(self.data_list.all(), 2)
+        offset_titles = [
+            [data.title for data in paginator.page(number)]
+            for number in paginator.page_range
+        ]
+
+        cursor_titles = list()
+        page = keyset.set_next_cursor(paginator.page(1), self.order_by_field)
+        cursor_titles.append([data.title for data in page])
+        while page.next_cursor is not None:
+            page = keyset.set_next_cursor(
+                keyset.get_page(
+                    paginator, self.order_by_field, page.next_cursor
+                ),
+                self.order_by_field,
+            )
+            cursor_titles.append([data.title for data in page])
+
+        self.assertEqual(cursor_titles, offset_titles)
+        self.assertEqual(len(cursor_titles), 3)
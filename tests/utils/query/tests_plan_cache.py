@@ -0,0 +1,141 @@
+""" Query plan cache test class
+"""
+from unittest import TestCase
+from unittest.mock import patch
+
+from core_explore_common_app.rest.query import views as query_views
+from core_explore_common_app.utils.query import plan_cache
+
+
+class TestPlanCache(TestCase):
+    """TestPlanCache"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        plan_cache.clear()
+
+    def test_key_ignores_json_formatting(self):
+        """test_key_ignores_json_formatting
+
+        Returns:
+
+        """
+        self.assertEqual(
+            plan_cache.get_key(
+                {"query": '{"a": 1, "b": 2}', "templates": "[]"}
+            ),
+            plan_cache.get_key({"query": {"b": 2, "a": 1}, "templates": []}),
+        )
+
+    def test_key_ignores_page_and_order(self):
+        """test_key_ignores_page_and_order
+
+        Returns:
+
+        """
+        self.assertEqual(
+            plan_cache.get_key({"query": "{}", "order_by_field": "title"}),
+            plan_cache.get_key({"query": "{}", "order_by_field": "-title"}),
+        )
+
+    def test_key_changes_with_options(self):
+        """test_key_changes_with_options
+
+        Returns:
+
+        """
+        self.assertNotEqual(
+            plan_cache.get_key({"query": "{}", "options": {"visibility": 1}}),
+            plan_cache.get_key({"query": "{}", "options": {"visibility": 2}}),
+        )
+
+    @patch("core_main_app.components.workspace.api.get_all_public_workspaces")
+    def test_key_changes_with_public_workspaces(
+        self, mock_get_all_public_workspaces
+    ):
+        """test_key_changes_with_public_workspaces
+
+        Returns:
+
+        """
+        query_data = {"query": "{}", "options": '{"visibility": "public"}'}
+        mock_get_all_public_workspaces.return_value.values_list.return_value = [
+            1
+        ]
+        key = plan_cache.get_key(query_data)
+        mock_get_all_public_workspaces.return_value.values_list.return_value = [
+            1,
+            2,
+        ]
+
+        self.assertNotEqual(plan_cache.get_key(query_data), key)
+
+    @patch("core_main_app.components.workspace.api.get_all_public_workspaces")
+    def test_key_without_public_visibility_does_not_read_workspaces(
+        self, mock_get_all_public_workspaces
+    ):
+        """test_key_without_public_visibility_does_not_read_workspaces
+
+        Returns:
+
+        """
+        plan_cache.get_key({"query": "{}", "options": {"visibility": "all"}})
+
+        self.assertFalse(mock_get_all_public_workspaces.called)
+
+    def test_cached_raw_query_is_a_copy(self):
+        """test_cached_raw_query_is_a_copy
+
+        Returns:
+
+        """
+        plan_cache.set_raw_query("key", {"$and": [{"a": 1}]})
+        plan_cache.get_raw_query("key")["$and"].append({"b": 2})
+        self.assertEqual(plan_cache.get_raw_query("key"), {"$and": [{"a": 1}]})
+
+    @patch("core_explore_common_app.settings.EXPLORE_QUERY_PLAN_CACHE_TTL", 0)
+    def test_disabled_cache_returns_none(self):
+        """test_disabled_cache_returns_none
+
+        Returns:
+
+        """
+        plan_cache.set_raw_query("key", {"a": 1})
+        self.assertIsNone(plan_cache.get_raw_query("key"))
+
+
+class TestBuildLocalQuery(TestCase):
+    """TestBuildLocalQuery"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        plan_cache.clear()
+
+    def test_build_local_query_builds_query_once(self):
+        """test_build_local_query_builds_query_once
+
+        Returns:
+
+        """
+        query_data = {"query": '{"title": "a"}', "templates": "[]"}
+        with patch.object(
+            query_views, "QueryBuilder", wraps=query_views.QueryBuilder
+        ) as mock_query_builder:
+            raw_query = query_views.build_local_query(query_data)
+            cached_raw_query = query_views.build_local_query(
+                dict(query_data, order_by_field="-title")
+            )
+
+        self.assertEqual(mock_query_builder.call_count, 1)
+        self.assertEqual(raw_query, cached_raw_query)
+        self.assertEqual(plan_cache.get_stats()["hits"], 1)
+        self.assertEqual(plan_cache.get_stats()["misses"], 1)
+        self.assertEqual(plan_cache.get_stats()["size"], 1)
@@ -1,11 +1,33 @@
 """ Query utils test class
 """
+import json
+import threading
+import time
+from concurrent import futures
 from unittest import TestCase
 from unittest.mock import patch, MagicMock
 
-from core_explore_common_app.commons.exceptions import ExploreRequestError
+from requests import ConnectionError, Timeout
+
+from core_explore_common_app.commons.exceptions import (
+    DataSourceBusyError,
+    DataSourceUnavailableError,
+    DeadlineExceededError,
+    ExploreRequestError,
+)
 from core_explore_common_app.constants import LOCAL_QUERY_NAME
 from core_explore_common_app.settings import SERVER_URI
+from core_explore_common_app.utils.federation import (
+    bulkhead,
+    capabilities,
+    circuit_breaker,
+    latency,
+    result_cache,
+    retry,
+    single_flight,
+    token_store,
+)
+from core_explore_common_app.utils.federation.deadline import Deadline
 from core_explore_common_app.utils.query import query
 from core_explore_common_app.utils.query.query import is_local_data_source
 
@@ -13,6 +35,33 @@ from core_explore_common_app.utils.query.query import is_local_data_source
 class TestSendQuery(TestCase):
     """TestSendQuery"""
 
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        circuit_breaker.reset_all()
+        result_cache.clear()
+        token_store.clear()
+        latency.clear()
+        capabilities.clear()
+        retry.clear()
+        bulkhead.clear()
+        # retries do not wait
+        patcher = patch(
+            "core_explore_common_app.settings.EXPLORE_RETRY_BASE_DELAY", 0
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # remote instances do not describe their capabilities
+        patcher = patch(
+            "core_explore_common_app.utils.protocols.oauth2.send_get_request"
+        )
+        self.mock_send_get_request = patcher.start()
+        self.mock_send_get_request.return_value.status_code = 404
+        self.addCleanup(patcher.stop)
+
     @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
     def test_send_oauth2_query(self, mock_oauth2_send_post_request):
         """test_send_oauth2_query
@@ -30,7 +79,7 @@ class TestSendQuery(TestCase):
         }
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"results": []}
+        mock_response.iter_content.return_value = [b'{"results": []}']
         mock_oauth2_send_post_request.return_value = mock_response
 
         # Act
@@ -41,6 +90,141 @@ class TestSendQuery(TestCase):
         # Assert
         self.assertIsNotNone(response)
 
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_count_only_query_requests_first_page_count(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_count_only_query_requests_first_page_count
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://localhost:8000",
+        }
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [
+            b'{"count": 12, "results": []}'
+        ]
+        mock_oauth2_send_post_request.return_value = mock_response
+
+        # Act
+        response = query.send(
+            request=None,
+            json_query={"query": "{}"},
+            data_source=mock_data_source,
+            page=3,
+            count_only=True,
+        )
+
+        # Assert
+        self.assertEqual(response["count"], 12)
+        query_url, json_query = mock_oauth2_send_post_request.call_args.args[
+            :2
+        ]
+        self.assertTrue(query_url.endswith("?page=1"))
+        self.assertEqual(json_query, {"query": "{}", "count_only": True})
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_same_query_twice_hits_cache(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_same_query_twice_hits_cache
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://localhost:8000",
+        }
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [
+            b'{"count": 0, "results": []}'
+        ]
+        mock_oauth2_send_post_request.return_value = mock_response
+
+        # Act
+        query.send(None, {"query": "{}"}, mock_data_source, 1)
+        response = query.send(None, {"query": "{}"}, mock_data_source, 1)
+
+        # Assert
+        self.assertEqual(response, {"results": [], "count": 0})
+        self.assertEqual(mock_oauth2_send_post_request.call_count, 1)
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_query_streams_and_validates_results(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_query_streams_and_validates_results
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://localhost:8000",
+        }
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [
+            b'{"count": 1, "results": [{"title": "t", "con',
+            b'tent": "<a/>", "template_info": {}, "last_modification_date": "2024-01-01T00:00:00Z"}',
+            b"]}",
+        ]
+        mock_oauth2_send_post_request.return_value = mock_response
+
+        # Act
+        response = query.send(None, {}, mock_data_source, 1)
+
+        # Assert
+        self.assertEqual(response["count"], 1)
+        self.assertEqual(response["results"][0]["content"], "<a/>")
+        self.assertTrue(mock_response.close.called)
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_query_with_invalid_result_raises_error(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_query_with_invalid_result_raises_error
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://localhost:8000",
+        }
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [
+            b'{"count": 1, "results": [{"content": "<a/>"}]}'
+        ]
+        mock_oauth2_send_post_request.return_value = mock_response
+
+        # Act + Assert
+        with self.assertRaises(ExploreRequestError):
+            query.send(None, {}, mock_data_source, 1)
+
     def test_send_query_with_unknown_protocol_fails(self):
         # Arrange
         mock_data_source = {"authentication": {"auth_type": "test"}}
@@ -54,6 +238,941 @@ class TestSendQuery(TestCase):
                 page=1,
             )
 
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_query_fails_fast_when_data_source_is_unavailable(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_query_fails_fast_when_data_source_is_unavailable
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "name": "remote",
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://remote:8000",
+        }
+        mock_oauth2_send_post_request.side_effect = ConnectionError()
+        breaker = circuit_breaker.get_circuit_breaker("http://remote:8000")
+        for _ in range(breaker.failure_threshold):
+            with self.assertRaises(ExploreRequestError):
+                query.send(None, {}, mock_data_source, 1)
+        mock_oauth2_send_post_request.reset_mock()
+
+        # Act + Assert
+        with self.assertRaises(DataSourceUnavailableError):
+            query.send(None, {}, mock_data_source, 1)
+        self.assertFalse(mock_oauth2_send_post_request.called)
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_query_with_expired_deadline_raises_deadline_error(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_query_with_expired_deadline_raises_deadline_error
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "name": "remote",
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://remote:8000",
+        }
+
+        # Act + Assert
+        with self.assertRaises(DeadlineExceededError):
+            query.send(None, {}, mock_data_source, 1, deadline=Deadline(0))
+        self.assertFalse(mock_oauth2_send_post_request.called)
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_query_passes_remaining_time_as_timeout(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_query_passes_remaining_time_as_timeout
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "name": "remote",
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://remote:8000",
+        }
+        mock_oauth2_send_post_request.side_effect = Timeout()
+
+        # Act + Assert
+        with self.assertRaises(DeadlineExceededError):
+            query.send(None, {}, mock_data_source, 1, deadline=Deadline(10))
+        timeout = mock_oauth2_send_post_request.call_args.kwargs["timeout"]
+        self.assertTrue(0 < timeout <= 10)
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_query_uses_adaptive_timeout_within_deadline(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_query_uses_adaptive_timeout_within_deadline
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "name": "remote",
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://remote:8000",
+        }
+        mock_oauth2_send_post_request.side_effect = Timeout()
+
+        # Act + Assert
+        with patch(
+            "core_explore_common_app.utils.federation.latency.get_timeout",
+            return_value=3,
+        ):
+            with self.assertRaises(DeadlineExceededError):
+                query.send(
+                    None, {}, mock_data_source, 1, deadline=Deadline(10)
+                )
+            self.assertEqual(
+                mock_oauth2_send_post_request.call_args.kwargs["timeout"], 3
+            )
+            with self.assertRaises(DeadlineExceededError):
+                query.send(None, {}, mock_data_source, 1, deadline=Deadline(1))
+            self.assertLessEqual(
+                mock_oauth2_send_post_request.call_args.kwargs["timeout"], 1
+            )
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_query_records_response_time(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_query_records_response_time
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://localhost:8000",
+        }
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [b'{"results": []}']
+        mock_oauth2_send_post_request.return_value = mock_response
+
+        # Act
+        with patch(
+            "core_explore_common_app.utils.federation.latency.record"
+        ) as mock_record:
+            query.send(None, {}, mock_data_source, 1)
+
+        # Assert
+        self.assertEqual(
+            mock_record.call_args.args[0], "http://localhost:8000"
+        )
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_identical_queries_in_flight_share_one_request(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_identical_queries_in_flight_share_one_request
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://localhost:8000",
+        }
+        release = threading.Event()
+
+        def _send_post_request(*args, **kwargs):
+            release.wait(5)
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.iter_content.return_value = [b'{"results": []}']
+            return mock_response
+
+        mock_oauth2_send_post_request.side_effect = _send_post_request
+        results = list()
+
+        # Act
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    query.send(None, {}, mock_data_source, 1)
+                )
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        while single_flight.in_flight() == 0:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        self.assertEqual(mock_oauth2_send_post_request.call_count, 1)
+        self.assertEqual(results, [{"results": []}] * 5)
+
+    @patch("core_explore_common_app.utils.federation.single_flight.do")
+    def test_send_waiting_past_deadline_for_identical_query_raises_deadline_exceeded(
+        self, mock_single_flight_do
+    ):
+        """test_send_waiting_past_deadline_for_identical_query_raises_deadline_exceeded
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://localhost:8000",
+        }
+        mock_single_flight_do.side_effect = futures.TimeoutError()
+
+        # Act + Assert
+        with self.assertRaises(DeadlineExceededError):
+            query.send(None, {}, mock_data_source, 1)
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_skips_instance_without_query_templates(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_skips_instance_without_query_templates
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://localhost:8000",
+        }
+        self.mock_send_get_request.return_value.status_code = 200
+        self.mock_send_get_request.return_value.json.return_value = {
+            "template_hashes": ["other_hash"]
+        }
+
+        # Act
+        response = query.send(
+            None,
+            {"templates": '[{"id": 1, "hash": "hash"}]'},
+            mock_data_source,
+            1,
+        )
+
+        # Assert
+        self.assertEqual(response["count"], 0)
+        self.assertFalse(mock_oauth2_send_post_request.called)
+        self.assertEqual(
+            mock_data_source["capabilities"],
+            {"template_hashes": ["other_hash"]},
+        )
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_query_retries_after_transient_error(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_query_retries_after_transient_error
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "name": "remote",
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://remote:8000",
+        }
+        unavailable_response = MagicMock(status_code=503, headers={})
+        ok_response = MagicMock(status_code=200)
+        ok_response.iter_content.return_value = [b'{"results": []}']
+        mock_oauth2_send_post_request.side_effect = [
+            ConnectionError(),
+            unavailable_response,
+            ok_response,
+        ]
+
+        # Act
+        response = query.send(None, {}, mock_data_source, 1)
+
+        # Assert
+        self.assertEqual(response, {"results": []})
+        self.assertEqual(mock_oauth2_send_post_request.call_count, 3)
+        self.assertTrue(unavailable_response.close.called)
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_query_raises_connection_error_when_retries_are_exhausted(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_query_raises_connection_error_when_retries_are_exhausted
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "name": "remote",
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://remote:8000",
+        }
+        mock_oauth2_send_post_request.side_effect = ConnectionError()
+
+        # Act + Assert
+        with self.assertRaisesRegex(
+            ExploreRequestError, "Unable to contact the remote server."
+        ):
+            query.send(None, {}, mock_data_source, 1)
+        self.assertEqual(mock_oauth2_send_post_request.call_count, 3)
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_query_does_not_retry_client_error(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_query_does_not_retry_client_error
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "name": "remote",
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://remote:8000",
+        }
+        mock_oauth2_send_post_request.return_value.status_code = 400
+
+        # Act + Assert
+        with self.assertRaises(ExploreRequestError):
+            query.send(None, {}, mock_data_source, 1)
+        self.assertEqual(mock_oauth2_send_post_request.call_count, 1)
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_query_stops_retrying_when_attempts_are_exhausted(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_query_stops_retrying_when_attempts_are_exhausted
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "name": "remote",
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://remote:8000",
+        }
+        mock_oauth2_send_post_request.return_value.status_code = 503
+        mock_oauth2_send_post_request.return_value.headers = {}
+
+        # Act + Assert
+        with patch(
+            "core_explore_common_app.settings.EXPLORE_RETRY_MAX_ATTEMPTS", 2
+        ):
+            with self.assertRaises(ExploreRequestError):
+                query.send(None, {}, mock_data_source, 1)
+        self.assertEqual(mock_oauth2_send_post_request.call_count, 2)
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_query_does_not_retry_timeout(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_query_does_not_retry_timeout
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "name": "remote",
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://remote:8000",
+        }
+        mock_oauth2_send_post_request.side_effect = Timeout()
+
+        # Act + Assert
+        with self.assertRaises(DeadlineExceededError):
+            query.send(None, {}, mock_data_source, 1)
+        self.assertEqual(mock_oauth2_send_post_request.call_count, 1)
+
+    @patch(
+        "core_explore_common_app.settings.EXPLORE_BULKHEAD_MAX_CONCURRENT_PER_SOURCE",
+        1,
+    )
+    @patch("core_explore_common_app.settings.EXPLORE_BULKHEAD_MAX_QUEUE", 0)
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_query_to_busy_data_source_is_rejected(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_query_to_busy_data_source_is_rejected
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "name": "remote",
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://remote:8000",
+        }
+
+        # Act + Assert
+        with bulkhead.slot("http://remote:8000"):
+            with self.assertRaises(DataSourceBusyError):
+                query.send(None, {}, mock_data_source, 1)
+        self.assertFalse(mock_oauth2_send_post_request.called)
+        # a rejected query is not a failure of the data source
+        breaker = circuit_breaker.get_circuit_breaker("http://remote:8000")
+        self.assertEqual(breaker.failure_count, 0)
+
+    @patch(
+        "core_explore_common_app.settings.EXPLORE_BULKHEAD_MAX_CONCURRENT_PER_SOURCE",
+        1,
+    )
+    @patch("core_explore_common_app.settings.EXPLORE_BULKHEAD_MAX_QUEUE", 0)
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_query_rejected_by_bulkhead_releases_half_open_probe(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_query_rejected_by_bulkhead_releases_half_open_probe
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "name": "remote",
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://remote:8000",
+        }
+        breaker = circuit_breaker.get_circuit_breaker("http://remote:8000")
+        breaker._state = circuit_breaker.HALF_OPEN
+
+        # Act
+        with bulkhead.slot("http://remote:8000"):
+            with self.assertRaises(DataSourceBusyError):
+                query.send(None, {}, mock_data_source, 1)
+
+        # Assert
+        self.assertEqual(breaker.state, circuit_breaker.HALF_OPEN)
+        self.assertTrue(breaker.allow_request())
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_query_without_matching_template_releases_half_open_probe(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_query_without_matching_template_releases_half_open_probe
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "name": "remote",
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://remote:8000",
+        }
+        self.mock_send_get_request.return_value.status_code = 200
+        self.mock_send_get_request.return_value.json.return_value = {
+            "template_hashes": ["other"]
+        }
+        breaker = circuit_breaker.get_circuit_breaker("http://remote:8000")
+        breaker._state = circuit_breaker.HALF_OPEN
+
+        # Act
+        response = query.send(
+            None,
+            {"templates": json.dumps([{"id": 1, "hash": "hash"}])},
+            mock_data_source,
+            1,
+        )
+
+        # Assert
+        self.assertEqual(response["count"], 0)
+        self.assertFalse(mock_oauth2_send_post_request.called)
+        self.assertTrue(breaker.allow_request())
+
+    @patch(
+        "core_explore_common_app.settings.EXPLORE_BULKHEAD_MAX_CONCURRENT_PER_SOURCE",
+        1,
+    )
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_query_holds_bulkhead_slot_while_reading_body(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_query_holds_bulkhead_slot_while_reading_body
+
+        Returns:
+
+        """
+        # Arrange
+        mock_data_source = {
+            "name": "remote",
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://remote:8000",
+        }
+        active_slots = list()
+
+        def _iter_content(chunk_size):
+            active_slots.append(
+                bulkhead.get_bulkhead("http://remote:8000").active
+            )
+            yield b'{"count": 0, "next": null, "previous": null, "results": []}'
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.iter_content.side_effect = _iter_content
+        mock_oauth2_send_post_request.return_value = mock_response
+
+        # Act
+        query.send(None, {}, mock_data_source, 1)
+
+        # Assert
+        self.assertEqual(active_slots, [1])
+        self.assertEqual(bulkhead.get_bulkhead("http://remote:8000").active, 0)
+
+
+class TestSendBatch(TestCase):
+    """TestSendBatch"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        circuit_breaker.reset_all()
+        result_cache.clear()
+        token_store.clear()
+        capabilities.clear()
+        bulkhead.clear()
+        patcher = patch(
+            "core_explore_common_app.utils.protocols.oauth2.send_get_request"
+        )
+        self.mock_send_get_request = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_data_source = {
+            "name": "remote",
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://remote:8000/rest/explore/keyword/execute",
+        }
+
+    @patch(
+        "core_explore_common_app.utils.protocols.oauth2.send_json_post_request"
+    )
+    def test_send_batch_sends_queries_in_one_request(
+        self, mock_send_json_post_request
+    ):
+        """test_send_batch_sends_queries_in_one_request
+
+        Returns:
+
+        """
+        # Arrange
+        self.mock_send_get_request.return_value.status_code = 200
+        self.mock_send_get_request.return_value.json.return_value = {
+            "batch": 10
+        }
+        mock_send_json_post_request.return_value.status_code = 200
+        mock_send_json_post_request.return_value.json.return_value = {
+            "responses": [
+                {
+                    "id": "1",
+                    "status": 404,
+                    "message": "not found",
+                },
+                {
+                    "id": "0",
+                    "status": 200,
+                    "count": 0,
+                    "next": None,
+                    "previous": None,
+                    "results": [],
+                },
+            ]
+        }
+
+        # Act
+        responses = query.send_batch(
+            None,
+            [({"query": "{}"}, 1), ({"query": "{}"}, 2)],
+            self.mock_data_source,
+        )
+
+        # Assert
+        self.assertEqual(mock_send_json_post_request.call_count, 1)
+        self.assertEqual(
+            mock_send_json_post_request.call_args.args[0],
+            "http://remote:8000/explore/rest/batch/",
+        )
+        self.assertEqual(
+            responses[0],
+            (
+                {"count": 0, "next": None, "previous": None, "results": []},
+                None,
+            ),
+        )
+        self.assertIsNone(responses[1][0])
+        self.assertIsInstance(responses[1][1], ExploreRequestError)
+
+    @patch(
+        "core_explore_common_app.utils.protocols.oauth2.send_json_post_request"
+    )
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_batch_falls_back_to_single_queries(
+        self, mock_send_post_request, mock_send_json_post_request
+    ):
+        """test_send_batch_falls_back_to_single_queries
+
+        Returns:
+
+        """
+        # Arrange
+        self.mock_send_get_request.return_value.status_code = 404
+        mock_send_post_request.return_value.status_code = 200
+        mock_send_post_request.return_value.iter_content.return_value = [
+            b'{"results": []}'
+        ]
+
+        # Act
+        responses = query.send_batch(
+            None,
+            [({"query": "{}"}, 1), ({"query": "{}"}, 2)],
+            self.mock_data_source,
+        )
+
+        # Assert
+        self.assertFalse(mock_send_json_post_request.called)
+        self.assertEqual(mock_send_post_request.call_count, 2)
+        self.assertEqual(responses, [({"results": []}, None)] * 2)
+
+    @patch(
+        "core_explore_common_app.utils.protocols.oauth2.send_json_post_request"
+    )
+    def test_send_batch_serves_cached_pages(self, mock_send_json_post_request):
+        """test_send_batch_serves_cached_pages
+
+        Returns:
+
+        """
+        # Arrange
+        json_response = {"count": 0, "results": []}
+        result_cache.set_result_page(
+            result_cache.get_cache_key(
+                self.mock_data_source, {"query": "{}"}, 1
+            ),
+            json_response,
+        )
+
+        # Act
+        responses = query.send_batch(
+            None, [({"query": "{}"}, 1)], self.mock_data_source
+        )
+
+        # Assert
+        self.assertEqual(responses, [(json_response, None)])
+        self.assertFalse(mock_send_json_post_request.called)
+        self.assertFalse(self.mock_send_get_request.called)
+
+
+class TestSendWithNextPage(TestCase):
+    """TestSendWithNextPage"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        circuit_breaker.reset_all()
+        result_cache.clear()
+        token_store.clear()
+        capabilities.clear()
+        bulkhead.clear()
+        patcher = patch(
+            "core_explore_common_app.utils.protocols.oauth2.send_get_request"
+        )
+        self.mock_send_get_request = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_data_source = {
+            "name": "remote",
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://remote:8000/rest/explore/keyword/execute",
+        }
+
+    @patch(
+        "core_explore_common_app.utils.protocols.oauth2.send_json_post_request"
+    )
+    def test_send_with_next_page_caches_next_page_of_batch(
+        self, mock_send_json_post_request
+    ):
+        """test_send_with_next_page_caches_next_page_of_batch
+
+        Returns:
+
+        """
+        # Arrange
+        self.mock_send_get_request.return_value.status_code = 200
+        self.mock_send_get_request.return_value.json.return_value = {
+            "batch": 10
+        }
+        capabilities.get_capabilities(self.mock_data_source)
+        mock_send_json_post_request.return_value.status_code = 200
+        mock_send_json_post_request.return_value.json.return_value = {
+            "responses": [
+                {
+                    "id": str(index),
+                    "status": 200,
+                    "count": 40,
+                    "next": page + 1,
+                    "previous": page - 1,
+                    "results": [],
+                }
+                for index, page in enumerate((2, 3))
+            ]
+        }
+
+        # Act
+        json_response = query.send_with_next_page(
+            None, {"query": "{}"}, self.mock_data_source, 2
+        )
+        next_json_response = query.send(
+            None, {"query": "{}"}, self.mock_data_source, 3
+        )
+
+        # Assert
+        self.assertEqual(mock_send_json_post_request.call_count, 1)
+        self.assertEqual(
+            [
+                item["page"]
+                for item in mock_send_json_post_request.call_args.args[1][
+                    "queries"
+                ]
+            ],
+            [2, 3],
+        )
+        self.assertEqual(json_response["next"], 3)
+        self.assertEqual(next_json_response["next"], 4)
+
+    @patch(
+        "core_explore_common_app.utils.protocols.oauth2.send_json_post_request"
+    )
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_with_next_page_without_batches_sends_page_only(
+        self, mock_send_post_request, mock_send_json_post_request
+    ):
+        """test_send_with_next_page_without_batches_sends_page_only
+
+        Returns:
+
+        """
+        # Arrange
+        self.mock_send_get_request.return_value.status_code = 404
+        mock_send_post_request.return_value.status_code = 200
+        mock_send_post_request.return_value.iter_content.return_value = [
+            b'{"results": []}'
+        ]
+
+        # Act
+        json_response = query.send_with_next_page(
+            None, {"query": "{}"}, self.mock_data_source, 1
+        )
+
+        # Assert
+        self.assertFalse(mock_send_json_post_request.called)
+        self.assertEqual(mock_send_post_request.call_count, 1)
+        self.assertEqual(json_response, {"results": []})
+
+
+class TestSendPassThrough(TestCase):
+    """TestSendPassThrough"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        circuit_breaker.reset_all()
+        token_store.clear()
+        latency.clear()
+        capabilities.clear()
+        retry.clear()
+        bulkhead.clear()
+        patcher = patch(
+            "core_explore_common_app.utils.protocols.oauth2.send_get_request"
+        )
+        self.mock_send_get_request = patcher.start()
+        self.mock_send_get_request.return_value.status_code = 404
+        self.addCleanup(patcher.stop)
+        patcher = patch(
+            "core_explore_common_app.settings.EXPLORE_PASS_THROUGH_DATA_SOURCES",
+            ["http://remote:8000"],
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_data_source = {
+            "name": "remote",
+            "authentication": {
+                "auth_type": "oauth2",
+                "params": {"access_token": "token"},
+            },
+            "url_query": "http://remote:8000",
+        }
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_pass_through_returns_raw_body(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_pass_through_returns_raw_body
+
+        Returns:
+
+        """
+        # Arrange
+        mock_response = mock_oauth2_send_post_request.return_value
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [b'{"results"', b": []}"]
+
+        # Act
+        body = query.send_pass_through(None, {}, self.mock_data_source, 1)
+
+        # Assert
+        self.assertEqual(b"".join(body), b'{"results": []}')
+        self.assertTrue(mock_response.close.called)
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_pass_through_returns_page_numbers(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_pass_through_returns_page_numbers
+
+        Returns:
+
+        """
+        # Arrange
+        mock_response = mock_oauth2_send_post_request.return_value
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [
+            b'{"count": 30, "next": "http://remote:8000/?page=3", ',
+            b'"previous": "http://remote:8000/", "results": [{"title": "\xc3',
+            b'\xa9"}]}',
+        ]
+
+        # Act
+        body = query.send_pass_through(None, {}, self.mock_data_source, 2)
+
+        # Assert
+        self.assertEqual(
+            json.loads(b"".join(body)),
+            {
+                "count": 30,
+                "next": 3,
+                "previous": 1,
+                "results": [{"title": "\u00e9"}],
+            },
+        )
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_pass_through_with_error_status_raises_error(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_pass_through_with_error_status_raises_error
+
+        Returns:
+
+        """
+        # Arrange
+        mock_response = mock_oauth2_send_post_request.return_value
+        mock_response.status_code = 400
+
+        # Act + Assert
+        with self.assertRaises(ExploreRequestError):
+            query.send_pass_through(None, {}, self.mock_data_source, 1)
+        self.assertTrue(mock_response.close.called)
+
+    @patch("core_explore_common_app.utils.protocols.oauth2.send_post_request")
+    def test_send_pass_through_to_untrusted_source_raises_error(
+        self, mock_oauth2_send_post_request
+    ):
+        """test_send_pass_through_to_untrusted_source_raises_error
+
+        Returns:
+
+        """
+        # Arrange
+        self.mock_data_source["url_query"] = "http://other:8000"
+
+        # Act + Assert
+        with self.assertRaises(ExploreRequestError):
+            query.send_pass_through(None, {}, self.mock_data_source, 1)
+        self.assertFalse(mock_oauth2_send_post_request.called)
+
 
 class TestIsLocalDataSource(TestCase):
     """TestIsLocalDataSource"""
@@ -0,0 +1,64 @@
+""" Benchmark of the result validator against the DRF serializer
+
+Run with:
+    DJANGO_SETTINGS_MODULE=tests.test_settings python -m tests.utils.result.benchmark_validator
+"""
+import timeit
+
+import django
+
+NB_RESULTS = 100
+NB_PAGES = 50
+
+
+def run():
+    """Validate pages of 100 results with both validators
+
+    Returns:
+
+    """
+    from core_explore_common_app.rest.result.serializers import (
+        ResultSerializer,
+    )
+    from core_explore_common_app.utils.result.validator import (
+        ResultValidator,
+    )
+
+    page = [
+        {
+            "title": f"title {index}",
+            "content": "<root>" + "<element>value</element>" * 200 + "</root>",
+            "template_info": {
+                "id": 1,
+                "name": "template",
+                "hash": "a12946eda99c065243a9c02632682928e12a32bd",
+                "format": "XSD",
+            },
+            "permission_url": None,
+            "detail_url": f"http://remote/data?id={index}",
+            "access_data_url": f"http://remote/result?id={index}",
+            "last_modification_date": "2024-01-01T00:00:00Z",
+            "blob_url": None,
+        }
+        for index in range(NB_RESULTS)
+    ]
+    validator = ResultValidator()
+
+    drf_time = timeit.timeit(
+        lambda: ResultSerializer(data=page, many=True).is_valid(
+            raise_exception=True
+        ),
+        number=NB_PAGES,
+    )
+    fast_time = timeit.timeit(
+        lambda: validator.validate_many(page), number=NB_PAGES
+    )
+    print(f"{NB_PAGES} pages of {NB_RESULTS} results")
+    print(f"DRF serializer: {drf_time / NB_PAGES * 1000:.2f} ms/page")
+    print(f"Fast validator: {fast_time / NB_PAGES * 1000:.2f} ms/page")
+    print(f"Speedup: x{drf_time / fast_time:.1f}")
+
+
+if __name__ == "__main__":
+    django.setup()
+    run()
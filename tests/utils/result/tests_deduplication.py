@@ -0,0 +1,81 @@
+""" De-duplication test class
+"""
+from unittest import TestCase
+
+from core_explore_common_app.components.result.models import Result
+from core_explore_common_app.utils.result import deduplication
+from core_explore_common_app.utils.result.deduplication import Deduplicator
+
+
+class TestGetFingerprint(TestCase):
+    """TestGetFingerprint"""
+
+    def test_fingerprint_ignores_insignificant_whitespaces(self):
+        """test_fingerprint_ignores_insignificant_whitespaces
+
+        Returns:
+
+        """
+        self.assertEqual(
+            deduplication.get_fingerprint(
+                {
+                    "content": "<root>\n  <a>value  1</a>\n</root>\n",
+                    "template_info": {"hash": "hash"},
+                }
+            ),
+            deduplication.get_fingerprint(
+                {
+                    "content": "<root><a>value 1</a></root>",
+                    "template_info": {"hash": "hash"},
+                }
+            ),
+        )
+
+    def test_fingerprint_depends_on_template_hash(self):
+        """test_fingerprint_depends_on_template_hash
+
+        Returns:
+
+        """
+        self.assertNotEqual(
+            deduplication.get_fingerprint(
+                {"content": "<root/>", "template_info": {"hash": "hash_1"}}
+            ),
+            deduplication.get_fingerprint(
+                {"content": "<root/>", "template_info": {"hash": "hash_2"}}
+            ),
+        )
+
+    def test_fingerprint_of_result_and_dict_are_equal(self):
+        """test_fingerprint_of_result_and_dict_are_equal
+
+        Returns:
+
+        """
+        self.assertEqual(
+            deduplication.get_fingerprint(
+                Result(content="<root/>", template_info={"hash": "hash"})
+            ),
+            deduplication.get_fingerprint(
+                {"content": "<root/>", "template_info": {"hash": "hash"}}
+            ),
+        )
+
+
+class TestDeduplicator(TestCase):
+    """TestDeduplicator"""
+
+    def test_filter_drops_duplicates(self):
+        """test_filter_drops_duplicates
+
+        Returns:
+
+        """
+        deduplicator = Deduplicator()
+        results = [
+            {"content": "<a/>", "template_info": {"hash": "hash"}},
+            {"content": "<b/>", "template_info": {"hash": "hash"}},
+            {"content": " <a/> ", "template_info": {"hash": "hash"}},
+        ]
+        self.assertEqual(list(deduplicator.filter(results)), results[:2])
+        self.assertEqual(deduplicator.duplicate_count, 1)
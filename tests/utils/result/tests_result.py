@@ -0,0 +1,159 @@
+""" Unit tests of the result utils
+"""
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from core_explore_common_app.utils.result import result as result_utils
+from core_main_app.components.blob.models import Blob
+from core_main_app.components.data.models import Data
+from core_main_app.components.template.models import Template
+from core_main_app.components.workspace.models import Workspace
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+
+
+class TestGetReadableBlobIds(TestCase):
+    """TestGetReadableBlobIds"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        template = Template.objects.create(
+            filename="template.xsd", content="<schema/>", _hash="hash"
+        )
+        self.workspace = Workspace.objects.create(
+            title="workspace",
+            owner="2",
+            read_perm_id="1",
+            write_perm_id="2",
+        )
+        self.own_blob = Blob.objects.create(
+            filename="own.txt", user_id="1", blob="own.txt"
+        )
+        self.workspace_blob = Blob.objects.create(
+            filename="workspace.txt",
+            user_id="2",
+            workspace=self.workspace,
+            blob="workspace.txt",
+        )
+        self.private_blob = Blob.objects.create(
+            filename="private.txt", user_id="2", blob="private.txt"
+        )
+        self.data_list = [
+            Data.objects.create(
+                template=template,
+                user_id="1",
+                title="own",
+                _blob=self.own_blob,
+            ),
+            Data.objects.create(
+                template=template,
+                user_id="2",
+                title="workspace",
+                _blob=self.workspace_blob,
+            ),
+            Data.objects.create(
+                template=template,
+                user_id="2",
+                title="private",
+                _blob=self.private_blob,
+            ),
+            Data.objects.create(template=template, user_id="1", title="none"),
+        ]
+        self.data_ids = [data.id for data in self.data_list]
+
+    @patch(
+        "core_main_app.components.workspace.api.get_all_workspaces_with_read_access_by_user"
+    )
+    def test_returns_blobs_readable_by_user(
+        self, mock_get_all_workspaces_with_read_access_by_user
+    ):
+        """test_returns_blobs_readable_by_user
+
+        Returns:
+
+        """
+        mock_get_all_workspaces_with_read_access_by_user.return_value = [
+            self.workspace
+        ]
+
+        blob_ids = result_utils.get_readable_blob_ids(
+            self.data_ids, create_mock_user(user_id="1")
+        )
+
+        self.assertEqual(
+            blob_ids,
+            {
+                self.data_list[0].id: self.own_blob.id,
+                self.data_list[1].id: self.workspace_blob.id,
+            },
+        )
+
+    @patch(
+        "core_main_app.components.workspace.api.get_all_workspaces_with_read_access_by_user"
+    )
+    def test_excludes_blobs_of_workspaces_not_readable_by_user(
+        self, mock_get_all_workspaces_with_read_access_by_user
+    ):
+        """test_excludes_blobs_of_workspaces_not_readable_by_user
+
+        Returns:
+
+        """
+        mock_get_all_workspaces_with_read_access_by_user.return_value = []
+
+        blob_ids = result_utils.get_readable_blob_ids(
+            self.data_ids, create_mock_user(user_id="1")
+        )
+
+        self.assertEqual(blob_ids, {self.data_list[0].id: self.own_blob.id})
+
+    @patch(
+        "core_main_app.components.workspace.api.get_all_workspaces_with_read_access_by_user"
+    )
+    def test_evaluates_workspace_permissions_once(
+        self, mock_get_all_workspaces_with_read_access_by_user
+    ):
+        """test_evaluates_workspace_permissions_once
+
+        Returns:
+
+        """
+        mock_get_all_workspaces_with_read_access_by_user.return_value = [
+            self.workspace
+        ]
+
+        with self.assertNumQueries(1):
+            result_utils.get_readable_blob_ids(
+                self.data_ids, create_mock_user(user_id="3")
+            )
+
+        mock_get_all_workspaces_with_read_access_by_user.assert_called_once()
+
+    def test_superuser_reads_all_blobs(self):
+        """test_superuser_reads_all_blobs
+
+        Returns:
+
+        """
+        blob_ids = result_utils.get_readable_blob_ids(
+            self.data_ids, create_mock_user(user_id="3", is_superuser=True)
+        )
+
+        self.assertEqual(len(blob_ids), 3)
+
+    def test_without_data_returns_empty_dict(self):
+        """test_without_data_returns_empty_dict
+
+        Returns:
+
+        """
+        with self.assertNumQueries(0):
+            blob_ids = result_utils.get_readable_blob_ids(
+                [], create_mock_user(user_id="1")
+            )
+
+        self.assertEqual(blob_ids, dict())
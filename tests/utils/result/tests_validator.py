@@ -0,0 +1,104 @@
+""" Result validator test class
+"""
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ValidationError
+
+from core_explore_common_app.rest.result.serializers import ResultSerializer
+from core_explore_common_app.utils.result.validator import ResultValidator
+
+VALID_RESULT = {
+    "title": "title",
+    "content": "<root/>",
+    "template_info": {"id": 1, "name": "t", "hash": "h", "format": "XSD"},
+    "permission_url": None,
+    "detail_url": "http://remote/data?id=1",
+    "access_data_url": "http://remote/result?id=1",
+    "last_modification_date": "2024-01-01T00:00:00Z",
+    "blob_url": None,
+}
+
+INVALID_RESULTS = [
+    {},
+    "not a dict",
+    {"title": "", "content": " "},
+    {"title": None, "content": "c"},
+    {"title": ["a"], "content": {"a": 1}},
+    {"title": "t" * 201, "content": "c"},
+    {"title": "t\x00", "content": "c"},
+    {"title": "t", "content": "c\ud800"},
+    {"title": " " * 300, "content": "c"},
+    {"title": "t", "content": "c", "detail_url": "u" * 201},
+    {"title": "t", "content": "c", "last_modification_date": "bad"},
+    {"title": "t", "content": "c", "last_modification_date": None},
+    {"title": "t", "content": "c", "template_info": None},
+]
+
+
+class TestResultValidator(SimpleTestCase):
+    """TestResultValidator"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.validator = ResultValidator()
+
+    def test_valid_result_passes_fast_path(self):
+        """test_valid_result_passes_fast_path
+
+        Returns:
+
+        """
+        self.assertTrue(self.validator.is_valid(VALID_RESULT))
+        self.validator.validate(VALID_RESULT)
+
+    def test_values_accepted_by_serializer_are_accepted(self):
+        """test_values_accepted_by_serializer_are_accepted
+
+        Returns:
+
+        """
+        # numbers are accepted as strings by the serializer
+        self.validator.validate({"title": 1, "content": 2.5})
+        # whitespaces are stripped before checking the length
+        self.validator.validate(
+            {"title": " " * 150 + "t" * 150, "content": "é"}
+        )
+
+    def test_invalid_results_raise_serializer_errors(self):
+        """test_invalid_results_raise_serializer_errors
+
+        Returns:
+
+        """
+        for result in INVALID_RESULTS:
+            serializer = ResultSerializer(data=result)
+            serializer.is_valid()
+            with self.assertRaises(ValidationError) as context:
+                self.validator.validate(result)
+            self.assertEqual(context.exception.detail, serializer.errors)
+
+    def test_validate_many_raises_serializer_errors(self):
+        """test_validate_many_raises_serializer_errors
+
+        Returns:
+
+        """
+        results = [VALID_RESULT, {"title": "t"}]
+        serializer = ResultSerializer(data=results, many=True)
+        serializer.is_valid()
+
+        with self.assertRaises(ValidationError) as context:
+            self.validator.validate_many(results)
+
+        self.assertEqual(context.exception.detail, serializer.errors)
+
+    def test_validate_many_with_valid_results(self):
+        """test_validate_many_with_valid_results
+
+        Returns:
+
+        """
+        self.validator.validate_many([VALID_RESULT] * 3)
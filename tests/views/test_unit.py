@@ -1,17 +1,29 @@
 """ Unit test views
 """
-from unittest.mock import patch, MagicMock
+import gzip
+import json
+import threading
+from unittest.mock import patch, MagicMock, PropertyMock
 
 from django.core.paginator import EmptyPage
 from django.test import RequestFactory, SimpleTestCase
 from django.urls import NoReverseMatch
 
+from core_explore_common_app.commons.exceptions import (
+    DeadlineExceededError,
+    ExploreRequestError,
+)
 from core_explore_common_app.constants import LOCAL_QUERY_NAME
 from core_explore_common_app.rest.query.views import format_local_results
 from core_explore_common_app.settings import SERVER_URI
+from core_explore_common_app.utils.federation import merge as merge_utils
 from core_explore_common_app.views.user.ajax import (
     get_local_data_source,
     get_data_source_results,
+    get_data_source_results_json,
+    get_data_sources_counts,
+    get_merged_results,
+    get_result_content,
     update_local_data_source,
     get_data_sources_html,
 )
@@ -20,6 +32,7 @@ from core_explore_common_app.views.user.views import (
     ResultsView,
 )
 from core_main_app.access_control.exceptions import AccessControlError
+from core_main_app.commons.exceptions import DoesNotExist
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
 from core_main_app.utils.tests_tools.RequestMock import create_mock_request
 
@@ -517,6 +530,601 @@ class TestGetDataSourceResults(SimpleTestCase):
             response.content,
         )
 
+    @patch("core_explore_common_app.components.query.api.get_by_id")
+    @patch("core_explore_common_app.utils.query.query.send")
+    def test_get_oauth2_data_source_results_past_deadline_returns_retry_placeholder(
+        self,
+        mock_send_query,
+        mock_get_by_id,
+    ):
+        """test_get_oauth2_data_source_results_past_deadline_returns_retry_placeholder
+
+        Returns:
+
+        """
+        request = self.factory.get("core_explore_common_get_local_data_source")
+        request.user = self.user1
+
+        mock_query = MagicMock()
+        mock_query.content = {}
+        mock_query.data_sources = [
+            {
+                "name": "remote",
+                "url_query": "http://remote",
+                "query_options": {},
+                "order_by_field": [],
+                "authentication": {"auth_type": "oauth2"},
+            }
+        ]
+        mock_get_by_id.return_value = mock_query
+        mock_send_query.side_effect = DeadlineExceededError("timeout")
+
+        response = get_data_source_results(
+            request, query_id=1, data_source_index=0
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(json.loads(response.content)["timed_out"])
+
+    @patch("core_explore_common_app.utils.federation.prefetch.schedule")
+    @patch("core_explore_common_app.components.query.api.get_by_id")
+    @patch("core_explore_common_app.utils.query.query.send")
+    def test_get_oauth2_data_source_results_prefetches_next_page(
+        self,
+        mock_send_query,
+        mock_get_by_id,
+        mock_schedule,
+    ):
+        """test_get_oauth2_data_source_results_prefetches_next_page
+
+        Returns:
+
+        """
+        request = self.factory.get("core_explore_common_get_local_data_source")
+        request.user = self.user1
+
+        mock_query = MagicMock()
+        mock_query.content = {}
+        mock_query.data_sources = [
+            {
+                "name": "remote",
+                "url_query": "http://remote",
+                "query_options": {},
+                "order_by_field": [],
+                "authentication": {"auth_type": "oauth2"},
+            }
+        ]
+        mock_get_by_id.return_value = mock_query
+        mock_send_query.return_value = {
+            "results": [],
+            "previous": None,
+            "next": "http://remote/?page=2",
+            "count": 20,
+        }
+
+        response = get_data_source_results(
+            request, query_id=1, data_source_index=0
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(mock_schedule.called)
+        self.assertIn(":2:", mock_schedule.call_args.args[1])
+
+
+class TestGetDataSourcesCounts(SimpleTestCase):
+    """TestGetDataSourcesCounts"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.factory = RequestFactory()
+        self.user1 = create_mock_user(user_id="1")
+
+    @patch("core_explore_common_app.components.query.api.get_by_id")
+    @patch("core_explore_common_app.utils.query.query.send")
+    @patch("core_explore_common_app.rest.query.views.execute_local_query")
+    def test_get_data_sources_counts_streams_counts(
+        self,
+        mock_execute_local_query,
+        mock_send_query,
+        mock_get_by_id,
+    ):
+        """test_get_data_sources_counts_streams_counts
+
+        Returns:
+
+        """
+        request = self.factory.get("core_explore_common_data_sources_counts")
+        request.user = self.user1
+
+        mock_query = MagicMock()
+        mock_query.content = {}
+        mock_query.templates.all.return_value = []
+        mock_query.data_sources = [
+            {
+                "name": LOCAL_QUERY_NAME,
+                "url_query": SERVER_URI,
+                "query_options": {},
+                "order_by_field": [],
+                "authentication": {"auth_type": "session"},
+            },
+            {
+                "name": "remote",
+                "url_query": "http://remote",
+                "query_options": {},
+                "order_by_field": [],
+                "authentication": {"auth_type": "oauth2"},
+            },
+        ]
+        mock_get_by_id.return_value = mock_query
+        mock_execute_local_query.return_value = 3
+        mock_send_query.return_value = {"count": 5, "results": []}
+
+        response = get_data_sources_counts(request, query_id=1)
+        counts = {
+            data["data_source_index"]: data["nb_results"]
+            for data in map(
+                json.loads,
+                b"".join(response.streaming_content).decode().splitlines(),
+            )
+        }
+
+        self.assertEqual(counts, {0: 3, 1: 5})
+        self.assertTrue(
+            mock_execute_local_query.call_args.kwargs["count_only"]
+        )
+        self.assertTrue(mock_send_query.call_args.kwargs["count_only"])
+
+    @patch("core_explore_common_app.components.query.api.get_by_id")
+    @patch("core_explore_common_app.utils.query.query.send")
+    def test_get_data_sources_counts_returns_dash_on_timeout(
+        self,
+        mock_send_query,
+        mock_get_by_id,
+    ):
+        """test_get_data_sources_counts_returns_dash_on_timeout
+
+        Returns:
+
+        """
+        request = self.factory.get("core_explore_common_data_sources_counts")
+        request.user = self.user1
+
+        mock_query = MagicMock()
+        mock_query.content = {}
+        mock_query.templates.all.return_value = []
+        mock_query.data_sources = [
+            {
+                "name": "remote",
+                "url_query": "http://remote",
+                "query_options": {},
+                "order_by_field": [],
+                "authentication": {"auth_type": "oauth2"},
+            },
+        ]
+        mock_get_by_id.return_value = mock_query
+        mock_send_query.side_effect = DeadlineExceededError("error")
+
+        response = get_data_sources_counts(request, query_id=1)
+        lines = b"".join(response.streaming_content).decode().splitlines()
+
+        self.assertEqual(json.loads(lines[0])["nb_results"], "-")
+        self.assertTrue(json.loads(lines[0])["timed_out"])
+
+    @patch("core_explore_common_app.components.query.api.get_by_id")
+    @patch("core_explore_common_app.utils.query.query.send")
+    def test_get_data_sources_counts_returns_error_for_failing_data_source(
+        self,
+        mock_send_query,
+        mock_get_by_id,
+    ):
+        """test_get_data_sources_counts_returns_error_for_failing_data_source
+
+        Returns:
+
+        """
+        request = self.factory.get("core_explore_common_data_sources_counts")
+        request.user = self.user1
+
+        mock_query = MagicMock()
+        mock_query.content = {}
+        mock_query.templates.all.return_value = []
+        mock_query.data_sources = [
+            {
+                "name": "remote",
+                "url_query": "http://remote",
+                "query_options": {},
+                "order_by_field": [],
+                "authentication": {"auth_type": "oauth2"},
+            }
+        ]
+        mock_get_by_id.return_value = mock_query
+        mock_send_query.side_effect = ExploreRequestError("error")
+
+        response = get_data_sources_counts(request, query_id=1)
+        lines = b"".join(response.streaming_content).decode().splitlines()
+
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(
+            json.loads(lines[0])["error"],
+            "An error occurred while sending the query: error",
+        )
+
+    @patch("core_explore_common_app.settings.EXPLORE_REQUEST_DEADLINE", 0.2)
+    @patch("core_explore_common_app.components.query.api.get_by_id")
+    @patch("core_explore_common_app.utils.query.query.send")
+    def test_get_data_sources_counts_stops_waiting_past_deadline(
+        self,
+        mock_send_query,
+        mock_get_by_id,
+    ):
+        """test_get_data_sources_counts_stops_waiting_past_deadline
+
+        Returns:
+
+        """
+        request = self.factory.get("core_explore_common_data_sources_counts")
+        request.user = self.user1
+
+        mock_query = MagicMock()
+        mock_query.content = {}
+        mock_query.templates.all.return_value = []
+        mock_query.data_sources = [
+            {
+                "name": f"remote_{index}",
+                "url_query": f"http://remote_{index}",
+                "query_options": {},
+                "order_by_field": [],
+                "authentication": {"auth_type": "oauth2"},
+            }
+            for index in range(2)
+        ]
+        mock_get_by_id.return_value = mock_query
+        release = threading.Event()
+        deadlines = list()
+
+        def _send(
+            request, json_query, data_source, page, deadline=None, **kwargs
+        ):
+            deadlines.append(deadline)
+            if data_source["name"] == "remote_1":
+                release.wait(5)
+            return {"results": [], "previous": None, "next": None, "count": 1}
+
+        mock_send_query.side_effect = _send
+
+        response = get_data_sources_counts(request, query_id=1)
+        try:
+            lines = b"".join(response.streaming_content).decode().splitlines()
+        finally:
+            release.set()
+        response_dicts = {
+            response_dict["data_source_index"]: response_dict
+            for response_dict in map(json.loads, lines)
+        }
+
+        self.assertNotIn("timed_out", response_dicts[0])
+        self.assertTrue(response_dicts[1]["timed_out"])
+        self.assertEqual(len(set(map(id, deadlines))), 1)
+        self.assertIsNotNone(deadlines[0].expires_at)
+
+    @patch("core_explore_common_app.components.query.api.get_by_id")
+    def test_get_data_sources_counts_with_unknown_query_returns_400(
+        self, mock_get_by_id
+    ):
+        """test_get_data_sources_counts_with_unknown_query_returns_400
+
+        Returns:
+
+        """
+        request = self.factory.get("core_explore_common_data_sources_counts")
+        request.user = self.user1
+        mock_get_by_id.side_effect = DoesNotExist("error")
+
+        response = get_data_sources_counts(request, query_id=1)
+
+        self.assertEqual(response.status_code, 400)
+
+
+class TestGetMergedResults(SimpleTestCase):
+    """TestGetMergedResults"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.factory = RequestFactory()
+        self.user1 = create_mock_user(user_id="1")
+        merge_utils.clear()
+
+    @patch("core_explore_common_app.components.query.api.get_by_id")
+    @patch("core_explore_common_app.utils.query.query.send")
+    def test_get_merged_results_merges_data_sources(
+        self,
+        mock_send_query,
+        mock_get_by_id,
+    ):
+        """test_get_merged_results_merges_data_sources
+
+        Returns:
+
+        """
+        request = self.factory.get("core_explore_common_merged_results")
+        request.user = self.user1
+
+        mock_query = MagicMock()
+        mock_query.content = {}
+        mock_query.templates.all.return_value = []
+        mock_query.data_sources = [
+            {
+                "name": f"remote_{index}",
+                "url_query": f"http://remote_{index}",
+                "query_options": {},
+                "order_by_field": "title",
+                "authentication": {"auth_type": "oauth2"},
+            }
+            for index in range(2)
+        ]
+        mock_get_by_id.return_value = mock_query
+
+        def _send(request, json_query, data_source, page, deadline=None):
+            title = "a" if data_source["name"] == "remote_0" else "b"
+            return {
+                "results": [
+                    {
+                        "title": title,
+                        "content": "",
+                        "template_info": {},
+                        "last_modification_date": "2023-01-01T00:00:00Z",
+                    }
+                ],
+                "next": None,
+                "previous": None,
+                "count": 1,
+            }
+
+        mock_send_query.side_effect = _send
+
+        response = get_merged_results(request, query_id=1)
+        response_dict = json.loads(response.content)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response_dict["nb_results"], 2)
+        self.assertEqual(
+            mock_send_query.call_args.args[1]["order_by_field"], "title"
+        )
+
+    @patch("core_explore_common_app.settings.RESULTS_PER_PAGE", 1)
+    @patch("core_explore_common_app.components.query.api.get_by_id")
+    @patch("core_explore_common_app.utils.query.query.send")
+    def test_get_merged_results_with_several_pages_returns_first_page(
+        self,
+        mock_send_query,
+        mock_get_by_id,
+    ):
+        """test_get_merged_results_with_several_pages_returns_first_page
+
+        Returns:
+
+        """
+        request = self.factory.get("core_explore_common_merged_results")
+        request.user = self.user1
+
+        mock_query = MagicMock()
+        mock_query.content = {}
+        mock_query.templates.all.return_value = []
+        mock_query.data_sources = [
+            {
+                "name": f"remote_{index}",
+                "url_query": f"http://remote_{index}",
+                "query_options": {},
+                "order_by_field": "title",
+                "authentication": {"auth_type": "oauth2"},
+            }
+            for index in range(2)
+        ]
+        mock_get_by_id.return_value = mock_query
+
+        def _send(request, json_query, data_source, page, deadline=None):
+            return {
+                "results": [
+                    {
+                        "title": data_source["name"],
+                        "content": data_source["name"],
+                        "template_info": {},
+                        "last_modification_date": "2023-01-01T00:00:00Z",
+                    }
+                ],
+                "next": None,
+                "previous": None,
+                "count": 1,
+            }
+
+        mock_send_query.side_effect = _send
+
+        response = get_merged_results(request, query_id=1, page=1)
+        response_dict = json.loads(response.content)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response_dict["nb_results"], 2)
+        self.assertIn("remote_0", response_dict["results"])
+        self.assertNotIn("remote_1", response_dict["results"])
+
+    @patch("core_explore_common_app.components.query.api.get_by_id")
+    def test_get_merged_results_with_unknown_query_returns_400(
+        self, mock_get_by_id
+    ):
+        """test_get_merged_results_with_unknown_query_returns_400
+
+        Returns:
+
+        """
+        request = self.factory.get("core_explore_common_merged_results")
+        request.user = self.user1
+        mock_get_by_id.side_effect = DoesNotExist("error")
+
+        response = get_merged_results(request, query_id=1)
+
+        self.assertEqual(response.status_code, 400)
+
+
+class TestGetDataSourceResultsJson(SimpleTestCase):
+    """TestGetDataSourceResultsJson"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.factory = RequestFactory()
+        self.user1 = create_mock_user(user_id="1")
+        self.mock_query = MagicMock()
+        self.mock_query.content = {}
+        self.mock_query.templates.all.return_value = []
+        self.mock_query.data_sources = [
+            {
+                "name": "remote",
+                "url_query": "http://remote",
+                "query_options": {},
+                "order_by_field": "title",
+                "authentication": {"auth_type": "oauth2"},
+            }
+        ]
+
+    @patch("core_explore_common_app.components.query.api.get_by_id")
+    @patch("core_explore_common_app.utils.query.query.send")
+    def test_get_data_source_results_json_returns_result_page(
+        self, mock_send_query, mock_get_by_id
+    ):
+        """test_get_data_source_results_json_returns_result_page
+
+        Returns:
+
+        """
+        request = self.factory.get(
+            "core_explore_common_data_source_results_json"
+        )
+        request.user = self.user1
+        mock_get_by_id.return_value = self.mock_query
+        mock_send_query.return_value = {
+            "results": [{"title": "a"}],
+            "next": "http://remote/?page=3",
+            "previous": "http://remote/?page=1",
+            "count": 21,
+        }
+
+        response = get_data_source_results_json(
+            request, query_id=1, data_source_index=0, page=2
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            json.loads(response.content),
+            {
+                "count": 21,
+                "next": 3,
+                "previous": 1,
+                "results": [{"title": "a"}],
+            },
+        )
+
+    @patch("core_explore_common_app.components.query.api.get_by_id")
+    @patch("core_explore_common_app.utils.query.query.send")
+    def test_get_data_source_results_json_compresses_result_page(
+        self, mock_send_query, mock_get_by_id
+    ):
+        """test_get_data_source_results_json_compresses_result_page
+
+        Returns:
+
+        """
+        request = self.factory.get(
+            "core_explore_common_data_source_results_json",
+            HTTP_ACCEPT_ENCODING="gzip",
+        )
+        request.user = self.user1
+        mock_get_by_id.return_value = self.mock_query
+        mock_send_query.return_value = {
+            "results": [{"title": "a", "content": "<root/>" * 100}],
+            "next": None,
+            "previous": None,
+            "count": 1,
+        }
+
+        response = get_data_source_results_json(
+            request, query_id=1, data_source_index=0
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(
+            json.loads(gzip.decompress(response.content))["count"], 1
+        )
+
+    @patch("core_explore_common_app.components.query.api.get_by_id")
+    @patch("core_explore_common_app.utils.query.query.send_pass_through")
+    @patch("core_explore_common_app.utils.query.query.send")
+    def test_get_data_source_results_json_passes_through_trusted_source(
+        self, mock_send_query, mock_send_pass_through, mock_get_by_id
+    ):
+        """test_get_data_source_results_json_passes_through_trusted_source
+
+        Returns:
+
+        """
+        request = self.factory.get(
+            "core_explore_common_data_source_results_json",
+            HTTP_ACCEPT_ENCODING="gzip",
+        )
+        request.user = self.user1
+        mock_get_by_id.return_value = self.mock_query
+        mock_send_pass_through.return_value = iter(
+            [b'{"count": 0, ', b'"results": []}']
+        )
+
+        with patch(
+            "core_explore_common_app.settings.EXPLORE_PASS_THROUGH_DATA_SOURCES",
+            ["http://remote"],
+        ):
+            response = get_data_source_results_json(
+                request, query_id=1, data_source_index=0
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            b"".join(response.streaming_content),
+            b'{"count": 0, "results": []}',
+        )
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertFalse(mock_send_query.called)
+
+    @patch("core_explore_common_app.components.query.api.get_by_id")
+    def test_get_data_source_results_json_with_unknown_query_returns_400(
+        self, mock_get_by_id
+    ):
+        """test_get_data_source_results_json_with_unknown_query_returns_400
+
+        Returns:
+
+        """
+        request = self.factory.get(
+            "core_explore_common_data_source_results_json"
+        )
+        request.user = self.user1
+        mock_get_by_id.side_effect = DoesNotExist("error")
+
+        response = get_data_source_results_json(
+            request, query_id=1, data_source_index=0
+        )
+
+        self.assertEqual(response.status_code, 400)
+
 
 class TestGetDataSourceHTML(SimpleTestCase):
     """TestGetDataSourceHTML"""
@@ -671,8 +1279,13 @@ class TestFormatLocalResults(SimpleTestCase):
     )
     @patch("core_explore_common_app.utils.result.result.get_template_info")
     @patch("django.urls.reverse")
+    @patch("core_explore_common_app.utils.result.result.get_readable_blob_ids")
     def test_format_local_results_with_blob_url(
-        self, mock_reverse, mock_get_template_info, mock_auto_set_pid_enabled
+        self,
+        mock_get_readable_blob_ids,
+        mock_reverse,
+        mock_get_template_info,
+        mock_auto_set_pid_enabled,
     ):
         """test_format_local_results_with_blob_url
 
@@ -690,8 +1303,10 @@ class TestFormatLocalResults(SimpleTestCase):
         request = MagicMock()
         mock_get_template_info.return_value = MagicMock()
         mock_data = MagicMock()
+        mock_data.id = 1
         mock_data.template_id = None
         mock_data_list = [mock_data]
+        mock_get_readable_blob_ids.return_value = {1: 2}
 
         results = MagicMock()
         results.object_list = mock_data_list
@@ -700,15 +1315,20 @@ class TestFormatLocalResults(SimpleTestCase):
 
         data_list = format_local_results(results, request)
 
-        self.assertTrue("/blob" in data_list[0].blob_url)
+        self.assertEqual(data_list[0].blob_url, "/blob?id=2")
 
     @patch(
         "core_explore_common_app.utils.linked_records.pid.is_auto_set_pid_enabled"
     )
     @patch("core_explore_common_app.utils.result.result.get_template_info")
     @patch("django.urls.reverse")
+    @patch("core_explore_common_app.utils.result.result.get_readable_blob_ids")
     def test_format_local_results_without_blob_url(
-        self, mock_reverse, mock_get_template_info, mock_auto_set_pid_enabled
+        self,
+        mock_get_readable_blob_ids,
+        mock_reverse,
+        mock_get_template_info,
+        mock_auto_set_pid_enabled,
     ):
         """test_format_local_results_without_blob_url
 
@@ -737,16 +1357,22 @@ class TestFormatLocalResults(SimpleTestCase):
         data_list = format_local_results(results, request)
 
         self.assertIsNone(data_list[0].blob_url)
+        mock_get_readable_blob_ids.assert_not_called()
 
     @patch(
         "core_explore_common_app.utils.linked_records.pid.is_auto_set_pid_enabled"
     )
     @patch("core_explore_common_app.utils.result.result.get_template_info")
     @patch("django.urls.reverse")
-    def test_format_local_results_with_acl_error_when_getting_blob(
-        self, mock_reverse, mock_get_template_info, mock_auto_set_pid_enabled
+    @patch("core_explore_common_app.utils.result.result.get_readable_blob_ids")
+    def test_format_local_results_without_readable_blob(
+        self,
+        mock_get_readable_blob_ids,
+        mock_reverse,
+        mock_get_template_info,
+        mock_auto_set_pid_enabled,
     ):
-        """test_format_local_results_with_acl_error_when_getting_blob
+        """test_format_local_results_without_readable_blob
 
         Returns:
 
@@ -755,9 +1381,10 @@ class TestFormatLocalResults(SimpleTestCase):
         request = MagicMock()
         mock_get_template_info.return_value = MagicMock()
         mock_data = MagicMock()
-        mock_data.blob.side_effect = AccessControlError("error")
+        mock_data.id = 1
         mock_data.template_id = None
         mock_data_list = [mock_data]
+        mock_get_readable_blob_ids.return_value = dict()
 
         results = MagicMock()
         results.object_list = mock_data_list
@@ -768,6 +1395,142 @@ class TestFormatLocalResults(SimpleTestCase):
 
         self.assertIsNone(data_list[0].blob_url)
 
+    @patch(
+        "core_explore_common_app.utils.linked_records.pid.is_auto_set_pid_enabled"
+    )
+    @patch("core_explore_common_app.utils.result.result.get_template_info")
+    @patch("django.urls.reverse")
+    @patch("core_explore_common_app.utils.result.result.get_readable_blob_ids")
+    def test_format_local_results_in_summary_mode_does_not_read_content(
+        self,
+        mock_get_readable_blob_ids,
+        mock_reverse,
+        mock_get_template_info,
+        mock_auto_set_pid_enabled,
+    ):
+        """test_format_local_results_in_summary_mode_does_not_read_content
+
+        Returns:
+
+        """
+
+        def _side_effect_content_url(*args, **kwargs):
+            if args[0] == "core_explore_common_result_content":
+                return "/result-content"
+            return ""
+
+        mock_auto_set_pid_enabled.return_value = False
+        request = MagicMock()
+        mock_get_template_info.return_value = MagicMock()
+        mock_data = MagicMock()
+        mock_data.id = 1
+        mock_data.template_id = None
+        mock_file_size = PropertyMock(return_value=2048)
+        type(mock_data.file).size = mock_file_size
+        mock_content = PropertyMock(return_value="<root/>")
+        type(mock_data).content = mock_content
+
+        results = MagicMock()
+        results.object_list = [mock_data]
+
+        mock_reverse.side_effect = _side_effect_content_url
+
+        data_list = format_local_results(results, request, summary=True)
+
+        self.assertEqual(data_list[0].content, "")
+        self.assertEqual(data_list[0].content_url, "/result-content?id=1")
+        mock_content.assert_not_called()
+        mock_file_size.assert_not_called()
+
+
+class TestGetResultContent(SimpleTestCase):
+    """TestGetResultContent"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.factory = RequestFactory()
+        self.user1 = create_mock_user(user_id="1")
+
+    @patch("core_explore_common_app.utils.result.result.get_template_info")
+    @patch("core_main_app.components.data.api.get_by_id")
+    def test_get_result_content_returns_content(
+        self, mock_get_by_id, mock_get_template_info
+    ):
+        """test_get_result_content_returns_content
+
+        Returns:
+
+        """
+        request = self.factory.get(
+            "core_explore_common_result_content", {"id": 1}
+        )
+        request.user = self.user1
+        mock_data = MagicMock()
+        mock_data.title = "title"
+        mock_data.content = '{"value": 1}'
+        mock_get_by_id.return_value = mock_data
+        mock_get_template_info.return_value = {"format": "JSON"}
+
+        response = get_result_content(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('{"value": 1}', response.content.decode())
+
+    def test_get_result_content_without_id_returns_400(self):
+        """test_get_result_content_without_id_returns_400
+
+        Returns:
+
+        """
+        request = self.factory.get("core_explore_common_result_content")
+        request.user = self.user1
+
+        response = get_result_content(request)
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch("core_main_app.components.data.api.get_by_id")
+    def test_get_result_content_with_unknown_data_returns_400(
+        self, mock_get_by_id
+    ):
+        """test_get_result_content_with_unknown_data_returns_400
+
+        Returns:
+
+        """
+        request = self.factory.get(
+            "core_explore_common_result_content", {"id": 1}
+        )
+        request.user = self.user1
+        mock_get_by_id.side_effect = DoesNotExist("error")
+
+        response = get_result_content(request)
+
+        self.assertEqual(response.status_code, 400)
+
+    @patch("core_main_app.components.data.api.get_by_id")
+    def test_get_result_content_with_acl_error_returns_400(
+        self, mock_get_by_id
+    ):
+        """test_get_result_content_with_acl_error_returns_400
+
+        Returns:
+
+        """
+        request = self.factory.get(
+            "core_explore_common_result_content", {"id": 1}
+        )
+        request.user = self.user1
+        mock_get_by_id.side_effect = AccessControlError("error")
+
+        response = get_result_content(request)
+
+        self.assertEqual(response.status_code, 400)
+
 
 class TestRQRView(ResultQueryRedirectView):
     """TestRQRView"""